@@ -1,142 +1,3189 @@
-from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, abort, Response
-from flask_mail import Mail, Message
-from flask_wtf.csrf import CSRFProtect
+from flask import Flask, Request, before_render_template, template_rendered, has_request_context, render_template, request, redirect, url_for, flash, jsonify, abort, Response, session, g, make_response, send_from_directory
 from werkzeug.utils import secure_filename
-from dotenv import load_dotenv
+from werkzeug.http import is_resource_modified
+from werkzeug.exceptions import BadRequest
+from jinja2 import BytecodeCache, meta as jinja_meta
+from markupsafe import Markup, escape
+from collections import Counter, OrderedDict
+from functools import wraps
+from contextlib import contextmanager
+from dataclasses import dataclass
 import os
 import json
+import sys
+import atexit
+import base64
+import bisect
+import csv
+import gzip
+import hashlib
+import heapq
+import hmac
+import io
+import itertools
+import logging
+import logging.handlers
+import math
+import mimetypes
+import mmap
+import queue
+import smtplib
+import sqlite3
+import struct
 import tempfile
-from datetime import datetime
+import uuid
+import zlib
+from datetime import date, datetime, timezone
 import re
 import threading
 import time
+from xml.sax.saxutils import escape as xml_escape
 
-load_dotenv()
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Deployments set their environment directly, so python-dotenv is only imported for a local .env
+ENV_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env")
+if os.path.exists(ENV_FILE):
+    from dotenv import load_dotenv
+
+    load_dotenv(ENV_FILE)
 
 app = Flask(__name__, template_folder="app/templates", static_folder="app/static")
 
-# Configuration
-app.config["SECRET_KEY"] = os.environ.get("SECRET_KEY", "your-secret-key-change-in-production")
-csrf = CSRFProtect(app)
+# Configuration
+app.config["SECRET_KEY"] = os.environ.get("SECRET_KEY", "your-secret-key-change-in-production")
+
+
+class LazyCSRFProtect:
+    """Flask-WTF CSRF protection that imports Flask-WTF only once a request needs it
+
+    Flask-WTF pulls in WTForms and email_validator, which is most of the
+    import cost of this module and is never needed to serve a GET.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._extension = None
+        self._lock = threading.Lock()
+        # The defaults CSRFProtect.init_app would set
+        app.config.setdefault("WTF_CSRF_ENABLED", True)
+        app.config.setdefault("WTF_CSRF_CHECK_DEFAULT", True)
+        app.config["WTF_CSRF_METHODS"] = set(app.config.get("WTF_CSRF_METHODS", ["POST", "PUT", "PATCH", "DELETE"]))
+        app.config.setdefault("WTF_CSRF_FIELD_NAME", "csrf_token")
+        app.config.setdefault("WTF_CSRF_HEADERS", ["X-CSRFToken", "X-CSRF-Token"])
+        app.config.setdefault("WTF_CSRF_TIME_LIMIT", 3600)
+        app.config.setdefault("WTF_CSRF_SSL_STRICT", True)
+        app.jinja_env.globals["csrf_token"] = self.generate_csrf
+        app.before_request(self.csrf_protect)
+
+    @property
+    def extension(self):
+        if self._extension is None:
+            with self._lock:
+                if self._extension is None:
+                    from flask_wtf.csrf import CSRFProtect
+
+                    self._extension = CSRFProtect()
+        return self._extension
+
+    @staticmethod
+    def generate_csrf():
+        from flask_wtf.csrf import generate_csrf
+
+        return generate_csrf()
+
+    def csrf_protect(self):
+        config = self.app.config
+        if not config["WTF_CSRF_ENABLED"] or not config["WTF_CSRF_CHECK_DEFAULT"]:
+            return
+        if request.method not in config["WTF_CSRF_METHODS"] or not request.endpoint:
+            return
+        self.extension.protect()
+
+
+# Use writable temp directory for uploads (Vercel-compatible); StreamingUpload creates it on first use
+upload_dir = os.path.join(tempfile.gettempdir(), "uploads")
+app.config["UPLOAD_FOLDER"] = upload_dir
+app.config["MAX_CONTENT_LENGTH"] = 16 * 1024 * 1024  # 16MB max file size
+
+# Email configuration
+app.config["MAIL_SERVER"] = os.environ.get("MAIL_SERVER", "smtp.gmail.com")
+app.config["MAIL_PORT"] = int(os.environ.get("MAIL_PORT", 587))
+
+def env_bool(key, default=False):
+    value = os.environ.get(key)
+    if value is None:
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+app.config["MAIL_USE_TLS"] = env_bool("MAIL_USE_TLS", True)
+app.config["MAIL_USERNAME"] = os.environ.get("MAIL_USERNAME")
+app.config["MAIL_PASSWORD"] = os.environ.get("MAIL_PASSWORD")
+app.config["MAIL_DEFAULT_SENDER"] = os.environ.get("MAIL_DEFAULT_SENDER")
+
+
+class LazyMail:
+    """Flask-Mail, imported and initialised the first time anything sends or builds a message"""
+
+    def __init__(self, app):
+        self.app = app
+        self._mail = None
+        self._lock = threading.Lock()
+
+    @property
+    def extension(self):
+        if self._mail is None:
+            with self._lock:
+                if self._mail is None:
+                    from flask_mail import Mail
+
+                    self._mail = Mail(self.app)
+        return self._mail
+
+    def __getattr__(self, name):
+        return getattr(self.extension, name)
+
+
+mail = LazyMail(app)
+
+
+def mail_message(**kwargs):
+    """Build a flask_mail.Message (it reads the default sender from the initialised extension)"""
+    mail.extension
+    from flask_mail import Message
+
+    return Message(**kwargs)
+
+if env_bool("DISABLE_STATIC_CACHE", False):
+    app.config["SEND_FILE_MAX_AGE_DEFAULT"] = 0
+
+    @app.after_request
+    def add_no_cache_headers(response):
+        # Fingerprinted build output can never be stale, so it keeps its immutable headers
+        if request.path.startswith("/static/") and not request.path.startswith("/static/dist/"):
+            response.headers["Cache-Control"] = "no-store, max-age=0"
+            response.headers["Pragma"] = "no-cache"
+            response.headers["Expires"] = "0"
+            response.headers.pop("ETag", None)
+            response.headers.pop("Last-Modified", None)
+        return response
+
+class MmapValues:
+    """Named float values in a memory-mapped file owned by one process
+
+    The file starts with the number of bytes in use, followed by entries of
+    ``[int32 key length][utf-8 key, padded to 8 bytes][float64 value]``.
+    Values are updated in place; new keys are appended and only then
+    counted in the header, so a reader in another process always sees
+    complete entries.
+    """
+
+    def __init__(self, path, initial_size=1 << 16):
+        self._lock = threading.Lock()
+        self._file = open(path, "a+b")
+        self._size = max(os.fstat(self._file.fileno()).st_size, initial_size)
+        self._file.truncate(self._size)
+        self._mmap = mmap.mmap(self._file.fileno(), self._size)
+        self._used = struct.unpack_from("i", self._mmap, 0)[0]
+        if self._used == 0:
+            self._used = 8
+            struct.pack_into("i", self._mmap, 0, self._used)
+        self._positions = {key: pos for key, _, pos in self._entries(self._mmap, self._used)}
+
+    @staticmethod
+    def _entries(data, used):
+        pos = 8
+        while pos < used:
+            length = struct.unpack_from("i", data, pos)[0]
+            key = bytes(data[pos + 4:pos + 4 + length]).decode("utf-8")
+            pos += (4 + length + 7) // 8 * 8
+            yield key, struct.unpack_from("d", data, pos)[0], pos
+            pos += 8
+
+    @classmethod
+    def read(cls, path):
+        """Yield ``(key, value)`` pairs from a file that may be written to concurrently"""
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < 8:
+            return
+        for key, value, _ in cls._entries(data, struct.unpack_from("i", data, 0)[0]):
+            yield key, value
+
+    def _append(self, key):
+        encoded = key.encode("utf-8")
+        padded = (4 + len(encoded) + 7) // 8 * 8
+        while self._used + padded + 8 > self._size:
+            self._size *= 2
+            self._file.truncate(self._size)
+            self._mmap.close()
+            self._mmap = mmap.mmap(self._file.fileno(), self._size)
+        struct.pack_into(f"i{len(encoded)}s", self._mmap, self._used, len(encoded), encoded)
+        pos = self._used + padded
+        struct.pack_into("d", self._mmap, pos, 0.0)
+        self._used = pos + 8
+        struct.pack_into("i", self._mmap, 0, self._used)
+        self._positions[key] = pos
+        return pos
+
+    def add(self, key, amount):
+        with self._lock:
+            pos = self._positions.get(key)
+            if pos is None:
+                pos = self._append(key)
+            struct.pack_into("d", self._mmap, pos, struct.unpack_from("d", self._mmap, pos)[0] + amount)
+
+    def set(self, key, value):
+        with self._lock:
+            pos = self._positions.get(key)
+            if pos is None:
+                pos = self._append(key)
+            struct.pack_into("d", self._mmap, pos, value)
+
+
+class Metrics:
+    """Counters, gauges and histograms shared by every worker process
+
+    Each process (gunicorn worker) writes to its own MmapValues file in
+    ``directory``; render() sums the files of all processes, so /metrics
+    reports the same totals whichever worker answers it. Gauges are summed
+    too, but only over processes that are still running.
+    """
+
+    def __init__(self, directory, definitions, enabled=True):
+        self.directory = directory
+        self.definitions = definitions
+        self.enabled = enabled
+        self._pid = None
+        self._values = None
+        self._lock = threading.Lock()
+        self._warned = False
+
+    def _unavailable(self, error):
+        # Once per process: a full log queue counts its drops here, so this must not log on every call
+        if not self._warned:
+            self._warned = True
+            log_event("metrics.unavailable", logging.WARNING, error=str(error))
+
+    def _store(self):
+        # Forked workers must not share the parent's file
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    os.makedirs(self.directory, exist_ok=True)
+                    self._values = MmapValues(os.path.join(self.directory, f"{os.getpid()}.db"))
+                    self._pid = os.getpid()
+        return self._values
+
+    @staticmethod
+    def _key(sample, labels):
+        return json.dumps([sample, sorted(labels.items())])
+
+    def inc(self, name, amount=1.0, **labels):
+        if not self.enabled:
+            return
+        try:
+            self._store().add(self._key(name, labels), amount)
+        except OSError as e:
+            self._unavailable(e)
+
+    def set(self, name, value, **labels):
+        if not self.enabled:
+            return
+        try:
+            self._store().set(self._key(name, labels), value)
+        except OSError as e:
+            self._unavailable(e)
+
+    @staticmethod
+    def _alive(pid):
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except (OSError, ValueError):
+            pass
+        return True
+
+    def observe(self, name, seconds, **labels):
+        buckets = self.definitions[name][2]
+        bucket = next((str(b) for b in buckets if seconds <= b), "+Inf")
+        self.inc(f"{name}_bucket", le=bucket, **labels)
+        self.inc(f"{name}_sum", seconds, **labels)
+        self.inc(f"{name}_count", **labels)
+
+    @contextmanager
+    def time(self, phase):
+        """Record how long the block takes under app_phase_duration_seconds{phase=...}"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe("app_phase_duration_seconds", time.perf_counter() - started, phase=phase)
+
+    def collect(self):
+        """Sum every process's values into ``{(sample, labels): value}``"""
+        totals = {}
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return totals
+        for name in names:
+            if not name.endswith(".db"):
+                continue
+            # A dead process's gauges describe state that no longer exists
+            alive = not name[:-3].isdigit() or self._alive(int(name[:-3]))
+            try:
+                for key, value in MmapValues.read(os.path.join(self.directory, name)):
+                    sample, labels = json.loads(key)
+                    if not alive and self.definitions.get(sample, ("",))[0] == "gauge":
+                        continue
+                    key = (sample, tuple(tuple(pair) for pair in labels))
+                    totals[key] = totals.get(key, 0.0) + value
+            except (OSError, ValueError, struct.error) as e:
+                log_event("metrics.file_unreadable", logging.WARNING, file=name, error=str(e))
+        return totals
+
+    @staticmethod
+    def _format(sample, labels, value):
+        label_text = ",".join(
+            '{}="{}"'.format(k, str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+            for k, v in labels
+        )
+        return f"{sample}{{{label_text}}} {value!r}" if label_text else f"{sample} {value!r}"
+
+    def render(self):
+        """All metrics in the Prometheus text exposition format"""
+        totals = self.collect()
+        lines = []
+        for name, (kind, help_text, buckets) in self.definitions.items():
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+            if kind in ("counter", "gauge"):
+                for (sample, labels), value in sorted(totals.items()):
+                    if sample == name:
+                        lines.append(self._format(name, labels, value))
+                continue
+
+            series = sorted({labels for (sample, labels) in totals if sample == f"{name}_count"})
+            for labels in series:
+                cumulative = 0.0
+                for bound in [str(b) for b in buckets] + ["+Inf"]:
+                    cumulative += totals.get((f"{name}_bucket", tuple(sorted(labels + (("le", bound),)))), 0.0)
+                    lines.append(self._format(f"{name}_bucket", labels + (("le", bound),), cumulative))
+                lines.append(self._format(f"{name}_sum", labels, totals.get((f"{name}_sum", labels), 0.0)))
+                lines.append(self._format(f"{name}_count", labels, totals.get((f"{name}_count", labels), 0.0)))
+        return "\n".join(lines) + "\n"
+
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+metrics = Metrics(
+    os.environ.get("METRICS_DIR", os.path.join(tempfile.gettempdir(), "ardur_metrics")),
+    {
+        "http_requests_total": ("counter", "HTTP responses by endpoint, method and status code.", None),
+        "http_request_duration_seconds": ("histogram", "Time from request start to response, by endpoint.", LATENCY_BUCKETS),
+        "app_phase_duration_seconds": (
+            "histogram",
+            "Time spent in internal phases: data_load, template_render, mail_send, file_save, submission_save.",
+            LATENCY_BUCKETS,
+        ),
+        "log_records_dropped_total": ("counter", "Log records discarded because the log queue was full.", None),
+        "rate_limited_total": ("counter", "Requests rejected with 429 by the rate limiter, by endpoint.", None),
+        "job_scheduler_depth": ("gauge", "Delayed jobs waiting in the scheduler heap.", None),
+        "job_scheduler_overdue": ("gauge", "Scheduler jobs already past their due time.", None),
+        "job_scheduler_runs_total": ("counter", "Scheduled jobs run, by job name and outcome.", None),
+        "job_scheduler_lateness_seconds": (
+            "histogram",
+            "How long after its due time each scheduled job started.",
+            (0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 15.0, 60.0, 300.0),
+        ),
+    },
+    enabled=env_bool("METRICS_ENABLED", True),
+)
+app.config["METRICS_TOKEN"] = os.environ.get("METRICS_TOKEN")
+
+
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+
+
+@app.after_request
+def record_request_metrics(response):
+    started = g.pop("request_started", None)
+    if started is None:
+        return response
+    # Unmatched paths share one label so scanners can't blow up the series count
+    endpoint = request.endpoint or "unmatched"
+    metrics.observe("http_request_duration_seconds", time.perf_counter() - started, endpoint=endpoint)
+    metrics.inc("http_requests_total", endpoint=endpoint, method=request.method, status=str(response.status_code))
+    return response
+
+
+@before_render_template.connect_via(app)
+def start_render_timer(sender, template, context, **extra):
+    g.setdefault("render_started", []).append(time.perf_counter())
+
+
+@template_rendered.connect_via(app)
+def record_render_time(sender, template, context, **extra):
+    stack = g.get("render_started")
+    if stack:
+        metrics.observe("app_phase_duration_seconds", time.perf_counter() - stack.pop(), phase="template_render")
+
+
+# Structured logging: request threads only build a LogRecord and put it on a
+# bounded queue; formatting, redaction and the actual write happen on the
+# QueueListener thread, so a slow log sink never holds up a request.
+REQUEST_ID_RE = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
+LOG_REDACT_FIELDS = {
+    field.strip().lower() for field in os.environ.get("LOG_REDACT_FIELDS", "email,phone,message").split(",") if field.strip()
+}
+
+
+def redact(value, fields=LOG_REDACT_FIELDS):
+    """Copy of a log payload with the configured keys masked, at any depth"""
+    if isinstance(value, dict):
+        return {
+            k: "[redacted]" if str(k).lower() in fields and v not in (None, "") else redact(v, fields)
+            for k, v in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [redact(v, fields) for v in value]
+    return value
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: time, level, logger, event, request id and the redacted event fields"""
+
+    def format(self, record):
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname.lower(),
+            "logger": record.name,
+            "event": record.getMessage(),
+        }
+        request_id = getattr(record, "request_id", None)
+        if request_id:
+            entry["request_id"] = request_id
+        entry.update(redact(getattr(record, "fields", None) or {}))
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class RequestLogFilter(logging.Filter):
+    """Tag records with the current request id and keep only a sample of DEBUG records
+
+    Sampling is keyed on the request id, so a sampled request keeps all of
+    its debug lines and an unsampled one drops them all.
+    """
+
+    def __init__(self, debug_sample_rate=1.0):
+        super().__init__()
+        self.threshold = int(max(0.0, min(1.0, debug_sample_rate)) * 10000)
+
+    def filter(self, record):
+        request_id = current_request_id() if has_request_context() else None
+        record.request_id = request_id
+        if record.levelno > logging.DEBUG or self.threshold >= 10000:
+            return True
+        key = request_id or f"{record.thread}:{record.created}"
+        return zlib.crc32(key.encode("utf-8")) % 10000 < self.threshold
+
+
+class LogQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that never blocks and leaves formatting to the listener thread"""
+
+    def prepare(self, record):
+        # Tracebacks reference live frames, so render them before the record leaves this thread
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            metrics.inc("log_records_dropped_total")
+
+
+def configure_logging():
+    """Route the ``ardur`` logger through a bounded queue to a JSON stdout handler"""
+    logger = logging.getLogger("ardur")
+    if any(isinstance(handler, LogQueueHandler) for handler in logger.handlers):
+        return logger
+    logger.setLevel(os.environ.get("LOG_LEVEL", "INFO").upper())
+    logger.propagate = False
+
+    sink = logging.StreamHandler(sys.stdout)
+    sink.setFormatter(JsonFormatter())
+    handler = LogQueueHandler(queue.Queue(maxsize=int(os.environ.get("LOG_QUEUE_SIZE", "10000"))))
+    handler.addFilter(RequestLogFilter(float(os.environ.get("LOG_DEBUG_SAMPLE_RATE", "0.1"))))
+    logger.addHandler(handler)
+
+    listener = logging.handlers.QueueListener(handler.queue, sink, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return logger
+
+
+log = configure_logging()
+
+
+def log_event(event, level=logging.INFO, **fields):
+    """Log a structured event; keys listed in LOG_REDACT_FIELDS are masked when it is written"""
+    log.log(level, event, extra={"fields": fields})
+
+
+def current_request_id():
+    """Id of the current request, taken from X-Request-ID when the client sent a sane one"""
+    if "request_id" not in g:
+        incoming = request.headers.get("X-Request-ID", "")
+        g.request_id = incoming if REQUEST_ID_RE.match(incoming) else uuid.uuid4().hex
+    return g.request_id
+
+
+@app.after_request
+def add_request_id_header(response):
+    # Assigned lazily: CSRFProtect's before_request can reject a request before ours would run
+    response.headers["X-Request-ID"] = current_request_id()
+    return response
+
+
+# ==========================================================================
+# Rate limiting
+# ==========================================================================
+RATE_LIMIT_RE = re.compile(r"^\s*(\d+)\s*(?:/|per)\s*(\d*)\s*(second|minute|hour|day|s|m|h|d)s?\s*$", re.I)
+RATE_LIMIT_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_rate_limits(spec):
+    """Parse ``"5/minute; 20/hour"`` (or ``"10 per 30s"``) into ``[(limit, period_seconds), ...]``"""
+    limits = []
+    for part in filter(None, (p.strip() for p in (spec or "").split(";"))):
+        match = RATE_LIMIT_RE.match(part)
+        if not match:
+            raise ValueError(f"Invalid rate limit: {part!r}")
+        count, multiple, unit = match.groups()
+        limits.append((int(count), int(multiple or 1) * RATE_LIMIT_UNITS[unit[0].lower()]))
+    return limits
+
+
+class SQLiteRateLimitStore:
+    """Expiring counters in a SQLite file shared by every worker process
+
+    Implements the part of the Redis API that RateLimiter uses (``incr``,
+    ``expire`` and ``get``), so a ``redis.Redis`` client can be swapped in.
+    The file holds nothing worth keeping, so it skips fsync and by default
+    lives on /dev/shm where that exists.
+    """
+
+    PURGE_EVERY = 1000
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._writes = itertools.count(1)
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=OFF")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS counters (key TEXT PRIMARY KEY, value INTEGER NOT NULL, expires REAL) WITHOUT ROWID"
+            )
+            self._local.conn = conn
+        return conn
+
+    def incr(self, name, amount=1):
+        now = time.time()
+        conn = self._connect()
+        if next(self._writes) % self.PURGE_EVERY == 0:
+            conn.execute("DELETE FROM counters WHERE expires <= ?", (now,))
+        # An expired counter starts again from zero, as if Redis had evicted it
+        row = conn.execute(
+            """
+            INSERT INTO counters (key, value, expires) VALUES (:key, :amount, NULL)
+            ON CONFLICT(key) DO UPDATE SET
+                value = CASE WHEN expires <= :now THEN excluded.value ELSE value + excluded.value END,
+                expires = CASE WHEN expires <= :now THEN NULL ELSE expires END
+            RETURNING value
+            """,
+            {"key": name, "amount": amount, "now": now},
+        ).fetchone()
+        return row[0]
+
+    def expire(self, name, time_seconds):
+        self._connect().execute("UPDATE counters SET expires = ? WHERE key = ?", (time.time() + time_seconds, name))
+        return True
+
+    def get(self, name):
+        row = self._connect().execute(
+            "SELECT value FROM counters WHERE key = ? AND (expires IS NULL OR expires > ?)", (name, time.time())
+        ).fetchone()
+        return None if row is None else row[0]
+
+
+def rate_limit_store(url):
+    """Store for RATELIMIT_STORAGE_URL: ``sqlite:///<path>`` or any ``redis://`` / ``rediss://`` URL"""
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        import redis
+
+        return redis.Redis.from_url(url, socket_timeout=0.25)
+    if url.startswith("sqlite:///"):
+        return SQLiteRateLimitStore(url[len("sqlite:///"):])
+    raise ValueError(f"Unsupported RATELIMIT_STORAGE_URL: {url}")
+
+
+class RateLimiter:
+    """Sliding-window request limits per client and endpoint, counted in a shared store
+
+    Each limit keeps one counter per fixed window and weights the previous
+    window's count by how much of it still overlaps the sliding window, so
+    a burst straddling a window boundary is still caught. That costs two
+    counters per limit instead of a timestamp per request.
+    """
+
+    def __init__(self, store, limits, key_prefix="ratelimit"):
+        self.store = store
+        self.limits = {endpoint: parse_rate_limits(spec) for endpoint, spec in limits.items()}
+        self.key_prefix = key_prefix
+
+    def hit(self, endpoint, client):
+        """Count one request; returns the seconds to wait if it is over a limit, else None"""
+        retry_after = None
+        now = time.time()
+        for limit, period in self.limits.get(endpoint, ()):
+            window, elapsed = divmod(now, period)
+            key = f"{self.key_prefix}:{endpoint}:{client}:{period}"
+            current = int(self.store.incr(f"{key}:{int(window)}"))
+            if current == 1:
+                # Kept for a second period, while it is the previous window
+                self.store.expire(f"{key}:{int(window)}", 2 * period)
+            previous = int(self.store.get(f"{key}:{int(window) - 1}") or 0)
+            remaining_share = (period - elapsed) / period
+            if previous * remaining_share + current <= limit:
+                continue
+            if current > limit or previous == 0:
+                wait = period - elapsed
+            else:
+                # Until enough of the previous window has slid out
+                wait = period - elapsed - (limit - current) * period / previous
+            retry_after = max(retry_after or 0, math.ceil(max(wait, 1)))
+        return retry_after
+
+
+def client_address():
+    """Client IP, read from X-Forwarded-For when RATELIMIT_PROXY_COUNT proxies sit in front of the app"""
+    hops = app.config["RATELIMIT_PROXY_COUNT"]
+    if hops:
+        forwarded = [part.strip() for part in request.headers.get("X-Forwarded-For", "").split(",") if part.strip()]
+        if len(forwarded) >= hops:
+            return forwarded[-hops]
+    return request.remote_addr or "unknown"
+
+
+app.config["RATELIMIT_ENABLED"] = env_bool("RATELIMIT_ENABLED", True)
+app.config["RATELIMIT_PROXY_COUNT"] = int(os.environ.get("RATELIMIT_PROXY_COUNT", "0"))
+app.config["RATE_LIMITS"] = {
+    "contact_form": os.environ.get("RATELIMIT_CONTACT", "5/minute; 20/hour"),
+    "apply_job": os.environ.get("RATELIMIT_APPLY", "3/minute; 10/hour"),
+}
+rate_limiter = RateLimiter(
+    rate_limit_store(
+        os.environ.get("RATELIMIT_STORAGE_URL")
+        or "sqlite:///"
+        + os.path.join("/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir(), "ardur_ratelimit.db")
+    ),
+    app.config["RATE_LIMITS"],
+)
+
+
+@app.before_request
+def enforce_rate_limits():
+    """Reject over-limit requests before their body is parsed or any form, file or mail work starts"""
+    if not app.config["RATELIMIT_ENABLED"] or request.endpoint not in rate_limiter.limits:
+        return None
+    try:
+        retry_after = rate_limiter.hit(request.endpoint, client_address())
+    except Exception as e:
+        # A broken store must not take the forms down with it
+        log_event("ratelimit.store_failed", logging.WARNING, error=str(e))
+        return None
+    if retry_after is None:
+        return None
+    metrics.inc("rate_limited_total", endpoint=request.endpoint)
+    log_event("ratelimit.rejected", endpoint=request.endpoint, retry_after=retry_after)
+    return Response(
+        "Too many requests. Please try again later.\n",
+        status=429,
+        mimetype="text/plain",
+        headers={"Retry-After": str(retry_after)},
+    )
+
+
+# Registered after the rate limiter, since checking the token parses the request body
+csrf = LazyCSRFProtect(app)
+
+
+# Allowed file extensions for resume uploads
+ALLOWED_EXTENSIONS = {"pdf", "doc", "docx"}
+
+
+def allowed_file(filename):
+    return "." in filename and filename.rsplit(".", 1)[1].lower() in ALLOWED_EXTENSIONS
+
+
+# Leading bytes each resume format must start with
+RESUME_SIGNATURES = {
+    "pdf": b"%PDF-",
+    "doc": b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1",  # OLE2 compound document
+    "docx": b"PK\x03\x04",  # Office Open XML (zip)
+}
+# Kept below MAX_CONTENT_LENGTH so oversized resumes are stopped mid-stream rather than by Werkzeug's 413
+app.config["RESUME_MAX_BYTES"] = int(os.environ.get("RESUME_MAX_BYTES", 5 * 1024 * 1024))
+
+
+class UploadRejected(BadRequest):
+    """An upload failed validation while it was being streamed"""
+
+
+class StreamingUpload:
+    """Write-through sink for one uploaded resume
+
+    Werkzeug hands each multipart chunk to write(), which checks the size
+    limit and the file signature, feeds a SHA-256 and writes straight to a
+    ``.part`` file in the upload folder. finish() moves the file to its
+    content-addressed name, so identical resumes are stored once.
+    """
+
+    def __init__(self, directory, filename, max_bytes):
+        self.directory = directory
+        self.filename = secure_filename(filename)
+        self.max_bytes = max_bytes
+        self.extension = self.filename.rsplit(".", 1)[1].lower() if "." in self.filename else ""
+        if self.extension not in ALLOWED_EXTENSIONS:
+            raise UploadRejected("Please upload your resume as a PDF, DOC or DOCX file.")
+        self.signature = RESUME_SIGNATURES[self.extension]
+        self.size = 0
+        self.sha256 = None
+        self.saved_name = None
+        self._head = b""
+        self._hash = hashlib.sha256()
+        # Time spent hashing and writing, reported as the file_save phase once the upload is finished
+        self._save_seconds = 0.0
+        os.makedirs(directory, exist_ok=True)
+        fd, self.part_path = tempfile.mkstemp(dir=directory, suffix=".part")
+        self._file = os.fdopen(fd, "w+b")
+
+    def write(self, chunk):
+        self.size += len(chunk)
+        if self.size > self.max_bytes:
+            self._discard()
+            limit = f"{self.max_bytes // (1024 * 1024)}MB" if self.max_bytes >= 1024 * 1024 else f"{self.max_bytes // 1024}KB"
+            raise UploadRejected(f"Resume is too large. Please upload a file smaller than {limit}.")
+        if len(self._head) < len(self.signature):
+            self._head += chunk[: len(self.signature) - len(self._head)]
+            if len(self._head) == len(self.signature):
+                self._check_signature()
+        started = time.perf_counter()
+        self._hash.update(chunk)
+        self._file.write(chunk)
+        self._save_seconds += time.perf_counter() - started
+        return len(chunk)
+
+    def _check_signature(self):
+        if self._head != self.signature:
+            self._discard()
+            raise UploadRejected(f"The uploaded file does not look like a valid {self.extension.upper()} document.")
+
+    def _discard(self):
+        if not self._file.closed:
+            self._file.close()
+        try:
+            os.remove(self.part_path)
+        except FileNotFoundError:
+            pass
+
+    def finish(self):
+        """Validate the complete upload and move it into place; returns the stored file name"""
+        if self.saved_name is not None:
+            return self.saved_name
+        self._check_signature()
+        started = time.perf_counter()
+        self._file.close()
+        self.sha256 = self._hash.hexdigest()
+        self.saved_name = f"{self.sha256}.{self.extension}"
+        final_path = os.path.join(self.directory, self.saved_name)
+        if os.path.exists(final_path):
+            os.remove(self.part_path)
+        else:
+            os.replace(self.part_path, final_path)
+        metrics.observe("app_phase_duration_seconds", self._save_seconds + time.perf_counter() - started, phase="file_save")
+        return self.saved_name
+
+    # Werkzeug rewinds the stream once the part is complete and closes it at request teardown
+    def seek(self, *args):
+        return 0 if self._file.closed else self._file.seek(*args)
+
+    def read(self, *args):
+        return b"" if self._file.closed else self._file.read(*args)
+
+    def readline(self, *args):
+        return b"" if self._file.closed else self._file.readline(*args)
+
+    def close(self):
+        if self.saved_name is None:
+            self._discard()
+
+
+class UploadRequest(Request):
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        if filename and self.endpoint == "apply_job":
+            return StreamingUpload(app.config["UPLOAD_FOLDER"], filename, app.config["RESUME_MAX_BYTES"])
+        return super()._get_file_stream(total_content_length, content_type, filename, content_length)
+
+
+app.request_class = UploadRequest
+
+
+def validate_email(email):
+    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+    return re.match(pattern, email) is not None
+
+
+class ContentStore:
+    """In-memory cache of the JSON files in app/data, reloaded when a file changes on disk
+
+    Files with a parser in ``models`` are also validated into typed records
+    as they load; a file that fails validation is rejected like one that is
+    not valid JSON.
+    """
+
+    def __init__(self, data_dir, check_interval=1.0, models=None):
+        self.data_dir = data_dir
+        self.check_interval = check_interval
+        self.models = models or {}
+        # name -> (stamp, checked_at, data, records); entries are replaced whole so readers never see a half-loaded file
+        self._entries = {}
+        self._locks = {}
+        self._locks_guard = threading.Lock()
+        self._local = threading.local()
+
+    @contextmanager
+    def recording(self):
+        """Collect the names of the data files this thread reads inside the block"""
+        names = set()
+        self._local.names = names
+        try:
+            yield names
+        finally:
+            self._local.names = None
+
+    def _path(self, name):
+        return os.path.join(self.data_dir, f"{name}.json")
+
+    def _lock_for(self, name):
+        with self._locks_guard:
+            return self._locks.setdefault(name, threading.Lock())
+
+    @staticmethod
+    def _stat(path):
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
+
+    def _entry(self, name):
+        names = getattr(self._local, "names", None)
+        if names is not None:
+            names.add(name)
+        entry = self._entries.get(name)
+        now = time.monotonic()
+        if entry is not None and now - entry[1] < self.check_interval:
+            return entry
+
+        path = self._path(name)
+        with self._lock_for(name):
+            entry = self._entries.get(name)
+            try:
+                stamp = self._stat(path)
+            except FileNotFoundError:
+                self._entries.pop(name, None)
+                return None
+
+            if entry is not None and entry[0] == stamp:
+                entry = (stamp, now, entry[2], entry[3])
+            else:
+                try:
+                    with metrics.time("data_load"), open(path, "r") as f:
+                        data = json.load(f)
+                    parse = self.models.get(name)
+                    records = parse(data, f"{name}.json") if parse else None
+                except (OSError, json.JSONDecodeError, ContentError) as e:
+                    if entry is None:
+                        raise
+                    # Keep serving the last good copy while the file is being rewritten
+                    log_event("content.reload_failed", logging.WARNING, path=path, error=str(e))
+                    return entry
+                entry = (stamp, now, data, records)
+            self._entries[name] = entry
+            return entry
+
+    def get(self, name, default=None):
+        """Return the parsed contents of app/data/<name>.json"""
+        entry = self._entry(name)
+        return default if entry is None else entry[2]
+
+    def get_item(self, name, key, default=None):
+        """Return a single top-level record (e.g. one slug) from a data file"""
+        data = self.get(name)
+        if not isinstance(data, dict):
+            return default
+        return data.get(key, default)
+
+    def records(self, name, default=None):
+        """Return the typed records parsed from app/data/<name>.json by its model"""
+        entry = self._entry(name)
+        return default if entry is None else entry[3]
+
+    def record(self, name, key, default=None):
+        """Return one typed record (e.g. one slug) from a data file"""
+        records = self.records(name)
+        if not isinstance(records, dict):
+            return default
+        return records.get(key, default)
+
+    def version(self, name):
+        """Return the (mtime_ns, size) stamp of the loaded file, or None if it is missing"""
+        entry = self._entry(name)
+        return None if entry is None else entry[0]
+
+    def path(self, name):
+        return self._path(name)
+
+
+# ==========================================================================
+# Content model
+# ==========================================================================
+class ContentError(ValueError):
+    """A data file whose records do not match the content model"""
+
+
+_REQUIRED = object()
+
+
+def content_value(record, key, kind, where, default=_REQUIRED):
+    """``record[key]`` checked to be a ``kind``; a missing key takes ``default`` or is an error"""
+    if not isinstance(record, dict):
+        raise ContentError(f"{where}: expected an object, not {type(record).__name__}")
+    value = record.get(key)
+    if value is None:
+        if default is _REQUIRED:
+            raise ContentError(f"{where}: '{key}' is required")
+        return default
+    if not isinstance(value, kind) or (kind is int and isinstance(value, bool)):
+        raise ContentError(f"{where}: '{key}' should be {kind.__name__}, not {type(value).__name__}")
+    return value
+
+
+def content_list(record, key, where, parse=None):
+    """``record[key]`` as a tuple of strings, or of ``parse(item, where)`` results"""
+    items = content_value(record, key, list, where, default=[])
+    if parse is not None:
+        return tuple(parse(item, f"{where}.{key}[{i}]") for i, item in enumerate(items))
+    for i, item in enumerate(items):
+        if not isinstance(item, str):
+            raise ContentError(f"{where}.{key}[{i}]: should be str, not {type(item).__name__}")
+    return tuple(items)
+
+
+def content_records(data, where, parse):
+    """Parse a data file keyed by slug into ``{slug: record}``"""
+    if not isinstance(data, dict):
+        raise ContentError(f"{where}: expected an object keyed by slug, not {type(data).__name__}")
+    return {key: parse(key, record, f"{where}: {key}") for key, record in data.items()}
+
+
+@dataclass(frozen=True, slots=True)
+class TitledText:
+    title: str
+    description: str
+
+
+def parse_titled_text(item, where):
+    return TitledText(content_value(item, "title", str, where), content_value(item, "description", str, where, ""))
+
+
+@dataclass(frozen=True, slots=True)
+class Result:
+    metric: str
+    description: str
+
+
+def parse_result(item, where):
+    return Result(content_value(item, "metric", str, where), content_value(item, "description", str, where, ""))
+
+
+@dataclass(frozen=True, slots=True)
+class Faq:
+    question: str
+    answer: str
+
+
+def parse_faq(item, where):
+    return Faq(content_value(item, "question", str, where), content_value(item, "answer", str, where))
+
+
+# Blog posts
+BLOG_WORDS_PER_MINUTE = 200
+BLOG_EXCERPT_LENGTH = 200
+BLOG_TEXT_BLOCKS = {
+    "paragraph": '<p style="margin-bottom: 1.5rem;">{}</p>',
+    "heading": '<h2 style="font-size: 1.5rem; font-weight: 700; color: var(--gray-900); margin: 2.5rem 0 1.5rem 0;">{}</h2>',
+    "subheading": '<h3 style="font-size: 1.25rem; font-weight: 600; color: var(--gray-900); margin: 2rem 0 1rem 0;">{}</h3>',
+    "callout": (
+        '<div style="background: var(--primary-50); border-left: 4px solid var(--primary-500); padding: 1.5rem; margin: 2rem 0; border-radius: 0 var(--radius-md) var(--radius-md) 0;">'
+        '<p style="font-style: italic; color: var(--primary-800); margin: 0; font-weight: 500;">{}</p></div>'
+    ),
+}
+BLOG_LIST_BLOCK = ('<ul style="margin: 1.5rem 0; padding-left: 2rem; list-style: disc;">', '<li style="margin-bottom: 0.75rem;">{}</li>', "</ul>")
+
+
+@dataclass(frozen=True, slots=True)
+class BlogPost:
+    slug: str
+    title: str
+    author: str
+    category: str
+    published: date
+    date_label: str
+    excerpt: str
+    featured_image: str
+    reading_time: int
+    tags: tuple
+    # The body, rendered to HTML once when the file loads
+    content_html: Markup
+
+
+def render_blog_blocks(blocks, where):
+    """Render a post's content blocks to HTML, returning it with each block's (type, text)"""
+    html, text = [], []
+    for i, block in enumerate(blocks):
+        block_where = f"{where}.content[{i}]"
+        kind = content_value(block, "type", str, block_where)
+        if kind in BLOG_TEXT_BLOCKS:
+            value = content_value(block, "text", str, block_where)
+            html.append(Markup(BLOG_TEXT_BLOCKS[kind]).format(value))
+            text.append((kind, value))
+        elif kind == "list":
+            items = content_list(block, "items", block_where)
+            opening, item_html, closing = BLOG_LIST_BLOCK
+            html += [Markup(opening), *(Markup(item_html).format(item) for item in items), Markup(closing)]
+            text += [(kind, item) for item in items]
+        else:
+            raise ContentError(f"{block_where}: unknown block type '{kind}'")
+    return Markup("").join(html), text
+
+
+def summarise(text, length):
+    """``text`` cut at a word boundary to at most ``length`` characters"""
+    if len(text) <= length:
+        return text
+    cut = text.rfind(" ", 0, length)
+    return text[:cut if cut > 0 else length].rstrip(" ,;:.") + "…"
+
+
+def parse_blog(slug, record, where):
+    published = content_value(record, "date", str, where)
+    try:
+        published = datetime.strptime(published, "%Y-%m-%d").date()
+    except ValueError:
+        raise ContentError(f"{where}: 'date' should be YYYY-MM-DD, not {published!r}")
+    content_html, text = render_blog_blocks(content_value(record, "content", list, where, []), where)
+    paragraphs = [value for kind, value in text if kind == "paragraph"]
+    words = sum(len(value.split()) for _, value in text)
+    return BlogPost(
+        slug=content_value(record, "slug", str, where, slug),
+        title=content_value(record, "title", str, where),
+        author=content_value(record, "author", str, where, "Ardur Technology LLC"),
+        category=content_value(record, "category", str, where, "Insights"),
+        published=published,
+        date_label=published.strftime("%B %d, %Y"),
+        excerpt=content_value(record, "excerpt", str, where, "") or summarise(paragraphs[0] if paragraphs else "", BLOG_EXCERPT_LENGTH),
+        featured_image=content_value(record, "featured_image", str, where, ""),
+        reading_time=content_value(record, "reading_time", int, where, 0) or max(1, round(words / BLOG_WORDS_PER_MINUTE)),
+        tags=content_list(record, "tags", where),
+        content_html=content_html,
+    )
+
+
+def parse_blogs(data, where):
+    return content_records(data, where, parse_blog)
+
+
+# Case studies
+@dataclass(frozen=True, slots=True)
+class CaseStudy:
+    slug: str
+    title: str
+    subtitle: str
+    category: str
+    client: str
+    duration: str
+    featured_image: str
+    challenge: str
+    solution: tuple
+    results: tuple
+    technologies: tuple
+    methodology: str
+    key_learnings: tuple
+
+
+def parse_case_study(slug, record, where):
+    return CaseStudy(
+        slug=content_value(record, "slug", str, where, slug),
+        title=content_value(record, "title", str, where),
+        subtitle=content_value(record, "subtitle", str, where, ""),
+        category=content_value(record, "category", str, where, "Case Study"),
+        client=content_value(record, "client", str, where, ""),
+        duration=content_value(record, "duration", str, where, ""),
+        featured_image=content_value(record, "featured_image", str, where, ""),
+        challenge=content_value(record, "challenge", str, where, ""),
+        solution=content_list(record, "solution", where, parse_titled_text),
+        results=content_list(record, "results", where, parse_result),
+        technologies=content_list(record, "technologies", where),
+        methodology=content_value(record, "methodology", str, where, ""),
+        key_learnings=content_list(record, "key_learnings", where),
+    )
+
+
+def parse_case_studies(data, where):
+    return content_records(data, where, parse_case_study)
+
+
+# Service pages (services_detail.json)
+@dataclass(frozen=True, slots=True)
+class ServiceStep:
+    step: int
+    title: str
+    details: tuple
+
+
+def parse_service_step(item, where):
+    return ServiceStep(
+        content_value(item, "step", int, where, 0), content_value(item, "title", str, where), content_list(item, "details", where)
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class ServiceSection:
+    title: str
+    content: str
+    bullets: tuple
+    # "steps" and "benefits" sections carry their entries in ``items``
+    type: str
+    items: tuple
+    subsection: "ServiceSection | None"
+
+
+SERVICE_SECTION_ITEMS = {"steps": parse_service_step, "benefits": parse_titled_text}
+
+
+def parse_service_section(item, where):
+    kind = content_value(item, "type", str, where, "")
+    if kind and kind not in SERVICE_SECTION_ITEMS:
+        raise ContentError(f"{where}: unknown section type '{kind}'")
+    subsection = content_value(item, "subsection", dict, where, None)
+    return ServiceSection(
+        title=content_value(item, "title", str, where),
+        content=content_value(item, "content", str, where, ""),
+        bullets=content_list(item, "bullets", where),
+        type=kind,
+        items=content_list(item, kind, where, SERVICE_SECTION_ITEMS[kind]) if kind else (),
+        subsection=parse_service_section(subsection, f"{where}.subsection") if subsection is not None else None,
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class ServicePage:
+    slug: str
+    title: str
+    subtitle: str
+    icon: str
+    color: str
+    sections: tuple
+
+
+def parse_service_page(slug, record, where):
+    return ServicePage(
+        slug=content_value(record, "slug", str, where, slug),
+        title=content_value(record, "title", str, where),
+        subtitle=content_value(record, "subtitle", str, where, ""),
+        icon=content_value(record, "icon", str, where, ""),
+        color=content_value(record, "color", str, where, "primary"),
+        sections=content_list(record, "sections", where, parse_service_section),
+    )
+
+
+def parse_service_pages(data, where):
+    return content_records(data, where, parse_service_page)
+
+
+# Service categories (services.json)
+@dataclass(frozen=True, slots=True)
+class ServiceCategory:
+    key: str
+    title: str
+    name: str
+    category: str
+    description: str
+    icon: str
+    delivery_model: str
+    typical_timeline: str
+    services: tuple
+    key_features: tuple
+    offerings: tuple
+    process: tuple
+    technologies: tuple
+    faqs: tuple
+
+
+def parse_service_category(key, record, where):
+    return ServiceCategory(
+        key=key,
+        title=content_value(record, "title", str, where),
+        name=content_value(record, "name", str, where, "Our Service"),
+        category=content_value(record, "category", str, where, "Business Solutions"),
+        description=content_value(record, "description", str, where, "Professional business solutions tailored to your needs."),
+        icon=content_value(record, "icon", str, where, ""),
+        delivery_model=content_value(record, "delivery_model", str, where, ""),
+        typical_timeline=content_value(record, "typical_timeline", str, where, ""),
+        services=content_list(record, "services", where),
+        key_features=content_list(record, "key_features", where),
+        offerings=content_list(record, "offerings", where, parse_titled_text),
+        process=content_list(record, "process", where, parse_titled_text),
+        technologies=content_list(record, "technologies", where),
+        faqs=content_list(record, "faqs", where, parse_faq),
+    )
+
+
+def parse_service_categories(data, where):
+    return content_records(data, where, parse_service_category)
+
+
+# Leadership
+@dataclass(frozen=True, slots=True)
+class TeamMember:
+    id: str
+    name: str
+    title: str
+    image: str
+    bio: str
+    bio_extended: str
+    specialties: tuple
+    linkedin: str
+    email: str
+
+
+def parse_team_member(item, where):
+    return TeamMember(
+        id=content_value(item, "id", str, where, ""),
+        name=content_value(item, "name", str, where),
+        title=content_value(item, "title", str, where, ""),
+        image=content_value(item, "image", str, where, ""),
+        bio=content_value(item, "bio", str, where, ""),
+        bio_extended=content_value(item, "bio_extended", str, where, ""),
+        specialties=content_list(item, "specialties", where),
+        linkedin=content_value(item, "linkedin", str, where, ""),
+        email=content_value(item, "email", str, where, ""),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class CompanyValue:
+    icon: str
+    title: str
+    description: str
+
+
+def parse_company_value(item, where):
+    return CompanyValue(
+        content_value(item, "icon", str, where, ""), content_value(item, "title", str, where), content_value(item, "description", str, where, "")
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class Leadership:
+    team_members: tuple
+    company_values: tuple
+
+
+def parse_leadership(data, where):
+    return Leadership(
+        team_members=content_list(data, "team_members", where, parse_team_member),
+        company_values=content_list(data, "company_values", where, parse_company_value),
+    )
+
+
+# Data file -> parser producing its typed records
+CONTENT_MODELS = {
+    "blogs": parse_blogs,
+    "case_studies": parse_case_studies,
+    "services_detail": parse_service_pages,
+    "services": parse_service_categories,
+    "leadership": parse_leadership,
+}
+
+
+content_store = ContentStore(
+    os.path.join(app.root_path, "app", "data"),
+    check_interval=float(os.environ.get("CONTENT_RELOAD_INTERVAL", "1.0")),
+    models=CONTENT_MODELS,
+)
+
+
+# Shown when services.json is missing
+DEFAULT_SERVICES = {
+    "business_process_management": {
+        "title": "Business Process Management (BPM)",
+        "services": [
+            "Title & Appraisal Services",
+            "Tax Services",
+            "Vendor Management",
+            "Document Indexing",
+            "Title Curative",
+            "Order Entry, QC, and Data Entry",
+        ],
+    },
+    "mortgage_real_estate": {
+        "title": "Mortgage & Real Estate Services",
+        "services": [
+            "Pre-processing, Processing & Underwriting",
+            "Title Search & Closing Support",
+            "Post-closing Audit",
+            "Property & Lien Search",
+            "Loan Boarding",
+            "Appraisal Review",
+        ],
+    },
+}
+
+
+def load_services_data():
+    """Load services data from the content store"""
+    data = content_store.get("services")
+    if data is not None:
+        return data
+    return DEFAULT_SERVICES
+
+
+def load_service_categories():
+    """Typed service categories from the content store"""
+    records = content_store.records("services")
+    if records is not None:
+        return records
+    return parse_service_categories(DEFAULT_SERVICES, "DEFAULT_SERVICES")
+
+
+def load_services_detail():
+    """Load detailed services data from the content store"""
+    return content_store.records("services_detail", {})
+
+
+def load_blogs():
+    """Load blogs data from the content store"""
+    return content_store.records("blogs", {})
+
+
+def load_leadership():
+    """Load leadership team data from the content store"""
+    return content_store.records("leadership", Leadership(team_members=(), company_values=()))
+
+
+def load_case_studies():
+    """Load case studies data from the content store"""
+    return content_store.records("case_studies", {})
+
+
+# Search over the structured content files: source -> (label, endpoint, slug argument)
+SEARCH_SOURCES = {
+    "blogs": ("Blog", "blog_detail", "blog_slug"),
+    "services_detail": ("Service", "service_page", "service_slug"),
+    "case_studies": ("Case Study", "case_study_detail", "study_slug"),
+}
+# Record keys that hold layout/metadata rather than readable text
+SEARCH_SKIP_KEYS = {"slug", "type", "icon", "color", "featured_image", "image", "date", "author", "step", "reading_time"}
+SEARCH_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in into is it its of on or our that the their this to was we were will with you your".split()
+)
+SEARCH_TOKEN_RE = re.compile(r"[a-z0-9]+", re.I)
+
+
+def search_tokens(text):
+    return [token for token in (t.lower() for t in SEARCH_TOKEN_RE.findall(text)) if token not in SEARCH_STOPWORDS]
+
+
+def record_text(value, key=None):
+    """Yield every readable string in a structured content record"""
+    if key in SEARCH_SKIP_KEYS:
+        return
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for k, v in value.items():
+            yield from record_text(v, k)
+    elif isinstance(value, list):
+        for v in value:
+            yield from record_text(v, key)
+
+
+def search_snippet(text, spans, width=180):
+    """Excerpt of text around the densest run of matches, with each (start, end) span wrapped in <mark>"""
+    start, end = 0, min(len(text), width)
+    if spans:
+        best_count, best_i, j = 0, 0, 0
+        for i, (hit_start, _) in enumerate(spans):
+            j = max(j, i)
+            while j + 1 < len(spans) and spans[j + 1][1] <= hit_start + width:
+                j += 1
+            if j - i + 1 > best_count:
+                best_count, best_i = j - i + 1, i
+        start = max(0, spans[best_i][0] - width // 4)
+        end = min(len(text), start + width)
+        if start > 0:
+            space = text.find(" ", start, spans[best_i][0])
+            start = space + 1 if space != -1 else start
+    if end < len(text):
+        space = text.rfind(" ", start, end)
+        end = space if space > start else end
+
+    parts, pos = ["… " if start > 0 else ""], start
+    for hit_start, hit_end in spans:
+        if hit_start < pos or hit_end > end:
+            continue
+        parts += [escape(text[pos:hit_start]), "<mark>", escape(text[hit_start:hit_end]), "</mark>"]
+        pos = hit_end
+    parts += [escape(text[pos:end]), " …" if end < len(text) else ""]
+    return Markup("".join(parts))
+
+
+class SearchIndex:
+    """In-memory inverted index over the content files, ranked with BM25
+
+    Postings map each term to ``{doc_id: term frequency}``, with title words
+    counted ``TITLE_BOOST`` times. Each document keeps the character offsets
+    of its first few occurrences of every term, so snippets are cut without
+    rescanning the text. refresh() compares each file's version
+    with the one the index was built from and re-tokenises only the records
+    whose text digest changed. The index is saved to ``cache_path`` so a
+    cold start only has to stat the data files.
+    """
+
+    FORMAT = 1
+    TITLE_BOOST = 3
+    MAX_OFFSETS = 8
+
+    def __init__(self, store, sources, cache_path, k1=1.2, b=0.75, max_expansions=30):
+        self.store = store
+        self.sources = sources
+        self.cache_path = cache_path
+        self.k1 = k1
+        self.b = b
+        self.max_expansions = max_expansions
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._versions = {}
+        # doc_id -> {"source", "slug", "title", "body", "length", "digest", "terms", "offsets"}
+        self._docs = {}
+        self._postings = {}
+        self._total_length = 0
+        # Sorted vocabulary for prefix lookups, rebuilt lazily after changes
+        self._vocabulary = None
+        # Bumped whenever the indexed documents change, so derived tables know to rebuild
+        self.generation = 0
+
+    def refresh(self):
+        """Bring the index up to date with the data files; a few dict lookups when nothing changed"""
+        versions = {name: self.store.version(name) for name in self.sources}
+        if self._loaded and versions == self._versions:
+            return
+        with self._lock:
+            if not self._loaded:
+                self._load()
+                self._loaded = True
+                self.generation += 1
+            changed = [name for name in self.sources if versions[name] != self._versions.get(name)]
+            if not changed:
+                return
+            for name in changed:
+                self._index_source(name, self.store.get(name, {}))
+                self._versions[name] = versions[name]
+            self._vocabulary = None
+            self.generation += 1
+            self._save()
+
+    def term_frequencies(self):
+        """Return ``{doc_id: {term: tf}}`` for every indexed document, read off the postings"""
+        self.refresh()
+        with self._lock:
+            vectors = {doc_id: {} for doc_id in self._docs}
+            for term, postings in self._postings.items():
+                for doc_id, tf in postings.items():
+                    vectors[doc_id][term] = tf
+            return vectors
+
+    def search(self, query, limit=10, prefix=False):
+        """Return up to ``limit`` hits ordered by BM25 score; with ``prefix`` the last word also matches as a prefix"""
+        terms = search_tokens(query)
+        if not terms:
+            return []
+        self.refresh()
+        with self._lock:
+            n = len(self._docs)
+            if not n:
+                return []
+            avgdl = self._total_length / n
+            expand_last = prefix and not query[-1:].isspace()
+            scores = {}
+            matched = set()
+            for i, term in enumerate(terms):
+                candidates = self._expand(term) if expand_last and i == len(terms) - 1 else [term]
+                best = {}
+                for candidate in candidates:
+                    postings = self._postings.get(candidate)
+                    if not postings:
+                        continue
+                    matched.add(candidate)
+                    df = len(postings)
+                    idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+                    for doc_id, tf in postings.items():
+                        norm = self.k1 * (1 - self.b + self.b * self._docs[doc_id]["length"] / avgdl)
+                        score = idf * tf * (self.k1 + 1) / (tf + norm)
+                        if score > best.get(doc_id, 0.0):
+                            best[doc_id] = score
+                for doc_id, score in best.items():
+                    scores[doc_id] = scores.get(doc_id, 0.0) + score
+
+            top = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+            hits = []
+            for doc_id, score in top:
+                doc = self._docs[doc_id]
+                offsets = doc["offsets"]
+                spans = sorted(
+                    (offset, offset + len(term)) for term in matched for offset in offsets.get(term, ())
+                )
+                hits.append({
+                    "source": doc["source"],
+                    "slug": doc["slug"],
+                    "title": doc["title"],
+                    "score": round(score, 4),
+                    "snippet": search_snippet(doc["body"], spans),
+                })
+            return hits
+
+    def _expand(self, prefix):
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        start = bisect.bisect_left(self._vocabulary, prefix)
+        terms = []
+        for term in itertools.islice(self._vocabulary, start, None):
+            if not term.startswith(prefix) or len(terms) >= self.max_expansions:
+                break
+            terms.append(term)
+        return terms
+
+    def _index_source(self, name, records):
+        seen = set()
+        for slug, record in (records.items() if isinstance(records, dict) else ()):
+            if not isinstance(record, dict):
+                continue
+            doc_id = f"{name}:{slug}"
+            seen.add(doc_id)
+            title = str(record.get("title", slug))
+            body = " ".join(record_text({k: v for k, v in record.items() if k != "title"}))
+            digest = hashlib.sha1(f"{title}\0{body}".encode("utf-8")).hexdigest()
+            existing = self._docs.get(doc_id)
+            if existing is not None and existing["digest"] == digest:
+                continue
+            if existing is not None:
+                self._remove(doc_id)
+            self._add(doc_id, name, slug, title, body, digest)
+
+        for doc_id in [d for d, doc in self._docs.items() if doc["source"] == name and d not in seen]:
+            self._remove(doc_id)
+
+    def _add(self, doc_id, source, slug, title, body, digest):
+        counts = Counter()
+        offsets = {}
+        for match in SEARCH_TOKEN_RE.finditer(body):
+            token = match.group().lower()
+            if token in SEARCH_STOPWORDS:
+                continue
+            counts[token] += 1
+            positions = offsets.setdefault(token, [])
+            if len(positions) < self.MAX_OFFSETS:
+                positions.append(match.start())
+        for token in search_tokens(title):
+            counts[token] += self.TITLE_BOOST
+        length = sum(counts.values())
+        for term, tf in counts.items():
+            self._postings.setdefault(term, {})[doc_id] = tf
+        self._docs[doc_id] = {
+            "source": source,
+            "slug": slug,
+            "title": title,
+            "body": body,
+            "length": length,
+            "digest": digest,
+            "terms": list(counts),
+            "offsets": offsets,
+        }
+        self._total_length += length
+
+    def _remove(self, doc_id):
+        doc = self._docs.pop(doc_id)
+        for term in doc["terms"]:
+            postings = self._postings[term]
+            postings.pop(doc_id, None)
+            if not postings:
+                del self._postings[term]
+        self._total_length -= doc["length"]
+
+    def _load(self):
+        try:
+            with open(self.cache_path, "r") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            log_event("search.index_unreadable", logging.WARNING, path=self.cache_path, error=str(e))
+            return
+        if data.get("format") != self.FORMAT:
+            return
+        self._versions = {name: tuple(v) if v else None for name, v in data["versions"].items()}
+        self._docs = data["docs"]
+        self._postings = data["postings"]
+        self._total_length = sum(doc["length"] for doc in self._docs.values())
+
+    def _save(self):
+        data = {"format": self.FORMAT, "versions": self._versions, "docs": self._docs, "postings": self._postings}
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            log_event("search.index_save_failed", logging.WARNING, error=str(e))
+
+
+SEARCH_MAX_QUERY = 200
+search_index = SearchIndex(
+    content_store,
+    SEARCH_SOURCES,
+    os.environ.get("SEARCH_INDEX_PATH", os.path.join(tempfile.gettempdir(), "search_index.json")),
+)
+
+
+def search_content(query, limit=10, prefix=False):
+    """Run a search and attach the page URL and content label to each hit"""
+    hits = search_index.search(query, limit=limit, prefix=prefix)
+    for hit in hits:
+        label, endpoint, slug_arg = SEARCH_SOURCES[hit["source"]]
+        hit["type"] = label
+        hit["url"] = url_for(endpoint, **{slug_arg: hit["slug"]})
+    return hits
+
+
+class RelatedContent:
+    """Top-k "related" table across blogs, service pages and case studies
+
+    Pairs are scored by cosine similarity of TF-IDF vectors (taken from the
+    search index's postings) plus shared ``tags`` and ``category`` words.
+    Dot products are accumulated term by term over the postings, skipping
+    terms found in more than ``max_df`` of all documents, so only documents
+    that share a distinctive word are ever compared. The table is rebuilt
+    when the search index changes; lookups are a single dict access.
+    """
+
+    TAG_WEIGHT = 0.5
+    CATEGORY_WEIGHT = 0.25
+
+    def __init__(self, index, store, k=6, max_df=0.5):
+        self.index = index
+        self.store = store
+        self.k = k
+        self.max_df = max_df
+        self._lock = threading.Lock()
+        self._generation = None
+        self._neighbours = {}
+
+    def neighbours(self, doc_id):
+        """Return ``[(doc_id, score), ...]`` for the k most similar documents"""
+        self.index.refresh()
+        if self._generation != self.index.generation:
+            with self._lock:
+                if self._generation != self.index.generation:
+                    generation = self.index.generation
+                    self._neighbours = self._build()
+                    self._generation = generation
+        return self._neighbours.get(doc_id, [])
+
+    def _labels(self, doc_ids):
+        """Inverted lists of tags and category words per document"""
+        tags, categories = {}, {}
+        for doc_id in doc_ids:
+            source, slug = doc_id.split(":", 1)
+            record = self.store.get_item(source, slug) or {}
+            for tag in {tag.lower() for tag in record.get("tags", [])}:
+                tags.setdefault(tag, []).append(doc_id)
+            for word in set(search_tokens(record.get("category", ""))):
+                categories.setdefault(word, []).append(doc_id)
+        return tags, categories
+
+    @staticmethod
+    def _accumulate(scores, inverted, weight):
+        sizes = Counter(doc_id for docs in inverted.values() for doc_id in docs)
+        for docs in inverted.values():
+            for a, b in itertools.combinations(docs, 2):
+                score = weight / math.sqrt(sizes[a] * sizes[b])
+                scores[a][b] = scores[a].get(b, 0.0) + score
+                scores[b][a] = scores[b].get(a, 0.0) + score
+
+    def _build(self):
+        vectors = self.index.term_frequencies()
+        n = len(vectors)
+        postings = {}
+        for doc_id, terms in vectors.items():
+            for term, tf in terms.items():
+                postings.setdefault(term, []).append((doc_id, 1 + math.log(tf)))
+
+        # Unit-length TF-IDF weights, keyed by term
+        norms = dict.fromkeys(vectors, 0.0)
+        weighted = {}
+        for term, entries in postings.items():
+            idf = math.log((1 + n) / (1 + len(entries))) + 1
+            weighted[term] = [(doc_id, tf * idf) for doc_id, tf in entries]
+            for doc_id, weight in weighted[term]:
+                norms[doc_id] += weight * weight
+
+        scores = {doc_id: {} for doc_id in vectors}
+        max_df = max(2, int(n * self.max_df))
+        for term, entries in weighted.items():
+            if len(entries) < 2 or len(entries) > max_df:
+                continue
+            for (a, wa), (b, wb) in itertools.combinations(entries, 2):
+                score = wa * wb / math.sqrt(norms[a] * norms[b])
+                scores[a][b] = scores[a].get(b, 0.0) + score
+                scores[b][a] = scores[b].get(a, 0.0) + score
+
+        tags, categories = self._labels(vectors)
+        self._accumulate(scores, tags, self.TAG_WEIGHT)
+        self._accumulate(scores, categories, self.CATEGORY_WEIGHT)
+
+        return {
+            doc_id: [(other, round(score, 4)) for other, score in heapq.nlargest(self.k, related.items(), key=lambda item: item[1])]
+            for doc_id, related in scores.items()
+        }
+
+
+related_content = RelatedContent(search_index, content_store)
+
+
+def related_items(source, slug, limit=3):
+    """Cards for the pages most related to one record, across all content types"""
+    items = []
+    for doc_id, score in related_content.neighbours(f"{source}:{slug}"):
+        other_source, other_slug = doc_id.split(":", 1)
+        record = content_store.record(other_source, other_slug)
+        if record is None:
+            continue
+        label, endpoint, slug_arg = SEARCH_SOURCES[other_source]
+        items.append({
+            "type": label,
+            "title": record.title,
+            "summary": getattr(record, "excerpt", "") or getattr(record, "subtitle", ""),
+            "category": getattr(record, "category", "") or label,
+            "url": url_for(endpoint, **{slug_arg: other_slug}),
+            "score": score,
+        })
+        if len(items) == limit:
+            break
+    return items
+
+
+class PageCache:
+    """Bounded LRU cache of rendered pages with precompressed variants"""
+
+    def __init__(self, max_entries=128):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, stamp):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry["stamp"] != stamp:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key, stamp, body, mimetype):
+        etag = hashlib.sha256(body).hexdigest()[:32]
+        entry = {
+            "stamp": stamp,
+            "mimetype": mimetype,
+            "etag": etag,
+            "variants": {"identity": body, "gzip": gzip.compress(body, compresslevel=9)},
+        }
+        if brotli is not None:
+            entry["variants"]["br"] = brotli.compress(body)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+page_cache = PageCache(max_entries=int(os.environ.get("PAGE_CACHE_MAX_ENTRIES", "128")))
+app.config["PAGE_CACHE_ENABLED"] = env_bool("PAGE_CACHE_ENABLED", True)
+
+
+def file_stamp(path):
+    try:
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
+
+
+class TemplateBytecodeCache(BytecodeCache):
+    """Jinja bytecode cache that reads precompiled templates shipped with the deployment
+
+    ``python build_templates.py`` fills ``bundled_dir``. That directory may be
+    read-only at runtime (it is on Vercel), so templates compiled on the fly
+    are written to ``cache_dir`` instead. Jinja checks every entry against the
+    template source and the Python version, so a stale entry is recompiled.
+    """
+
+    def __init__(self, bundled_dir, cache_dir=None):
+        self.bundled_dir = bundled_dir
+        self.cache_dir = cache_dir
+
+    def get_cache_key(self, name, filename=None):
+        # Keyed on the template name only, so entries built in another checkout still match
+        return hashlib.sha1(name.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def cache_file(directory, key):
+        return os.path.join(directory, f"{key}.cache")
+
+    def load_bytecode(self, bucket):
+        for directory in (self.cache_dir, self.bundled_dir):
+            if not directory:
+                continue
+            try:
+                with open(self.cache_file(directory, bucket.key), "rb") as f:
+                    bucket.load_bytecode(f)
+            except OSError:
+                continue
+            if bucket.code is not None:
+                return
+
+    def dump_bytecode(self, bucket):
+        if not self.cache_dir:
+            return
+        path = self.cache_file(self.cache_dir, bucket.key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                bucket.write_bytecode(f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            log_event("templates.bytecode_write_failed", logging.WARNING, path=path, error=str(e))
+
+
+TEMPLATE_BYTECODE_DIR = os.path.join(app.root_path, "app", "template_cache")
+app.config["TEMPLATE_BYTECODE_CACHE"] = env_bool("TEMPLATE_BYTECODE_CACHE", True)
+if app.config["TEMPLATE_BYTECODE_CACHE"]:
+    app.jinja_env.bytecode_cache = TemplateBytecodeCache(
+        TEMPLATE_BYTECODE_DIR,
+        os.environ.get("TEMPLATE_CACHE_DIR", os.path.join(tempfile.gettempdir(), "ardur_template_cache")),
+    )
+
+
+def load_template_references(directory):
+    """Reference lists written by build_templates.py: ``{name: [source sha1, [referenced names]]}``"""
+    try:
+        with open(os.path.join(directory, TEMPLATE_REFERENCES_FILE), "r") as f:
+            return {name: tuple(entry) for name, entry in json.load(f).items()}
+    except (OSError, ValueError):
+        return {}
+
+
+TEMPLATE_REFERENCES_FILE = "references.json"
+_template_references = load_template_references(TEMPLATE_BYTECODE_DIR)
+_template_dependencies = {}
+
+
+def template_references(name, source):
+    """Names a template extends, includes or imports; each distinct source is parsed only once"""
+    digest = hashlib.sha1(source.encode("utf-8")).hexdigest()
+    cached = _template_references.get(name)
+    if cached is None or cached[0] != digest:
+        refs = [ref for ref in jinja_meta.find_referenced_templates(app.jinja_env.parse(source)) if ref]
+        cached = _template_references[name] = (digest, refs)
+    return cached[1]
+
+
+def template_files(template_name):
+    """Return the source files of a template and every template it extends, includes or imports"""
+    env = app.jinja_env
+    files = []
+    seen = set()
+    pending = [template_name]
+    while pending:
+        name = pending.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        source, filename, _ = env.loader.get_source(env, name)
+        if filename:
+            files.append(filename)
+        pending += template_references(name, source)
+    return files
+
+
+def template_version(template_name):
+    """Return the (mtime_ns, size) stamps of a template and everything it pulls in"""
+    files, stamps = _template_dependencies.get(template_name, ((), None))
+    current = tuple(file_stamp(path) for path in files)
+    if current != stamps:
+        # A changed template may have gained or lost an include, so walk it again
+        files = template_files(template_name)
+        current = tuple(file_stamp(path) for path in files)
+        _template_dependencies[template_name] = (files, current)
+    return current
+
+
+def negotiate_encoding(variants):
+    """Pick the best precompressed variant the client accepts"""
+    accepted = request.accept_encodings
+    for encoding in ("br", "gzip"):
+        if encoding in variants and accepted[encoding]:
+            return encoding
+    return "identity"
+
+
+def send_cached_page(entry):
+    encoding = negotiate_encoding(entry["variants"])
+    response = Response(entry["variants"][encoding], mimetype=entry["mimetype"])
+    response.set_etag(entry["etag"] if encoding == "identity" else f"{entry['etag']}-{encoding}")
+    if encoding != "identity":
+        response.headers["Content-Encoding"] = encoding
+    response.vary.add("Accept-Encoding")
+    return response.make_conditional(request)
+
+
+def cached_page(template_name, data=()):
+    """Serve a view from the rendered page cache until its template or data files change"""
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if (
+                not app.config["PAGE_CACHE_ENABLED"]
+                or request.method not in ("GET", "HEAD")
+                or session.get("_flashes")
+                or request.headers.get("X-CSRFToken")
+            ):
+                return view(*args, **kwargs)
+
+            stamp = (
+                template_version(template_name),
+                tuple(content_store.version(name) for name in data),
+                asset_versions(),
+                datetime.now().year,
+            )
+            key = (request.endpoint, tuple(sorted((request.view_args or {}).items())), request.url)
+
+            entry = page_cache.get(key, stamp)
+            if entry is None:
+                response = make_response(view(*args, **kwargs))
+                # Pages that rendered flashed messages or a CSRF token are per-visitor
+                if response.status_code != 200 or "csrf_token" in g or session.get("_flashes"):
+                    return response
+                entry = page_cache.put(key, stamp, response.get_data(), response.mimetype)
+            return send_cached_page(entry)
+
+        return wrapper
+
+    return decorator
+
+
+_record_digests = {}
+
+
+def record_digest(name, key=None):
+    """Hash of one record (or the whole file when key is None), recomputed only when the file changes"""
+    version = content_store.version(name)
+    cached = _record_digests.get((name, key))
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    record = content_store.get(name) if key is None else content_store.get_item(name, key)
+    digest = hashlib.sha256(json.dumps(record, sort_keys=True).encode("utf-8")).hexdigest()
+    _record_digests[(name, key)] = (version, digest)
+    return digest
+
+
+def conditional_get(template_name, data, key_arg=None, also=()):
+    """Answer If-None-Match / If-Modified-Since with a 304 before the view renders anything
+
+    The ETag is derived from the data record named by ``key_arg`` (or the whole
+    ``data`` file), any other data files the page draws on (``also``) and the
+    versions of the template chain that renders it.
+    """
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            key = kwargs.get(key_arg) if key_arg else None
+            data_version = content_store.version(data)
+            if (
+                request.method not in ("GET", "HEAD")
+                or session.get("_flashes")
+                or data_version is None
+                or (key_arg and content_store.get_item(data, key) is None)
+            ):
+                return view(*args, **kwargs)
+
+            templates = template_version(template_name) if template_name else ()
+            etag = hashlib.sha256(
+                repr((
+                    record_digest(data, key),
+                    [record_digest(name) for name in also],
+                    templates,
+                    asset_versions(),
+                    request.url,
+                    datetime.now().year,
+                )).encode("utf-8")
+            ).hexdigest()[:32]
+            mtimes = [data_version[0]] + [stamp[0] for stamp in templates if stamp]
+            mtimes += [version[0] for version in map(content_store.version, also) if version]
+            last_modified = datetime.fromtimestamp(max(mtimes) // 1_000_000_000, tz=timezone.utc)
+
+            if not is_resource_modified(request.environ, etag=etag, last_modified=last_modified):
+                response = Response(status=304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            response.set_etag(etag)
+            response.last_modified = last_modified
+            response.cache_control.no_cache = True
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _process_start_time(pid):
+    """Start time of ``pid`` in clock ticks since boot, or None where /proc is unavailable"""
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as f:
+            # Fields after the parenthesised command name start at field 3; starttime is field 22
+            return int(f.read().rsplit(b")", 1)[1].split()[19])
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+_spool_owner = (None, None)
+
+
+def spool_owner():
+    """This process's spool tag, ``<pid>.<start time>``; a later process reusing the pid never matches it"""
+    global _spool_owner
+    pid = os.getpid()
+    if _spool_owner[0] != pid:
+        start = _process_start_time(pid)
+        _spool_owner = (pid, f"{pid}.{start if start is not None else uuid.uuid4().hex}")
+    return _spool_owner[1]
+
+
+def _spool_owner_alive(owner):
+    if owner == spool_owner():
+        return True
+    pid, _, start = owner.partition(".")
+    # Our pid under another tag is a previous process that had the same pid (e.g. a restarted container)
+    if not pid.isdigit() or int(pid) == os.getpid() or not _pid_alive(int(pid)):
+        return False
+    current = _process_start_time(int(pid))
+    return current is None or not start.isdigit() or int(start) == current
+
+
+class JobSpool:
+    """Directory of fsync'd JSON job records that survive a worker restart
+
+    Files are named ``<owner>-<id>.json``, where the owner is spool_owner() of
+    the process that wrote them, so a process only replays records whose
+    owner has exited, even if a new process has since been given its pid.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def _path(self, job_id):
+        return os.path.join(self.directory, f"{spool_owner()}-{job_id}.json")
+
+    def write(self, record):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(record["id"])
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(record, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def remove(self, job_id):
+        try:
+            os.remove(self._path(job_id))
+        except FileNotFoundError:
+            pass
+
+    def recover(self):
+        """Claim and return the records of processes that are no longer running"""
+        try:
+            filenames = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        records = []
+        for filename in filenames:
+            if not filename.endswith(".json") or "-" not in filename:
+                continue
+            if _spool_owner_alive(filename.split("-", 1)[0]):
+                continue
+            path = os.path.join(self.directory, filename)
+            try:
+                with open(path, "r") as f:
+                    record = json.load(f)
+                # Claim the orphan; a sibling process that renamed it first wins
+                os.rename(path, self._path(record["id"]))
+            except (OSError, ValueError, KeyError):
+                continue
+            records.append(record)
+        return records
+
+
+class MailQueue:
+    """Durable background mail dispatcher with a worker pool, retries and a dead-letter file
+
+    Messages are spooled to disk before enqueue() returns, so anything not yet
+    delivered is replayed after a restart. Each worker keeps its SMTP
+    connection open between messages and drops it after ``idle_timeout``.
+    A message's ``tag`` is passed to the ``on_delivery`` hooks once it is
+    delivered or dead-lettered, so callers can record what really happened.
+    To try it locally, run ``python -m aiosmtpd -n -l localhost:8025`` and set
+    MAIL_SERVER=localhost, MAIL_PORT=8025 and MAIL_USE_TLS=False.
+    """
+
+    def __init__(self, mail, spool_dir, dead_letter_path, workers=2, max_queue=1000,
+                 max_attempts=5, backoff_base=2.0, backoff_max=300.0, idle_timeout=30.0):
+        self.mail = mail
+        self.spool = JobSpool(spool_dir)
+        self.dead_letter_path = dead_letter_path
+        self.workers = workers
+        self.max_queue = max_queue
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.idle_timeout = idle_timeout
+        self._heap = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._threads = []
+        self._in_flight = 0
+        self._started = False
+        self._stopping = False
+        self._delivery_hooks = []
+
+    def on_delivery(self, func):
+        """Register ``func(tag, delivered)``, called once a tagged message is delivered or dead-lettered"""
+        self._delivery_hooks.append(func)
+        return func
+
+    def report(self, tag, delivered):
+        if tag is None:
+            return
+        for hook in self._delivery_hooks:
+            try:
+                hook(tag, delivered)
+            except Exception as e:
+                log_event("mail.delivery_hook_failed", logging.WARNING, hook=hook.__name__, error=str(e))
+
+    def enqueue(self, message, tag=None):
+        """Validate and spool a Flask-Mail Message, then hand it to the worker pool
+
+        ``tag`` is any JSON-serialisable value to report to the delivery hooks.
+        """
+        from flask_mail import BadHeaderError, sanitize_address, sanitize_addresses
+
+        if not message.send_to:
+            raise ValueError("No recipients have been added")
+        if not message.sender:
+            raise ValueError("The message does not specify a sender and a default sender has not been configured")
+        if message.has_bad_headers():
+            raise BadHeaderError
+        if message.date is None:
+            message.date = time.time()
+
+        job = {
+            "id": uuid.uuid4().hex,
+            "sender": sanitize_address(message.sender),
+            "recipients": list(sanitize_addresses(message.send_to)),
+            "raw": message.as_bytes(),
+            "attempts": 0,
+            "created": time.time(),
+            "tag": tag,
+        }
+        with self._cond:
+            if len(self._heap) + self._in_flight >= self.max_queue:
+                raise queue.Full("Mail queue is full")
+        self.start()
+        self._spool(job)
+        self._push(job, job["created"])
+        return job["id"]
+
+    def start(self):
+        with self._cond:
+            if self._started:
+                return
+            self._started = True
+            self._stopping = False
+        self._recover()
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"mail-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def shutdown(self, timeout=30.0):
+        """Stop accepting work and wait for due messages to drain; later retries stay spooled"""
+        with self._cond:
+            if not self._started:
+                return
+            self._stopping = True
+            self._cond.notify_all()
+        deadline = time.monotonic() + timeout
+        for thread in self._threads:
+            thread.join(max(0, deadline - time.monotonic()))
+        self._threads = []
+        with self._cond:
+            self._started = False
+
+    def depth(self):
+        with self._cond:
+            return len(self._heap) + self._in_flight
+
+    def _recover(self):
+        for record in self.spool.recover():
+            self._push(dict(record, raw=base64.b64decode(record["raw"])), time.time())
+
+    def _spool(self, job):
+        self.spool.write(dict(job, raw=base64.b64encode(job["raw"]).decode("ascii")))
+
+    def _unspool(self, job):
+        self.spool.remove(job["id"])
+
+    def _push(self, job, due):
+        with self._cond:
+            heapq.heappush(self._heap, (due, next(self._seq), job))
+            self._cond.notify()
+
+    def _next_job(self):
+        deadline = time.monotonic() + self.idle_timeout
+        with self._cond:
+            while True:
+                now = time.time()
+                if self._heap and self._heap[0][0] <= now:
+                    job = heapq.heappop(self._heap)[2]
+                    self._in_flight += 1
+                    return job
+                if self._stopping:
+                    return False
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                if self._heap:
+                    remaining = min(remaining, self._heap[0][0] - now)
+                self._cond.wait(remaining)
+
+    def _connect(self):
+        from flask_mail import Connection
+
+        if self.mail.suppress:
+            return None
+        return Connection(self.mail).configure_host()
+
+    @staticmethod
+    def _close(host):
+        if host is not None:
+            try:
+                host.quit()
+            except Exception:
+                pass
+        return None
+
+    def _deliver(self, host, job):
+        if host is not None:
+            with metrics.time("mail_send"):
+                host.sendmail(job["sender"], job["recipients"], job["raw"])
+
+    def _worker(self):
+        host = None
+        while True:
+            job = self._next_job()
+            if job is False:
+                break
+            if job is None:
+                host = self._close(host)
+                continue
+            try:
+                if host is None:
+                    host = self._connect()
+                try:
+                    self._deliver(host, job)
+                except smtplib.SMTPServerDisconnected:
+                    # Pooled connection went stale; reconnect once without spending an attempt
+                    host = self._connect()
+                    self._deliver(host, job)
+            except Exception as e:
+                host = self._close(host)
+                self._failed(job, e)
+            else:
+                self._unspool(job)
+                self.report(job.get("tag"), True)
+            finally:
+                with self._cond:
+                    self._in_flight -= 1
+        self._close(host)
+
+    def _failed(self, job, error):
+        job["attempts"] += 1
+        job["last_error"] = str(error)
+        if job["attempts"] >= self.max_attempts:
+            log_event("mail.dead_lettered", logging.ERROR, mail_id=job["id"], attempts=job["attempts"], error=str(error))
+            self._dead_letter(job)
+            return
+        delay = min(self.backoff_max, self.backoff_base * (2 ** (job["attempts"] - 1)))
+        log_event("mail.retry_scheduled", logging.WARNING, mail_id=job["id"], attempts=job["attempts"], delay_seconds=delay, error=str(error))
+        self._spool(job)
+        self._push(job, time.time() + delay)
+
+    def _dead_letter(self, job):
+        record = dict(job, raw=base64.b64encode(job["raw"]).decode("ascii"), failed_at=time.time())
+        try:
+            with open(self.dead_letter_path, "a") as f:
+                f.write(json.dumps(record) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError as e:
+            log_event("mail.dead_letter_write_failed", logging.ERROR, mail_id=job["id"], error=str(e))
+            return
+        self._unspool(job)
+        self.report(job.get("tag"), False)
+
+
+app.config["MAIL_QUEUE_ENABLED"] = env_bool("MAIL_QUEUE_ENABLED", True)
+mail_queue = MailQueue(
+    mail,
+    spool_dir=os.environ.get("MAIL_QUEUE_SPOOL_DIR", os.path.join(tempfile.gettempdir(), "mail_spool")),
+    dead_letter_path=os.environ.get(
+        "MAIL_DEAD_LETTER_FILE", os.path.join(tempfile.gettempdir(), "mail_dead_letter.jsonl")
+    ),
+    workers=int(os.environ.get("MAIL_QUEUE_WORKERS", "2")),
+    max_queue=int(os.environ.get("MAIL_QUEUE_MAX_SIZE", "1000")),
+    max_attempts=int(os.environ.get("MAIL_QUEUE_MAX_ATTEMPTS", "5")),
+)
+atexit.register(mail_queue.shutdown)
+
+
+def send_mail(msg, tag=None):
+    """Hand a message to the background mail queue, or send it inline when the queue is disabled"""
+    if app.config["MAIL_QUEUE_ENABLED"]:
+        mail_queue.enqueue(msg, tag=tag)
+    else:
+        with metrics.time("mail_send"):
+            mail.send(msg)
+        mail_queue.report(tag, True)
+
+
+class JobScheduler:
+    """Single-thread scheduler for delayed jobs, backed by a min-heap and a JobSpool
+
+    Jobs are looked up by name in ``handlers`` and called with JSON-serialisable
+    keyword arguments, so pending jobs can be replayed after a restart.
+    """
+
+    def __init__(self, spool_dir):
+        self.spool = JobSpool(spool_dir)
+        self.handlers = {}
+        self._heap = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._thread = None
+        self._stopping = False
+        self._executed = 0
+        self._failed = 0
+        self._last_lateness = 0.0
+        self._max_lateness = 0.0
+        self._total_lateness = 0.0
+
+    def handler(self, name):
+        """Register a function that runs jobs of the given name"""
+
+        def decorator(func):
+            self.handlers[name] = func
+            return func
+
+        return decorator
+
+    def schedule(self, name, delay_seconds, **kwargs):
+        if name not in self.handlers:
+            raise KeyError(f"No handler registered for job '{name}'")
+        job = {
+            "id": uuid.uuid4().hex,
+            "name": name,
+            "due": time.time() + max(0, delay_seconds),
+            "kwargs": kwargs,
+        }
+        self.start()
+        self.spool.write(job)
+        self._push(job)
+        return job["id"]
+
+    def start(self):
+        with self._cond:
+            if self._thread is not None:
+                return
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="job-scheduler", daemon=True)
+        for job in self.spool.recover():
+            self._push(job)
+        self._thread.start()
+
+    def shutdown(self, timeout=5.0):
+        """Stop the scheduler thread; jobs that are not yet due stay spooled for the next start"""
+        with self._cond:
+            thread = self._thread
+            if thread is None:
+                return
+            self._stopping = True
+            self._cond.notify_all()
+        thread.join(timeout)
+        with self._cond:
+            self._thread = None
+
+    def metrics(self):
+        with self._cond:
+            now = time.time()
+            return {
+                "depth": len(self._heap),
+                "overdue": sum(1 for due, _, _ in self._heap if due <= now),
+                "executed": self._executed,
+                "failed": self._failed,
+                "last_lateness_seconds": self._last_lateness,
+                "max_lateness_seconds": self._max_lateness,
+                "avg_lateness_seconds": self._total_lateness / self._executed if self._executed else 0.0,
+            }
+
+    def _push(self, job):
+        with self._cond:
+            heapq.heappush(self._heap, (job["due"], next(self._seq), job))
+            self._cond.notify()
+        self._publish()
+
+    def _publish(self):
+        """Update the /metrics gauges from the current heap"""
+        stats = self.metrics()
+        metrics.set("job_scheduler_depth", stats["depth"])
+        metrics.set("job_scheduler_overdue", stats["overdue"])
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._stopping and (not self._heap or self._heap[0][0] > time.time()):
+                    self._cond.wait(self._heap[0][0] - time.time() if self._heap else None)
+                if self._stopping:
+                    return
+                job = heapq.heappop(self._heap)[2]
+
+            lateness = max(0.0, time.time() - job["due"])
+            self._publish()
+            metrics.observe("job_scheduler_lateness_seconds", lateness)
+            try:
+                self.handlers[job["name"]](**job["kwargs"])
+                failed = False
+            except Exception as e:
+                log_event("scheduler.job_failed", logging.WARNING, job=job["name"], job_id=job["id"], error=str(e))
+                failed = True
+            self.spool.remove(job["id"])
+            metrics.inc("job_scheduler_runs_total", job=job["name"], outcome="failed" if failed else "ok")
+
+            with self._cond:
+                self._executed += 1
+                self._failed += failed
+                self._last_lateness = lateness
+                self._max_lateness = max(self._max_lateness, lateness)
+                self._total_lateness += lateness
+
+
+scheduler = JobScheduler(
+    os.environ.get("SCHEDULER_SPOOL_DIR", os.path.join(tempfile.gettempdir(), "scheduled_jobs"))
+)
+atexit.register(scheduler.shutdown)
+
+
+def load_email_logo():
+    """Read the inline auto-reply logo once so each email doesn't hit the disk"""
+    try:
+        with open(os.path.join(app.static_folder, "images", "logo.png"), "rb") as f:
+            return f.read()
+    except OSError as e:
+        log_event("mail.logo_unavailable", logging.WARNING, error=str(e))
+        return None
+
+
+EMAIL_LOGO = load_email_logo()
+
+
+@scheduler.handler("auto_reply")
+def send_auto_reply(recipient_email, recipient_name, admin_email_addr):
+    """Send the acknowledgement email for a contact form submission"""
+    with app.app_context():
+        reply_subject = "We received your inquiry - Ardur Technology LLC"
+        reply_text = (
+            f"Hello {recipient_name or 'there'},\n\n"
+            "Thank you for contacting Ardur Technology LLC. We have received your inquiry and our team will respond soon.\n\n"
+            "Regards,\n"
+            "Ardur Technology LLC\n"
+            "https://ardurtechnology.com"
+        )
+        logo_cid = "ardur-technology-logo"
+        reply_html = f"""
+<div style=\"font-family: Arial, Helvetica, sans-serif; color: #0f172a; line-height: 1.6;\">
+  <p style=\"margin: 0 0 12px;\">Hello {recipient_name or 'there'},</p>
+  <p style=\"margin: 0 0 12px;\">
+    Thank you for contacting <strong>Ardur Technology LLC</strong>. We have received your inquiry and a member of our team will respond shortly.
+  </p>
+  <p style=\"margin: 0 0 16px;\">Regards,<br/>Ardur Technology LLC</p>
+  <div style=\"margin-top: 18px; padding-top: 14px; border-top: 1px solid #e2e8f0; display: flex; align-items: center; gap: 12px;\">
+    <img src=\"cid:{logo_cid}\" alt=\"Ardur Technology\" style=\"height: 36px; width: auto; display: block;\" />
+    <div style=\"font-size: 12px; color: #475569;\">
+      <div><strong>Ardur Technology LLC</strong></div>
+      <div>Las Vegas, Nevada, USA</div>
+      <div><a href=\"mailto:{admin_email_addr}\" style=\"color: #2563eb; text-decoration: none;\">{admin_email_addr}</a></div>
+    </div>
+  </div>
+</div>
+        """
+
+        reply_msg = mail_message(
+            subject=reply_subject,
+            recipients=[recipient_email],
+            body=reply_text,
+            html=reply_html,
+        )
+
+        if EMAIL_LOGO is not None:
+            reply_msg.attach(
+                "logo.png",
+                "image/png",
+                EMAIL_LOGO,
+                "inline",
+                headers=[["Content-ID", f"<{logo_cid}>"]],
+            )
 
-# Use writable temp directory for uploads (Vercel-compatible)
-upload_dir = os.path.join(tempfile.gettempdir(), "uploads")
-os.makedirs(upload_dir, exist_ok=True)
-app.config["UPLOAD_FOLDER"] = upload_dir
-app.config["MAX_CONTENT_LENGTH"] = 16 * 1024 * 1024  # 16MB max file size
+        send_mail(reply_msg)
+        log_event("auto_reply.queued" if app.config["MAIL_QUEUE_ENABLED"] else "auto_reply.sent")
 
-# Email configuration
-app.config["MAIL_SERVER"] = os.environ.get("MAIL_SERVER", "smtp.gmail.com")
-app.config["MAIL_PORT"] = int(os.environ.get("MAIL_PORT", 587))
 
-def env_bool(key, default=False):
-    value = os.environ.get(key)
-    if value is None:
-        return default
-    return value.strip().lower() in {"1", "true", "yes", "on"}
+class SubmissionStore:
+    """Append-only SQLite (WAL mode) log of contact form submissions
 
-app.config["MAIL_USE_TLS"] = env_bool("MAIL_USE_TLS", True)
-app.config["MAIL_USERNAME"] = os.environ.get("MAIL_USERNAME")
-app.config["MAIL_PASSWORD"] = os.environ.get("MAIL_PASSWORD")
-app.config["MAIL_DEFAULT_SENDER"] = os.environ.get("MAIL_DEFAULT_SENDER")
-mail = Mail(app)
+    Each append is a single-row insert, so write cost does not grow with
+    history. SQLite's file locking serialises writers across gunicorn
+    workers. On first open the legacy ``contact_submissions.json`` array is
+    imported once.
 
-if env_bool("DISABLE_STATIC_CACHE", False):
-    app.config["SEND_FILE_MAX_AGE_DEFAULT"] = 0
+    Reads are newest first and keyset-paginated on (timestamp, id): every
+    filter has an index ending in timestamp, so a page costs the same however
+    deep into the history it is.
+    """
 
-    @app.after_request
-    def add_no_cache_headers(response):
-        if request.path.startswith("/static/"):
-            response.headers["Cache-Control"] = "no-store, max-age=0"
-            response.headers["Pragma"] = "no-cache"
-            response.headers["Expires"] = "0"
-            response.headers.pop("ETag", None)
-            response.headers.pop("Last-Modified", None)
-        return response
+    COLUMNS = ("submission_id", "timestamp", "name", "email", "phone", "company", "service", "budget", "message", "email_sent")
 
-# Allowed file extensions for resume uploads
-ALLOWED_EXTENSIONS = {"pdf", "doc", "docx"}
+    def __init__(self, path, fallback_path, legacy_json_path=None, checkpoint_every=500):
+        self.path = path
+        self.fallback_path = fallback_path
+        self.legacy_json_path = legacy_json_path
+        self.checkpoint_every = checkpoint_every
+        self._local = threading.local()
+        self._init_lock = threading.Lock()
+        self._initialised = False
+        self._writes = 0
 
+    def _choose_path(self):
+        # Pick one location up front so the history is never split between two files
+        for path in (self.path, self.fallback_path):
+            try:
+                os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+                sqlite3.connect(path).close()
+                if os.access(path, os.W_OK):
+                    return path
+            except (OSError, sqlite3.Error):
+                continue
+        raise OSError("No writable location for the submission store")
 
-def allowed_file(filename):
-    return "." in filename and filename.rsplit(".", 1)[1].lower() in ALLOWED_EXTENSIONS
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+        with self._init_lock:
+            if not self._initialised:
+                self.path = self._choose_path()
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=FULL")
+        conn.execute("PRAGMA busy_timeout=30000")
+        self._local.conn = conn
+        with self._init_lock:
+            if not self._initialised:
+                self._create_schema(conn)
+                self._migrate_legacy_json(conn)
+                self._initialised = True
+        return conn
 
+    def _create_schema(self, conn):
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS submissions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                submission_id TEXT,
+                timestamp TEXT,
+                name TEXT,
+                email TEXT,
+                phone TEXT,
+                company TEXT,
+                service TEXT,
+                budget TEXT,
+                message TEXT,
+                email_sent INTEGER NOT NULL DEFAULT 0,
+                data TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE INDEX IF NOT EXISTS submissions_timestamp ON submissions (timestamp);
+            CREATE INDEX IF NOT EXISTS submissions_service ON submissions (service, timestamp);
+            CREATE INDEX IF NOT EXISTS submissions_email ON submissions (email COLLATE NOCASE, timestamp);
+            CREATE INDEX IF NOT EXISTS submissions_email_sent ON submissions (email_sent, timestamp);
+            """
+        )
 
-def validate_email(email):
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    return re.match(pattern, email) is not None
+    def _migrate_legacy_json(self, conn):
+        if not self.legacy_json_path or not os.path.exists(self.legacy_json_path):
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            done = conn.execute("SELECT value FROM meta WHERE key = 'legacy_json_migrated'").fetchone()
+            if done is None:
+                with open(self.legacy_json_path, "r") as f:
+                    legacy = json.load(f)
+                for submission in legacy:
+                    self._insert(conn, submission)
+                conn.execute(
+                    "INSERT INTO meta (key, value) VALUES ('legacy_json_migrated', ?)",
+                    (f"{len(legacy)} rows from {self.legacy_json_path}",),
+                )
+                log_event("submissions.migrated", rows=len(legacy), path=self.legacy_json_path)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
 
+    def _insert(self, conn, submission):
+        values = [submission.get("id" if column == "submission_id" else column) for column in self.COLUMNS]
+        values[-1] = int(bool(values[-1]))
+        return conn.execute(
+            f"INSERT INTO submissions ({', '.join(self.COLUMNS)}, data) VALUES ({', '.join('?' * (len(self.COLUMNS) + 1))})",
+            values + [json.dumps(submission)],
+        )
 
-def load_services_data():
-    """Load services data from JSON file"""
-    try:
-        with open("app/data/services.json", "r") as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return {
-            "business_process_management": {
-                "title": "Business Process Management (BPM)",
-                "services": [
-                    "Title & Appraisal Services",
-                    "Tax Services",
-                    "Vendor Management",
-                    "Document Indexing",
-                    "Title Curative",
-                    "Order Entry, QC, and Data Entry",
-                ],
-            },
-            "mortgage_real_estate": {
-                "title": "Mortgage & Real Estate Services",
-                "services": [
-                    "Pre-processing, Processing & Underwriting",
-                    "Title Search & Closing Support",
-                    "Post-closing Audit",
-                    "Property & Lien Search",
-                    "Loan Boarding",
-                    "Appraisal Review",
-                ],
-            },
-        }
+    def append(self, submission):
+        """Durably append one submission and return its row id"""
+        conn = self._connect()
+        with metrics.time("submission_save"):
+            row_id = self._insert(conn, submission).lastrowid
+        self._writes += 1
+        if self.checkpoint_every and self._writes % self.checkpoint_every == 0:
+            self.compact()
+        return row_id
 
+    def update(self, row_ids, **fields):
+        """Set fields on already-saved submissions, keeping the indexed columns and the JSON copy in sync"""
+        assignments, params = [], []
+        for key, value in fields.items():
+            if key in self.COLUMNS:
+                assignments.append(f"{key} = ?")
+                params.append(int(bool(value)) if key == "email_sent" else value)
+        json_paths = ", ".join("?, json(?)" for _ in fields)
+        assignments.append(f"data = json_set(data, {json_paths})")
+        for key, value in fields.items():
+            params.extend([f"$.{key}", json.dumps(value)])
+        placeholders = ", ".join("?" * len(row_ids))
+        self._connect().execute(
+            f"UPDATE submissions SET {', '.join(assignments)} WHERE id IN ({placeholders})",
+            params + list(row_ids),
+        )
 
-def load_services_detail():
-    """Load detailed services data from JSON file"""
-    try:
-        with open("app/data/services_detail.json", "r") as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return {}
+    def compact(self):
+        """Fold the WAL back into the main database file and truncate it"""
+        self._connect().execute("PRAGMA wal_checkpoint(TRUNCATE)")
 
+    def count(self):
+        return self._connect().execute("SELECT COUNT(*) FROM submissions").fetchone()[0]
 
-def load_blogs():
-    """Load blogs data from JSON file"""
-    try:
-        with open("app/data/blogs.json", "r") as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return {}
+    def iter_all(self):
+        for row in self._connect().execute("SELECT data FROM submissions ORDER BY id"):
+            yield json.loads(row["data"])
 
+    @staticmethod
+    def _where(filters):
+        clauses, params = [], []
+        if filters.get("service"):
+            clauses.append("service = ?")
+            params.append(filters["service"])
+        if filters.get("email"):
+            clauses.append("email = ? COLLATE NOCASE")
+            params.append(filters["email"])
+        if filters.get("email_sent") is not None:
+            clauses.append("email_sent = ?")
+            params.append(int(filters["email_sent"]))
+        # Timestamps are stored as "YYYY-MM-DD HH:MM:SS", so string order is time order
+        if filters.get("date_from"):
+            clauses.append("timestamp >= ?")
+            params.append(filters["date_from"].strftime("%Y-%m-%d"))
+        if filters.get("date_to"):
+            clauses.append("timestamp < ?")
+            params.append(f"{filters['date_to'].strftime('%Y-%m-%d')}\x7f")
+        return clauses, params
 
-def load_leadership():
-    """Load leadership team data from JSON file"""
-    try:
-        with open("app/data/leadership.json", "r") as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return {"team_members": [], "company_values": []}
+    def page(self, filters, limit=50, cursor=None):
+        """One page of submissions (newest first) and the cursor of the next page, or None on the last"""
+        clauses, params = self._where(filters)
+        if cursor:
+            try:
+                timestamp, _, row_id = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8").rpartition("|")
+                params += [timestamp, int(row_id)]
+            except ValueError:
+                raise BadRequest("Invalid cursor")
+            clauses.append("(timestamp, id) < (?, ?)")
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._connect().execute(
+            f"SELECT id, timestamp, data FROM submissions {where} ORDER BY timestamp DESC, id DESC LIMIT ?",
+            params + [limit + 1],
+        ).fetchall()
+        next_cursor = None
+        if len(rows) > limit:
+            last = rows[limit - 1]
+            next_cursor = base64.urlsafe_b64encode(f"{last['timestamp']}|{last['id']}".encode("utf-8")).decode("ascii")
+        return [json.loads(row["data"]) for row in rows[:limit]], next_cursor
 
+    def iter_filtered(self, filters, batch_size=500):
+        """Every matching submission, newest first, fetched a page at a time"""
+        cursor = None
+        while True:
+            rows, cursor = self.page(filters, limit=batch_size, cursor=cursor)
+            yield from rows
+            if cursor is None:
+                return
 
-def load_case_studies():
-    """Load case studies data from JSON file"""
+
+submission_store = SubmissionStore(
+    os.environ.get("SUBMISSIONS_DB", os.path.join(app.root_path, "app", "data", "contact_submissions.db")),
+    fallback_path=os.path.join(tempfile.gettempdir(), "contact_submissions.db"),
+    legacy_json_path=os.path.join(app.root_path, "app", "data", "contact_submissions.json"),
+)
+
+
+@mail_queue.on_delivery
+def record_notification_delivery(tag, delivered):
+    """Flip email_sent on the submissions a delivered admin notification covered"""
+    if tag.get("submissions"):
+        submission_store.update(tag["submissions"], email_sent=delivered)
+
+
+# ==========================================================================
+# Admin notification digest
+# ==========================================================================
+class NotificationDigest:
+    """Admin notifications buffered and sent as one email per recipient every N minutes or M items
+
+    Pending notifications sit in a SQLite file shared by every worker. A
+    flush claims and deletes the batch in one short transaction, so
+    overlapping flushes never send an item twice, then mails it with no lock
+    held; the items of a recipient whose digest fails are put back and
+    retried after another interval. A batch is identified by the id of its first
+    row, so the timer of a batch already flushed at ``max_items`` is ignored.
+    """
+
+    def __init__(self, path, interval_seconds=900, max_items=50, attachments=("csv",)):
+        self.path = path
+        self.interval_seconds = interval_seconds
+        self.max_items = max_items
+        self.attachments = attachments
+        self._local = threading.local()
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS pending (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    kind TEXT NOT NULL,
+                    recipient TEXT NOT NULL,
+                    subject TEXT NOT NULL,
+                    body TEXT NOT NULL,
+                    record TEXT NOT NULL,
+                    created REAL NOT NULL,
+                    tag TEXT
+                )
+                """
+            )
+            if "tag" not in {column["name"] for column in conn.execute("PRAGMA table_info(pending)")}:
+                conn.execute("ALTER TABLE pending ADD COLUMN tag TEXT")
+            self._local.conn = conn
+        return conn
+
+    def add(self, kind, recipient, subject, body, record, tag=None):
+        """Buffer one notification; returns how many are now pending
+
+        ``tag`` is a dict of lists, merged across the digest and passed to send_mail().
+        """
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row_id = conn.execute(
+                "INSERT INTO pending (kind, recipient, subject, body, record, created, tag) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (kind, recipient, subject, body, json.dumps(record, default=str), time.time(), json.dumps(tag) if tag else None),
+            ).lastrowid
+            pending = conn.execute("SELECT COUNT(*) FROM pending").fetchone()[0]
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        if pending == 1:
+            # The first item of a batch starts its clock
+            scheduler.schedule("admin_digest", self.interval_seconds, batch=row_id)
+        if pending >= self.max_items:
+            self.flush()
+        return pending
+
+    def pending(self):
+        return self._connect().execute("SELECT COUNT(*) FROM pending").fetchone()[0]
+
+    def flush(self, batch=None):
+        """Mail everything pending, one digest per recipient; returns the number of notifications sent
+
+        With ``batch``, only flush if that batch is still the one pending.
+        """
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            rows = conn.execute("SELECT * FROM pending ORDER BY id").fetchall()
+            if batch is not None and (not rows or rows[0]["id"] != batch):
+                rows = []
+            if rows:
+                conn.execute("DELETE FROM pending WHERE id <= ?", (rows[-1]["id"],))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+        # Sent outside the transaction: inline SMTP would otherwise hold every worker's write lock
+        batches = {}
+        for row in rows:
+            batches.setdefault(row["recipient"], []).append(row)
+        failed = []
+        for recipient, items in batches.items():
+            try:
+                send_mail(self.build_message(recipient, items), tag=self.merge_tags(items))
+            except Exception as e:
+                log_event("digest.send_failed", logging.WARNING, notifications=len(items), error=str(e))
+                failed.extend(items)
+        if failed:
+            self.restore(failed)
+        return len(rows) - len(failed)
+
+    def restore(self, rows):
+        """Put claimed rows back under their original ids and give them a fresh timer"""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(
+                "INSERT INTO pending (id, kind, recipient, subject, body, record, created, tag) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [tuple(row[column] for column in ("id", "kind", "recipient", "subject", "body", "record", "created", "tag")) for row in rows],
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        # Restored ids predate anything added meanwhile, so this batch id is the oldest pending row
+        scheduler.schedule("admin_digest", self.interval_seconds, batch=min(row["id"] for row in rows))
+
+    @staticmethod
+    def merge_tags(items):
+        merged = {}
+        for item in items:
+            for key, values in json.loads(item["tag"] or "{}").items():
+                merged.setdefault(key, []).extend(values)
+        return merged or None
+
+    def build_message(self, recipient, items):
+        counts = Counter(item["kind"] for item in items)
+        summary = ", ".join(f"{kind}: {count}" for kind, count in sorted(counts.items()))
+        first = datetime.fromtimestamp(items[0]["created"]).strftime("%Y-%m-%d %H:%M")
+        last = datetime.fromtimestamp(items[-1]["created"]).strftime("%Y-%m-%d %H:%M")
+        sections = [f"Website submissions received between {first} and {last} ({summary})."]
+        for number, item in enumerate(items, start=1):
+            heading = f"[{number}] {item['subject']}"
+            sections.append(f"{heading}\n{'=' * len(heading)}\n{item['body'].strip()}")
+        msg = mail_message(
+            subject=f"Website digest: {len(items)} new submission{'s' if len(items) != 1 else ''} ({summary})",
+            recipients=[recipient],
+            body="\n\n".join(sections) + "\n",
+        )
+        stamp = datetime.fromtimestamp(items[-1]["created"]).strftime("%Y%m%d-%H%M")
+        for filename, content_type, data in self.attachment_files(items, stamp):
+            msg.attach(filename, content_type, data)
+        return msg
+
+    def attachment_files(self, items, stamp):
+        """The batch as one CSV per kind and/or a single JSON file, per ``attachments``"""
+        records = [
+            {"kind": item["kind"], "received": datetime.fromtimestamp(item["created"]).isoformat(timespec="seconds"), **json.loads(item["record"])}
+            for item in items
+        ]
+        if "csv" in self.attachments:
+            for kind in sorted({record["kind"] for record in records}):
+                rows = [record for record in records if record["kind"] == kind]
+                columns = list(dict.fromkeys(key for row in rows for key in row))
+                out = io.StringIO()
+                writer = csv.DictWriter(out, fieldnames=columns)
+                writer.writeheader()
+                writer.writerows(csv_safe(row) for row in rows)
+                yield f"{kind}-{stamp}.csv", "text/csv", out.getvalue().encode("utf-8")
+        if "json" in self.attachments:
+            yield f"submissions-{stamp}.json", "application/json", json.dumps(records, indent=2).encode("utf-8")
+
+
+app.config["DIGEST_ENABLED"] = env_bool("DIGEST_ENABLED", False)
+# Contact enquiries for these services are always mailed straight away
+app.config["DIGEST_IMMEDIATE_SERVICES"] = {
+    service.strip().lower() for service in os.environ.get("DIGEST_IMMEDIATE_SERVICES", "").split(",") if service.strip()
+}
+notification_digest = NotificationDigest(
+    os.environ.get("DIGEST_DB", os.path.join(tempfile.gettempdir(), "admin_digest.db")),
+    interval_seconds=float(os.environ.get("DIGEST_INTERVAL_MINUTES", "15")) * 60,
+    max_items=int(os.environ.get("DIGEST_MAX_ITEMS", "50")),
+    attachments=[fmt.strip().lower() for fmt in os.environ.get("DIGEST_ATTACHMENTS", "csv").split(",") if fmt.strip()],
+)
+
+
+@scheduler.handler("admin_digest")
+def flush_admin_digest(batch=None):
+    """Send the digest once its interval is up, unless that batch was already flushed"""
     try:
-        with open("app/data/case_studies.json", "r") as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return {}
+        with app.app_context():
+            sent = notification_digest.flush(batch=batch)
+    except Exception:
+        # The batch could not be claimed and stays pending; new items won't start another clock, so restart this one
+        scheduler.schedule("admin_digest", notification_digest.interval_seconds, batch=batch)
+        raise
+    if sent:
+        log_event("digest.sent", notifications=sent)
+
+
+def notification_delivery(immediate=False):
+    """How notify_admin() hands a notification off: queued (mail queue), sent (inline) or digest"""
+    if not immediate and app.config["DIGEST_ENABLED"]:
+        return "digest"
+    return "queued" if app.config["MAIL_QUEUE_ENABLED"] else "sent"
+
+
+def notify_admin(kind, recipient, subject, body, record, reply_to=None, immediate=False, tag=None):
+    """Mail an admin notification now, or add it to the digest; returns notification_delivery()'s mode"""
+    delivery = notification_delivery(immediate)
+    if delivery == "digest":
+        notification_digest.add(kind, recipient, subject, body, record, tag=tag)
+    else:
+        send_mail(mail_message(subject=subject, recipients=[recipient], reply_to=reply_to, body=body), tag=tag)
+    return delivery
+
+
+# Fingerprinted assets written by build_assets.py
+static_manifest = ContentStore(os.path.join(app.static_folder, "dist"))
+app.config["STATIC_FINGERPRINT"] = env_bool("STATIC_FINGERPRINT", True)
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+
+
+# Self-hosted third-party assets written by vendor_assets.py
+vendor_manifest = ContentStore(os.path.join(app.static_folder, "vendor"))
+
+
+@app.template_global()
+def vendored(name):
+    return vendor_manifest.get_item("vendor", name) is not None
+
+
+@app.template_global()
+def vendor_url(name, fallback):
+    """URL of a vendored asset, or the pinned CDN URL when it has not been vendored"""
+    entry = vendor_manifest.get_item("vendor", name)
+    if entry is None:
+        return fallback
+    return url_for("static", filename=entry["path"])
+
+
+# Resized WebP/AVIF derivatives written by build_images.py
+image_manifest = ContentStore(os.path.join(app.static_folder, "images", "derived"))
+IMAGE_TYPES = {"avif": "image/avif", "webp": "image/webp"}
+
+
+@app.template_global()
+def responsive_image(filename, alt, sizes="100vw", **attrs):
+    """<picture> with AVIF/WebP srcsets for an image under static/, or a plain <img> when none were built"""
+    if filename.startswith("/static/"):
+        filename = filename[len("/static/"):]
+    entry = image_manifest.get_item("images", filename)
+
+    attrs.setdefault("loading", "lazy")
+    attrs.setdefault("decoding", "async")
+    if entry:
+        attrs.setdefault("width", entry["width"])
+        attrs.setdefault("height", entry["height"])
+    html_attrs = "".join(
+        f' {name.rstrip("_").replace("_", "-")}="{escape(value)}"'
+        for name, value in attrs.items() if value is not None
+    )
+    img = f'<img src="{escape(url_for("static", filename=filename))}" alt="{escape(alt)}"{html_attrs}>'
+    if not entry:
+        return Markup(img)
+
+    sources = []
+    for fmt, mimetype in IMAGE_TYPES.items():
+        variants = entry["variants"].get(fmt)
+        if not variants:
+            continue
+        srcset = ", ".join(
+            f'{url_for("static", filename=variant["path"])} {variant["width"]}w' for variant in variants
+        )
+        sources.append(f'<source type="{mimetype}" srcset="{escape(srcset)}" sizes="{escape(sizes)}">')
+    return Markup(f"<picture>{''.join(sources)}{img}</picture>")
+
+
+def asset_versions():
+    """Versions of the build manifests that change the URLs emitted into rendered pages"""
+    return (
+        static_manifest.version("manifest"),
+        vendor_manifest.version("vendor"),
+        image_manifest.version("images"),
+    )
+
+
+@app.url_defaults
+def fingerprint_static_urls(endpoint, values):
+    """Point url_for('static', ...) at the fingerprinted build output when there is one"""
+    if endpoint != "static" or not app.config["STATIC_FINGERPRINT"]:
+        return
+    built = static_manifest.get_item("manifest", values.get("filename"))
+    if built:
+        values["filename"] = built["path"]
+
+
+def send_static_asset(filename):
+    """Serve static files, picking a precompressed sibling for fingerprinted build output"""
+    if not filename.startswith("dist/"):
+        return app.send_static_file(filename)
+
+    variants = {"identity": filename}
+    for encoding, suffix in (("br", ".br"), ("gzip", ".gz")):
+        if os.path.isfile(os.path.join(app.static_folder, filename + suffix)):
+            variants[encoding] = filename + suffix
+    encoding = negotiate_encoding(variants)
+
+    response = send_from_directory(
+        app.static_folder,
+        variants[encoding],
+        mimetype=mimetypes.guess_type(filename)[0] or "application/octet-stream",
+        max_age=IMMUTABLE_MAX_AGE,
+    )
+    if encoding != "identity":
+        response.headers["Content-Encoding"] = encoding
+    response.vary.add("Accept-Encoding")
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
+
+
+app.view_functions["static"] = send_static_asset
+
+
+app.config["START_BACKGROUND_WORKERS"] = env_bool("START_BACKGROUND_WORKERS", True)
+
+
+@app.before_request
+def start_background_workers():
+    """Start the scheduler and mail workers in the serving process, replaying anything spooled"""
+    if not app.config["START_BACKGROUND_WORKERS"]:
+        return
+    scheduler.start()
+    mail_queue.start()
 
 
 # Routes
 @app.route("/")
+@cached_page("home.html")
 def home():
     """Home page with company overview and highlights"""
     return render_template(
@@ -147,6 +3194,7 @@ def home():
 
 
 @app.route("/about")
+@cached_page("about.html")
 def about():
     """About us page with company information"""
     return render_template(
@@ -157,9 +3205,10 @@ def about():
 
 
 @app.route("/services")
+@conditional_get("services.html", "services")
 def services():
     """Services overview page"""
-    services_data = load_services_data()
+    services_data = load_service_categories()
     return render_template(
         "services.html",
         services_data=services_data,
@@ -169,9 +3218,10 @@ def services():
 
 
 @app.route("/services/<service_category>")
+@conditional_get("service_detail.html", "services")
 def service_detail(service_category):
     """Individual service category page"""
-    services_data = load_services_data()
+    services_data = load_service_categories()
 
     if service_category not in services_data:
         return render_template("404.html"), 404
@@ -181,29 +3231,29 @@ def service_detail(service_category):
         "service_detail.html",
         service=service,
         service_key=service_category,
-        title=f"{service['title']} - Ardur Technology LLC",
-        meta_description=f"Professional {service['title'].lower()} services by Ardur Technology LLC.",
+        title=f"{service.title} - Ardur Technology LLC",
+        meta_description=f"Professional {service.title.lower()} services by Ardur Technology LLC.",
     )
 
 
 @app.route("/service/<service_slug>")
+@conditional_get("service_page.html", "services_detail", key_arg="service_slug")
 def service_page(service_slug):
     """Individual service detail page with dynamic content"""
-    services_detail = load_services_detail()
-    
-    if service_slug not in services_detail:
+    service = content_store.record("services_detail", service_slug)
+    if service is None:
         return render_template("404.html"), 404
-    
-    service = services_detail[service_slug]
+
     return render_template(
         "service_page.html",
         service=service,
-        title=f"{service['title']} - Ardur Technology LLC",
-        meta_description=f"{service.get('subtitle', '')} - Professional services by Ardur Technology LLC.",
+        title=f"{service.title} - Ardur Technology LLC",
+        meta_description=f"{service.subtitle} - Professional services by Ardur Technology LLC.",
     )
 
 
 @app.route("/industries")
+@cached_page("industries.html")
 def industries():
     """Industries we serve"""
     return render_template(
@@ -214,6 +3264,7 @@ def industries():
 
 
 @app.route("/blogs")
+@conditional_get("blogs.html", "blogs")
 def blogs():
     """Blog listing page"""
     blogs_data = load_blogs()
@@ -226,25 +3277,19 @@ def blogs():
 
 
 @app.route("/blog/<blog_slug>")
+@conditional_get("blog_detail.html", "blogs", also=("services_detail", "case_studies"))
 def blog_detail(blog_slug):
     """Individual blog post detail page"""
-    blogs_data = load_blogs()
-    
-    if blog_slug not in blogs_data:
+    blog = content_store.record("blogs", blog_slug)
+    if blog is None:
         return render_template("404.html"), 404
-    
-    blog = blogs_data[blog_slug]
-    
-    # Get 3 related blogs (excluding current one)
-    related_blogs = {k: v for k, v in list(blogs_data.items()) if k != blog_slug}
-    related_blogs = dict(list(related_blogs.items())[:3])
-    
+
     return render_template(
         "blog_detail.html",
         blog=blog,
-        related_blogs=related_blogs,
-        title=f"{blog['title']} - Ardur Technology LLC",
-        meta_description=blog.get('excerpt', '')[:160],
+        related=related_items("blogs", blog_slug),
+        title=f"{blog.title} - Ardur Technology LLC",
+        meta_description=blog.excerpt[:160],
     )
 
 
@@ -260,19 +3305,21 @@ def careers():
 
 
 @app.route("/leadership")
+@cached_page("leadership.html", data=("leadership",))
 def leadership():
     """Leadership team page"""
     leadership_data = load_leadership()
     return render_template(
         "leadership.html",
-        team_members=leadership_data.get("team_members", []),
-        company_values=leadership_data.get("company_values", []),
+        team_members=leadership_data.team_members,
+        company_values=leadership_data.company_values,
         title="Leadership Team - Ardur Technology LLC",
         meta_description="Meet the leadership team at Ardur Technology LLC. Experienced professionals driving innovation in business process management.",
     )
 
 
 @app.route("/case-studies")
+@conditional_get("case_studies.html", "case_studies")
 def case_studies():
     """Case studies listing page"""
     case_studies_data = load_case_studies()
@@ -285,21 +3332,19 @@ def case_studies():
 
 
 @app.route("/case-study/<study_slug>")
+@conditional_get("case_study_detail.html", "case_studies", also=("blogs", "services_detail"))
 def case_study_detail(study_slug):
     """Individual case study detail page"""
-    case_studies_data = load_case_studies()
-    
-    if study_slug not in case_studies_data:
+    case_study = content_store.record("case_studies", study_slug)
+    if case_study is None:
         return render_template("404.html"), 404
-    
-    case_study = case_studies_data[study_slug]
-    
+
     return render_template(
         "case_study_detail.html",
         case_study=case_study,
-        case_studies=case_studies_data,
-        title=f"{case_study['title']} - Case Study | Ardur Technology LLC",
-        meta_description=case_study.get('subtitle', '')[:160],
+        related=related_items("case_studies", study_slug),
+        title=f"{case_study.title} - Case Study | Ardur Technology LLC",
+        meta_description=case_study.subtitle[:160],
     )
 
 
@@ -324,17 +3369,22 @@ def apply_job():
         resume_filename = None
         if "resume" in request.files:
             file = request.files["resume"]
-            if file and file.filename and allowed_file(file.filename):
-                filename = secure_filename(file.filename)
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_")
-                resume_filename = timestamp + filename
-                file.save(os.path.join(app.config["UPLOAD_FOLDER"], resume_filename))
+            if file and file.filename and isinstance(file.stream, StreamingUpload):
+                # finish() may still raise UploadRejected, which upload_rejected() turns into a flash
+                resume_filename = f"{file.stream.finish()} (uploaded as {file.stream.filename})"
 
         # Send email notification
         try:
-            msg = Message(
+            submitted_on = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            delivery = notify_admin(
+                "application",
+                "info@ardurtechnology.com",
                 subject=f"New Job Application - {request.form.get('position')}",
-                recipients=["info@ardurtechnology.com"],
+                record={
+                    **{field: request.form.get(field, "") for field in ("name", "email", "phone", "position", "experience", "cover_letter")},
+                    "resume": resume_filename or "",
+                    "timestamp": submitted_on,
+                },
                 body=f"""
                 New job application received:
 
@@ -346,12 +3396,13 @@ def apply_job():
                 Cover Letter: {request.form.get("cover_letter", "No cover letter provided")}
                 Resume: {resume_filename if resume_filename else "No resume uploaded"}
 
-                Submitted on: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+                Submitted on: {submitted_on}
                 """,
             )
-            mail.send(msg)
+            log_event("careers.application_sent", position=request.form.get("position"), delivery=delivery)
             flash("Your application has been submitted successfully!", "success")
         except Exception as e:
+            log_event("careers.mail_failed", level=logging.WARNING, error=str(e))
             flash(
                 "There was an error submitting your application. Please try again.",
                 "error",
@@ -361,6 +3412,7 @@ def apply_job():
 
 
 @app.route("/contact")
+@cached_page("contact.html")
 def contact():
     """Contact us page"""
     return render_template(
@@ -374,15 +3426,12 @@ def contact():
 def contact_form():
     """Handle contact form submissions"""
     if request.method == "POST":
-        # Log all form data for debugging
-        print("\n" + "="*50)
-        print("📧 CONTACT FORM SUBMISSION RECEIVED")
-        print("="*50)
-        for key, value in request.form.items():
-            if key != 'csrf_token':  # Don't log CSRF token
-                print(f"  {key}: {value}")
-        print("="*50 + "\n")
-        
+        log_event(
+            "contact.received",
+            level=logging.DEBUG,
+            form={key: value for key, value in request.form.items() if key != "csrf_token"},
+        )
+
         # Get name from first_name and last_name fields
         first_name = request.form.get("first_name", "").strip()
         last_name = request.form.get("last_name", "").strip()
@@ -390,34 +3439,34 @@ def contact_form():
         
         # Validate required fields (matching HTML form)
         if not first_name:
-            print("❌ Validation Error: First name is required")
+            log_event("contact.invalid", field="first_name", reason="required")
             flash("First name is required", "error")
             return redirect(url_for("contact"))
             
         if not last_name:
-            print("❌ Validation Error: Last name is required")
+            log_event("contact.invalid", field="last_name", reason="required")
             flash("Last name is required", "error")
             return redirect(url_for("contact"))
 
         email = request.form.get("email", "").strip()
         if not email:
-            print("❌ Validation Error: Email is required")
+            log_event("contact.invalid", field="email", reason="required")
             flash("Email is required", "error")
             return redirect(url_for("contact"))
 
         message = request.form.get("message", "").strip()
         if not message:
-            print("❌ Validation Error: Message is required")
+            log_event("contact.invalid", field="message", reason="required")
             flash("Message is required", "error")
             return redirect(url_for("contact"))
 
         # Validate email format
         if not validate_email(email):
-            print(f"❌ Validation Error: Invalid email format - {email}")
+            log_event("contact.invalid", field="email", reason="format", email=email)
             flash("Please enter a valid email address", "error")
             return redirect(url_for("contact"))
 
-        print("✅ All validations passed!")
+        log_event("contact.valid", level=logging.DEBUG)
         
         # Get optional fields
         company = request.form.get("company", "Not specified")
@@ -446,15 +3495,27 @@ def contact_form():
             or "info@ardurtechnology.com"
         )
 
-        # Try to send email
-        email_sent = False
-        auto_reply_sent = False
+        # Always record the submission first, so a failed notification can't lose it;
+        # email_sent is flipped by the mail queue once the notification is delivered
+        row_id = None
+        try:
+            row_id = submission_store.append(submission)
+            log_event("contact.saved", path=submission_store.path, row_id=row_id)
+        except Exception:
+            log.exception("contact.save_failed")
+
+        notified = False
+        updates = {}
         try:
-            print("📤 Attempting to send email...")
-            msg = Message(
+            log_event("contact.mail_sending", level=logging.DEBUG, service=request.form.get("service"))
+            delivery = notify_admin(
+                "contact",
+                admin_email,
                 subject=f"New Contact Form Submission from {full_name}",
-                recipients=[admin_email],
                 reply_to=email,
+                record={key: value for key, value in submission.items() if key != "email_sent"},
+                immediate=service.strip().lower() in app.config["DIGEST_IMMEDIATE_SERVICES"],
+                tag={"submissions": [row_id]} if row_id is not None else None,
                 body=f"""
 New contact form submission from Ardur Technology website:
 
@@ -478,126 +3539,47 @@ MESSAGE
 Submitted on: {submission['timestamp']}
                 """,
             )
-            mail.send(msg)
-            email_sent = True
-            submission["email_sent"] = True
-            print("✅ Email sent successfully!")
+            notified = True
+            updates["notification"] = delivery
+            log_event("contact.mail_handed_off", delivery=delivery)
 
             try:
                 delay_seconds = int(os.environ.get("AUTO_REPLY_DELAY_SECONDS", "300"))
 
-                def send_delayed_auto_reply(app_obj, recipient_email, recipient_name, admin_email_addr, delay_s):
-                    try:
-                        time.sleep(max(0, delay_s))
-                        with app_obj.app_context():
-                            reply_subject = "We received your inquiry - Ardur Technology LLC"
-                            reply_text = (
-                                f"Hello {recipient_name or 'there'},\n\n"
-                                "Thank you for contacting Ardur Technology LLC. We have received your inquiry and our team will respond soon.\n\n"
-                                "Regards,\n"
-                                "Ardur Technology LLC\n"
-                                "https://ardurtechnology.com"
-                            )
-                            logo_cid = "ardur-technology-logo"
-                            reply_html = f"""
-<div style=\"font-family: Arial, Helvetica, sans-serif; color: #0f172a; line-height: 1.6;\">
-  <p style=\"margin: 0 0 12px;\">Hello {recipient_name or 'there'},</p>
-  <p style=\"margin: 0 0 12px;\">
-    Thank you for contacting <strong>Ardur Technology LLC</strong>. We have received your inquiry and a member of our team will respond shortly.
-  </p>
-  <p style=\"margin: 0 0 16px;\">Regards,<br/>Ardur Technology LLC</p>
-  <div style=\"margin-top: 18px; padding-top: 14px; border-top: 1px solid #e2e8f0; display: flex; align-items: center; gap: 12px;\">
-    <img src=\"cid:{logo_cid}\" alt=\"Ardur Technology\" style=\"height: 36px; width: auto; display: block;\" />
-    <div style=\"font-size: 12px; color: #475569;\">
-      <div><strong>Ardur Technology LLC</strong></div>
-      <div>Las Vegas, Nevada, USA</div>
-      <div><a href=\"mailto:{admin_email_addr}\" style=\"color: #2563eb; text-decoration: none;\">{admin_email_addr}</a></div>
-    </div>
-  </div>
-</div>
-                            """
-
-                            reply_msg = Message(
-                                subject=reply_subject,
-                                recipients=[recipient_email],
-                                body=reply_text,
-                                html=reply_html,
-                            )
-
-                            try:
-                                logo_path = os.path.join(app_obj.static_folder, "images", "logo.png")
-                                with open(logo_path, "rb") as f:
-                                    reply_msg.attach(
-                                        "logo.png",
-                                        "image/png",
-                                        f.read(),
-                                        "inline",
-                                        headers=[["Content-ID", f"<{logo_cid}>"]],
-                                    )
-                            except Exception as e:
-                                print(f"⚠️ Logo attachment failed: {str(e)}")
-
-                            mail.send(reply_msg)
-                            print("✅ Auto-reply sent successfully!")
-                    except Exception as e:
-                        print(f"⚠️ Auto-reply failed: {str(e)}")
-
-                threading.Thread(
-                    target=send_delayed_auto_reply,
-                    args=(app, email, full_name, admin_email, delay_seconds),
-                    daemon=True,
-                ).start()
-
-                auto_reply_sent = True
-                submission["auto_reply_queued"] = True
-                submission["auto_reply_delay_seconds"] = delay_seconds
-                print(f"⏳ Auto-reply queued (delay: {delay_seconds}s)")
+                scheduler.schedule(
+                    "auto_reply",
+                    delay_seconds,
+                    recipient_email=email,
+                    recipient_name=full_name,
+                    admin_email_addr=admin_email,
+                )
+
+                updates.update(auto_reply_queued=True, auto_reply_delay_seconds=delay_seconds)
+                log_event("contact.auto_reply_scheduled", delay_seconds=delay_seconds)
             except Exception as e:
-                print(f"⚠️ Auto-reply scheduling failed: {str(e)}")
+                log_event("contact.auto_reply_failed", level=logging.WARNING, error=str(e))
         except Exception as e:
-            print(f"⚠️ Email sending failed: {str(e)}")
-            print("📁 Saving submission to local file as backup...")
-        
-        # Always save to JSON file as backup
-        try:
-            submissions_file = "app/data/contact_submissions.json"
-            fallback_submissions_file = os.path.join(tempfile.gettempdir(), "contact_submissions.json")
-            
-            # Load existing submissions or create new list
-            try:
-                with open(submissions_file, "r") as f:
-                    submissions = json.load(f)
-            except (FileNotFoundError, json.JSONDecodeError):
-                submissions = []
-            
-            # Add new submission
-            submissions.append(submission)
-            
-            # Save back to file (fallback to temp if app/data is not writable)
+            updates["notification"] = "failed"
+            log_event("contact.mail_failed", level=logging.WARNING, error=str(e))
+
+        if row_id is not None:
             try:
-                with open(submissions_file, "w") as f:
-                    json.dump(submissions, f, indent=2)
-                saved_path = submissions_file
-            except OSError:
-                with open(fallback_submissions_file, "w") as f:
-                    json.dump(submissions, f, indent=2)
-                saved_path = fallback_submissions_file
-            
-            print(f"✅ Submission saved to {saved_path}")
-            
-            # Show success message to user
-            if email_sent:
-                flash(
-                    "Your message has been sent successfully! We will get back to you soon.",
-                    "success",
-                )
-            else:
-                flash(
-                    "Your message has been received! We will get back to you soon.",
-                    "success",
-                )
-        except Exception as e:
-            print(f"❌ Failed to save submission: {str(e)}")
+                submission_store.update([row_id], **updates)
+            except Exception:
+                log.exception("contact.update_failed")
+
+        # Show success message to user
+        if notified:
+            flash(
+                "Your message has been sent successfully! We will get back to you soon.",
+                "success",
+            )
+        elif row_id is not None:
+            flash(
+                "Your message has been received! We will get back to you soon.",
+                "success",
+            )
+        else:
             flash(
                 "There was an error processing your message. Please try again or contact us directly at info@ardurtechnology.com",
                 "error",
@@ -606,16 +3588,182 @@ Submitted on: {submission['timestamp']}
         return redirect(url_for("contact"))
 
 @app.route("/privacy-policy")
+@cached_page("privacy_policy.html")
 def privacy_policy():
     return render_template("privacy_policy.html")
 
+@app.route("/search")
+def search():
+    """Full-text search results page"""
+    query = request.args.get("q", "").strip()[:SEARCH_MAX_QUERY]
+    results = search_content(query, limit=20) if query else []
+    return render_template(
+        "search.html",
+        query=query,
+        results=results,
+        title=f"Search: {query} - Ardur Technology LLC" if query else "Search - Ardur Technology LLC",
+        meta_description="Search Ardur Technology LLC services, blog articles and case studies.",
+    )
+
 # API Routes
+@app.route("/api/search")
+def api_search():
+    """Search API for type-ahead; the last word is matched as a prefix unless prefix=0"""
+    query = request.args.get("q", "")[:SEARCH_MAX_QUERY]
+    limit = max(1, min(request.args.get("limit", 8, type=int), 50))
+    prefix = request.args.get("prefix", "1") != "0"
+    started = time.perf_counter()
+    results = search_content(query, limit=limit, prefix=prefix)
+    return jsonify({
+        "query": query,
+        "took_ms": round((time.perf_counter() - started) * 1000, 3),
+        "results": [
+            {key: str(hit[key]) if key == "snippet" else hit[key] for key in ("type", "title", "url", "snippet", "score")}
+            for hit in results
+        ],
+    })
+
+
 @app.route("/api/services")
+@conditional_get(None, "services")
 def api_services():
     """API endpoint for services data"""
     return jsonify(load_services_data())
 
 
+# Admin
+# HTTP Basic auth; the admin pages do not exist at all until ADMIN_PASSWORD is set
+app.config["ADMIN_USERNAME"] = os.environ.get("ADMIN_USERNAME", "admin")
+app.config["ADMIN_PASSWORD"] = os.environ.get("ADMIN_PASSWORD")
+ADMIN_PAGE_SIZE = 50
+ADMIN_MAX_PAGE_SIZE = 500
+SUBMISSION_EXPORT_COLUMNS = (
+    "id", "timestamp", "name", "email", "phone", "company", "service", "budget", "message",
+    "notification", "email_sent", "auto_reply_queued",
+)
+
+
+def admin_required(view):
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        password = app.config["ADMIN_PASSWORD"]
+        if not password:
+            abort(404)
+        auth = request.authorization
+        given = (auth.username or "", auth.password or "") if auth is not None and auth.type == "basic" else ("", "")
+        # Both fields are always compared, so a wrong username takes as long as a wrong password
+        user_ok = hmac.compare_digest(given[0].encode("utf-8"), app.config["ADMIN_USERNAME"].encode("utf-8"))
+        password_ok = hmac.compare_digest(given[1].encode("utf-8"), password.encode("utf-8"))
+        if not (user_ok and password_ok):
+            log_event("admin.auth_failed", level=logging.WARNING, path=request.path)
+            return Response(
+                "Authentication required\n", 401,
+                {"WWW-Authenticate": 'Basic realm="Ardur Technology admin", charset="UTF-8"'},
+                mimetype="text/plain",
+            )
+        response = make_response(view(*args, **kwargs))
+        response.headers["Cache-Control"] = "no-store"
+        response.headers["X-Robots-Tag"] = "noindex, nofollow"
+        return response
+
+    return wrapper
+
+
+def submission_filters(args):
+    """Filters for SubmissionStore.page from the query string: service, email, sent=yes|no, from/to=YYYY-MM-DD"""
+    filters = {
+        "service": args.get("service", "").strip(),
+        "email": args.get("email", "").strip(),
+        "email_sent": {"yes": True, "no": False}.get(args.get("sent", "").lower()),
+    }
+    for key, arg in (("date_from", "from"), ("date_to", "to")):
+        value = args.get(arg, "").strip()
+        try:
+            filters[key] = datetime.strptime(value, "%Y-%m-%d") if value else None
+        except ValueError:
+            raise BadRequest(f"'{arg}' must be a date in YYYY-MM-DD format")
+    return filters
+
+
+def submission_page(args):
+    limit = min(max(args.get("limit", ADMIN_PAGE_SIZE, type=int), 1), ADMIN_MAX_PAGE_SIZE)
+    return submission_store.page(submission_filters(args), limit=limit, cursor=args.get("cursor") or None)
+
+
+@app.route("/admin/submissions")
+@admin_required
+def admin_submissions():
+    """Browse contact form submissions, newest first"""
+    rows, next_cursor = submission_page(request.args)
+    query = {key: value for key, value in request.args.items() if key != "cursor" and value}
+    return render_template(
+        "admin_submissions.html",
+        submissions=rows,
+        query=query,
+        next_url=url_for("admin_submissions", **query, cursor=next_cursor) if next_cursor else None,
+        export_urls={fmt: url_for("admin_submissions_export", fmt=fmt, **query) for fmt in SUBMISSION_EXPORT_FORMATS},
+        title="Submissions",
+    )
+
+
+@app.route("/api/admin/submissions")
+@admin_required
+def api_admin_submissions():
+    """Submissions as JSON, one keyset page at a time; pass back ``next`` as ``cursor``"""
+    rows, next_cursor = submission_page(request.args)
+    return jsonify({"submissions": rows, "next": next_cursor})
+
+
+# Spreadsheets evaluate a cell starting with one of these as a formula
+CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def csv_safe(row):
+    """Copy of a row with user-supplied text that a spreadsheet would run as a formula quoted with '"""
+    return {
+        key: f"'{value}" if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES) else value
+        for key, value in row.items()
+    }
+
+
+def export_csv(rows):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=SUBMISSION_EXPORT_COLUMNS, extrasaction="ignore")
+    writer.writeheader()
+    for number, row in enumerate(rows, start=1):
+        writer.writerow(csv_safe(row))
+        # Hand the client a chunk every few hundred rows rather than one per row
+        if number % 200 == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def export_jsonl(rows):
+    for row in rows:
+        yield json.dumps(row) + "\n"
+
+
+SUBMISSION_EXPORT_FORMATS = {
+    "csv": (export_csv, "text/csv"),
+    "jsonl": (export_jsonl, "application/x-ndjson"),
+}
+
+
+@app.route("/admin/submissions/export.<fmt>")
+@admin_required
+def admin_submissions_export(fmt):
+    """Stream every submission matching the filters, so memory use does not grow with the history"""
+    if fmt not in SUBMISSION_EXPORT_FORMATS:
+        abort(404)
+    encode, mimetype = SUBMISSION_EXPORT_FORMATS[fmt]
+    rows = submission_store.iter_filtered(submission_filters(request.args))
+    log_event("admin.export", format=fmt)
+    filename = f"submissions-{datetime.now().strftime('%Y%m%d-%H%M%S')}.{fmt}"
+    return Response(encode(rows), mimetype=mimetype, headers={"Content-Disposition": f'attachment; filename="{filename}"'})
+
+
 # Error handlers
 @app.errorhandler(404)
 def not_found(error):
@@ -633,17 +3781,15 @@ def too_large(error):
     return redirect(request.url)
 
 
-# Template context processors
-@app.template_filter('format_date')
-def format_date(date_string):
-    """Format date string to readable format"""
-    try:
-        date_obj = datetime.strptime(date_string, '%Y-%m-%d')
-        return date_obj.strftime('%B %d, %Y')
-    except:
-        return date_string
+@app.errorhandler(UploadRejected)
+def upload_rejected(error):
+    # The body is parsed (and the resume streamed) by the CSRF check, before the view runs
+    log_event("careers.upload_rejected", reason=error.description)
+    flash(error.description, "error")
+    return redirect(url_for("careers"))
 
 
+# Template context processors
 @app.context_processor
 def inject_globals():
     """Inject global variables into all templates"""
@@ -664,25 +3810,289 @@ def handle_well_known(filename=None):
     """Handle .well-known requests to prevent 404 errors"""
     return Response(status=204)
 
+@app.route('/favicon.ico')
+def favicon():
+    """Serve the favicon from the site root, where browsers request it by default"""
+    return send_static_asset("images/favicon.ico")
+
+@app.route('/metrics')
+def metrics_endpoint():
+    """Prometheus metrics, summed across all worker processes"""
+    token = app.config["METRICS_TOKEN"]
+    if token and request.headers.get("Authorization") != f"Bearer {token}":
+        abort(401)
+    return Response(metrics.render(), mimetype="text/plain; version=0.0.4")
+
 @app.route('/robots.txt')
 def robots_txt():
     """Serve robots.txt"""
-    return "User-agent: *\nAllow: /", 200, {'Content-Type': 'text/plain'}
+    return f"User-agent: *\nAllow: /\nDisallow: /admin/\nSitemap: {app.config['SITE_URL']}/sitemap.xml\n", 200, {'Content-Type': 'text/plain'}
 
 @app.route('/sw.js')
 def service_worker():
     return "self.addEventListener('fetch', function(event) {});", 200, {'Content-Type': 'application/javascript'}
 
+# Sitemap and feed
+app.config["SITE_URL"] = os.environ.get("SITE_URL", "https://ardurtechnology.com").rstrip("/")
+SITEMAP_MAX_URLS = 50000
+# Parameterised routes and the data file whose keys fill in their argument
+SITEMAP_SLUG_SOURCES = {
+    "service_detail": ("services", "service_category"),
+    "service_page": ("services_detail", "service_slug"),
+    "blog_detail": ("blogs", "blog_slug"),
+    "case_study_detail": ("case_studies", "study_slug"),
+}
+# Listing pages whose content comes from a data file
+SITEMAP_PAGE_DATA = {
+    "services": "services",
+    "blogs": "blogs",
+    "case_studies": "case_studies",
+    "leadership": "leadership",
+}
+SITEMAP_EXCLUDE = {"static", "search", "metrics_endpoint", "admin_submissions", "favicon", "robots_txt", "service_worker", "handle_well_known", "sitemap_xml", "sitemap_part", "blog_feed"}
+
+
+class LastModifiedLedger:
+    """Remembers when each content record last changed
+
+    Data files are rewritten whole, so their mtime says nothing about which
+    record changed. The ledger keeps a digest per record and moves its
+    timestamp forward only when that digest changes. A record seen for the
+    first time is dated by its own ``date`` field when it has one.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries = None
+
+    def _load(self):
+        try:
+            with open(self.path, "r") as f:
+                self._entries = json.load(f)
+        except FileNotFoundError:
+            self._entries = {}
+        except (OSError, ValueError) as e:
+            log_event("sitemap.ledger_unreadable", logging.WARNING, path=self.path, error=str(e))
+            self._entries = {}
+
+    def _save(self):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(self._entries, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            log_event("sitemap.ledger_save_failed", logging.WARNING, error=str(e))
+
+    def lastmod(self, name):
+        """Return ``{key: datetime}`` for every record in a data file"""
+        version = content_store.version(name)
+        records = content_store.get(name)
+        if version is None or not isinstance(records, dict):
+            return {}
+        file_time = datetime.fromtimestamp(version[0] / 1_000_000_000, tz=timezone.utc).replace(microsecond=0)
+
+        result = {}
+        dirty = False
+        with self._lock:
+            if self._entries is None:
+                self._load()
+            for key, record in records.items():
+                ledger_key = f"{name}:{key}"
+                digest = record_digest(name, key)
+                entry = self._entries.get(ledger_key)
+                if entry is None or entry[0] != digest:
+                    changed_at = file_time
+                    if entry is None and isinstance(record, dict) and record.get("date"):
+                        try:
+                            changed_at = datetime.strptime(record["date"], "%Y-%m-%d").replace(tzinfo=timezone.utc)
+                        except (TypeError, ValueError):
+                            pass
+                    entry = [digest, changed_at.isoformat()]
+                    self._entries[ledger_key] = entry
+                    dirty = True
+                result[key] = datetime.fromisoformat(entry[1])
+            if dirty:
+                self._save()
+        return result
+
+
+lastmod_ledger = LastModifiedLedger(
+    os.environ.get("LASTMOD_LEDGER_PATH", os.path.join(tempfile.gettempdir(), "content_lastmod.json"))
+)
+
+
+def sitemap_stamp():
+    """Everything the sitemap and feed are generated from; they are rebuilt only when this changes"""
+    names = sorted({name for name, _ in SITEMAP_SLUG_SOURCES.values()} | set(SITEMAP_PAGE_DATA.values()))
+    templates = tuple(
+        template_version(f"{rule.endpoint}.html") for rule in app.url_map.iter_rules()
+        if not rule.arguments and rule.endpoint not in SITEMAP_EXCLUDE
+        and os.path.exists(os.path.join(app.template_folder, f"{rule.endpoint}.html"))
+    )
+    return (tuple(content_store.version(name) for name in names), templates, app.config["SITE_URL"])
+
+
+def sitemap_urls():
+    """Every public GET page as (absolute URL, lastmod), from the URL map plus each slug in the data files"""
+    site = app.config["SITE_URL"]
+    urls = []
+    seen = set()
+    for rule in app.url_map.iter_rules():
+        endpoint = rule.endpoint
+        if endpoint in SITEMAP_EXCLUDE or endpoint.startswith("api_") or "GET" not in rule.methods or endpoint in seen:
+            continue
+        seen.add(endpoint)
+
+        if rule.arguments:
+            if endpoint not in SITEMAP_SLUG_SOURCES:
+                continue
+            name, arg = SITEMAP_SLUG_SOURCES[endpoint]
+            for key, changed in lastmod_ledger.lastmod(name).items():
+                urls.append((site + url_for(endpoint, **{arg: key}), changed))
+            continue
+
+        stamps = []
+        template_path = os.path.join(app.template_folder, f"{endpoint}.html")
+        if os.path.exists(template_path):
+            stamps += [stamp[0] for stamp in template_version(f"{endpoint}.html") if stamp]
+        lastmod = datetime.fromtimestamp(max(stamps) / 1_000_000_000, tz=timezone.utc).replace(microsecond=0) if stamps else None
+        if endpoint in SITEMAP_PAGE_DATA:
+            changes = lastmod_ledger.lastmod(SITEMAP_PAGE_DATA[endpoint]).values()
+            lastmod = max([lastmod, *changes], key=lambda value: value or datetime.min.replace(tzinfo=timezone.utc))
+        urls.append((site + url_for(endpoint), lastmod))
+    return urls
+
+
+def render_urlset(urls):
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>', '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">']
+    for loc, lastmod in urls:
+        lastmod_tag = f"<lastmod>{lastmod.isoformat()}</lastmod>" if lastmod else ""
+        lines.append(f"  <url><loc>{xml_escape(loc)}</loc>{lastmod_tag}</url>")
+    lines.append("</urlset>")
+    return "\n".join(lines).encode("utf-8")
+
+
+def render_sitemap_index(chunks):
+    site = app.config["SITE_URL"]
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>', '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">']
+    for number, chunk in enumerate(chunks, start=1):
+        dates = [lastmod for _, lastmod in chunk if lastmod]
+        lastmod_tag = f"<lastmod>{max(dates).isoformat()}</lastmod>" if dates else ""
+        loc = site + url_for("sitemap_part", number=number)
+        lines.append(f"  <sitemap><loc>{xml_escape(loc)}</loc>{lastmod_tag}</sitemap>")
+    lines.append("</sitemapindex>")
+    return "\n".join(lines).encode("utf-8")
+
+
+def cached_xml(key, build, mimetype="application/xml"):
+    """Serve generated XML from the page cache, rebuilding it only when the content changes"""
+    stamp = sitemap_stamp()
+    entry = page_cache.get(key, stamp)
+    if entry is None:
+        body = build()
+        if body is None:
+            abort(404)
+        entry = page_cache.put(key, stamp, body, mimetype)
+    response = send_cached_page(entry)
+    response.cache_control.public = True
+    response.cache_control.max_age = 3600
+    return response
+
+
+def sitemap_chunks():
+    urls = sitemap_urls()
+    return [urls[i:i + SITEMAP_MAX_URLS] for i in range(0, len(urls), SITEMAP_MAX_URLS)] or [[]]
+
+
 @app.route('/sitemap.xml')
 def sitemap_xml():
-    """Basic sitemap"""
-    return '''<?xml version="1.0" encoding="UTF-8"?>
-<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
-    <url><loc>https://ardurtechnology.com/</loc></url>
-    <url><loc>https://ardurtechnology.com/services</loc></url>
-    <url><loc>https://ardurtechnology.com/about</loc></url>
-    <url><loc>https://ardurtechnology.com/contact</loc></url>
-</urlset>''', 200, {'Content-Type': 'application/xml'}
+    """Sitemap of every page, or a sitemap index once there are more than SITEMAP_MAX_URLS"""
+    def build():
+        chunks = sitemap_chunks()
+        return render_urlset(chunks[0]) if len(chunks) == 1 else render_sitemap_index(chunks)
+
+    return cached_xml(("sitemap", None), build)
+
+
+@app.route('/sitemap-<int:number>.xml')
+def sitemap_part(number):
+    """One part of a split sitemap"""
+    def build():
+        chunks = sitemap_chunks()
+        if len(chunks) == 1 or not 1 <= number <= len(chunks):
+            return None
+        return render_urlset(chunks[number - 1])
+
+    return cached_xml(("sitemap", number), build)
+
+
+@app.route('/feed.xml')
+def blog_feed():
+    """Atom feed of blog posts, newest first"""
+    def build():
+        site = app.config["SITE_URL"]
+        blogs_data = load_blogs()
+        updated = lastmod_ledger.lastmod("blogs")
+        posts = sorted(blogs_data.items(), key=lambda item: item[1].published, reverse=True)
+        feed_updated = max(updated.values(), default=datetime.now(timezone.utc).replace(microsecond=0))
+
+        lines = [
+            '<?xml version="1.0" encoding="UTF-8"?>',
+            '<feed xmlns="http://www.w3.org/2005/Atom">',
+            "  <title>Ardur Technology LLC Blog</title>",
+            "  <subtitle>Industry insights on mortgage services, aviation records and business process management</subtitle>",
+            f'  <link rel="self" href="{xml_escape(site + url_for("blog_feed"))}"/>',
+            f'  <link rel="alternate" type="text/html" href="{xml_escape(site + url_for("blogs"))}"/>',
+            f"  <id>{xml_escape(site + url_for('blogs'))}</id>",
+            f"  <updated>{feed_updated.isoformat()}</updated>",
+        ]
+        for slug, blog in posts:
+            link = site + url_for("blog_detail", blog_slug=slug)
+            lines += [
+                "  <entry>",
+                f"    <title>{xml_escape(blog.title)}</title>",
+                f'    <link rel="alternate" type="text/html" href="{xml_escape(link)}"/>',
+                f"    <id>{xml_escape(link)}</id>",
+                f"    <updated>{updated[slug].isoformat()}</updated>",
+                f"    <published>{blog.published.isoformat()}T00:00:00+00:00</published>",
+                f"    <author><name>{xml_escape(blog.author)}</name></author>",
+            ]
+            for term in dict.fromkeys([blog.category, *blog.tags]):
+                if term:
+                    lines.append(f'    <category term="{xml_escape(term, {chr(34): "&quot;"})}"/>')
+            lines += [f"    <summary>{xml_escape(blog.excerpt)}</summary>", "  </entry>"]
+        lines.append("</feed>")
+        return "\n".join(lines).encode("utf-8")
+
+    return cached_xml(("feed", "blogs"), build, mimetype="application/atom+xml")
+
+def warm_up():
+    """Compile every template and load every data file and derived index ahead of the first request"""
+    started = time.perf_counter()
+    templates = app.jinja_env.list_templates(extensions=["html"])
+    for name in templates:
+        app.jinja_env.get_template(name)
+        template_version(name)
+    data_names = [name[:-5] for name in os.listdir(content_store.data_dir) if name.endswith(".json")]
+    for name in data_names:
+        content_store.get(name)
+    image_manifest.get("images")
+    # Refreshes the search index too
+    related_content.neighbours("")
+    log_event(
+        "app.warmed_up",
+        templates=len(templates),
+        data_files=len(data_names),
+        seconds=round(time.perf_counter() - started, 3),
+    )
+
+
+app.config["WARM_UP"] = env_bool("WARM_UP", False)
+if app.config["WARM_UP"]:
+    threading.Thread(target=warm_up, name="warm-up", daemon=True).start()
 
 # Upload folder is created above using tempfile.gettempdir() for Vercel compatibility
 
@@ -0,0 +1,579 @@
+#!/usr/bin/env python3
+"""
+Ardur Technology LLC - Benchmark Suite
+
+Requests every route in the URL map (expanded with each slug in app/data,
+sample search queries, and the contact and careers form POSTs) and reports
+p50/p95/p99 latency, requests/sec and resident memory per route. There are
+two drivers:
+
+    client    - the Flask test client, in this process, with no network
+    gunicorn  - a local gunicorn server driven by a pool of HTTP client threads
+
+Outgoing mail goes to an SMTP sink running inside the benchmark, and the
+submissions database, spools, metrics and search index are written to a
+throwaway directory, so a run never touches real data or sends real email.
+
+Results can be saved as a JSON baseline (one section per driver). With
+--compare the run fails when a route's p95 latency rises, or its throughput
+drops, by more than --threshold against that baseline. Any route answering
+with a 4xx/5xx also fails the run.
+
+Usage:
+    python benchmarks/bench.py                                    # Test client, every route
+    python benchmarks/bench.py --driver gunicorn --concurrency 16 # Through a local gunicorn
+    python benchmarks/bench.py --only blog                        # Routes whose path contains "blog"
+    python benchmarks/bench.py --save benchmarks/baseline.json    # Record a baseline
+    python benchmarks/bench.py --compare benchmarks/baseline.json --threshold 0.2
+"""
+
+import os
+import sys
+import json
+import atexit
+import base64
+import shutil
+import math
+import time
+import uuid
+import socket
+import argparse
+import platform
+import tempfile
+import threading
+import itertools
+import subprocess
+import socketserver
+from datetime import datetime
+from collections import Counter
+from http.client import HTTPConnection
+from urllib.parse import urlencode
+from concurrent.futures import ThreadPoolExecutor
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, BASE_DIR)
+
+SKIP_ENDPOINTS = {"static", "handle_well_known"}
+# Query strings for GET routes whose output depends on them
+QUERY_STRINGS = {
+    "search": ["q=mortgage", "q=data+analytics"],
+    "api_search": ["q=mort", "q=cloud&limit=5"],
+}
+CONTACT_FORM = {
+    "first_name": "Bench",
+    "last_name": "Mark",
+    "email": "bench@example.com",
+    "phone": "+1 555 0100",
+    "company": "Benchmark Inc",
+    "service": "Data Analytics",
+    "budget": "10k-25k",
+    "message": "Load test submission, please ignore.",
+}
+APPLICATION_FORM = {
+    "name": "Bench Mark",
+    "email": "bench@example.com",
+    "phone": "+1 555 0100",
+    "position": "Data Analyst",
+    "experience": "3-5 years",
+    "cover_letter": "Load test application, please ignore.",
+}
+RESUME = ("resume.pdf", b"%PDF-1.4\n" + b"0" * 64 * 1024, "application/pdf")
+# (form fields, file uploads) posted to each form endpoint
+POST_FORMS = {
+    "contact_form": (CONTACT_FORM, {}),
+    "apply_job": (APPLICATION_FORM, {"resume": RESUME}),
+}
+REQUEST_HEADERS = {"Accept-Encoding": "gzip"}
+# Routes behind HTTP Basic auth, and the credentials the benchmark configures for them
+ADMIN_ENDPOINTS = {"admin_submissions", "api_admin_submissions", "admin_submissions_export"}
+ADMIN_CREDENTIALS = ("bench", "bench-password")
+ADMIN_HEADERS = {"Authorization": "Basic " + base64.b64encode(":".join(ADMIN_CREDENTIALS).encode("utf-8")).decode("ascii")}
+
+
+# ==========================================================================
+# SMTP sink
+# ==========================================================================
+class SmtpSession(socketserver.StreamRequestHandler):
+    """Just enough SMTP for smtplib: every command succeeds and DATA is discarded"""
+
+    def reply(self, line):
+        self.wfile.write(line.encode("ascii") + b"\r\n")
+
+    def handle(self):
+        self.reply("220 bench ESMTP")
+        for line in self.rfile:
+            verb = line[:4].upper()
+            if verb == b"DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                for data in self.rfile:
+                    if data in (b".\r\n", b".\n"):
+                        break
+                self.server.received()
+                self.reply("250 OK")
+            elif verb == b"QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("250 OK")
+
+
+class SmtpSink(socketserver.ThreadingTCPServer):
+    """Local SMTP server that accepts and counts every message"""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), SmtpSession)
+        self.messages = 0
+        self._lock = threading.Lock()
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    def received(self):
+        with self._lock:
+            self.messages += 1
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+
+def isolate_environment(workdir, smtp_port):
+    """Point mail at the sink and every file the app writes at ``workdir``
+
+    Must run before the app is imported; load_dotenv() does not override
+    variables that are already set. Paths without a setting of their own
+    (resume uploads) fall back to the temp dir, which is pointed here too.
+    """
+    os.environ["TMPDIR"] = workdir
+    tempfile.tempdir = workdir
+    os.environ.update({
+        "FLASK_DEBUG": "0",
+        "LOG_LEVEL": "WARNING",
+        "MAIL_SERVER": "127.0.0.1",
+        "MAIL_PORT": str(smtp_port),
+        "MAIL_USE_TLS": "False",
+        "MAIL_USERNAME": "bench@example.com",
+        "MAIL_PASSWORD": "",
+        "MAIL_DEFAULT_SENDER": "bench@example.com",
+        "CONTACT_TO_EMAIL": "inbox@example.com",
+        "AUTO_REPLY_DELAY_SECONDS": "0",
+        "METRICS_TOKEN": "",
+        "ADMIN_USERNAME": ADMIN_CREDENTIALS[0],
+        "ADMIN_PASSWORD": ADMIN_CREDENTIALS[1],
+        # The form routes would otherwise answer 429 after their first few requests
+        "RATELIMIT_ENABLED": "False",
+        "SUBMISSIONS_DB": os.path.join(workdir, "submissions.db"),
+        "MAIL_QUEUE_SPOOL_DIR": os.path.join(workdir, "mail_spool"),
+        "MAIL_DEAD_LETTER_FILE": os.path.join(workdir, "mail_dead_letter.jsonl"),
+        "SCHEDULER_SPOOL_DIR": os.path.join(workdir, "scheduled_jobs"),
+        "METRICS_DIR": os.path.join(workdir, "metrics"),
+        "SEARCH_INDEX_PATH": os.path.join(workdir, "search_index.json"),
+        "LASTMOD_LEDGER_PATH": os.path.join(workdir, "content_lastmod.json"),
+        "DIGEST_DB": os.path.join(workdir, "admin_digest.db"),
+        "RATELIMIT_STORAGE_URL": "sqlite:///" + os.path.join(workdir, "ratelimit.db"),
+        "TEMPLATE_CACHE_DIR": os.path.join(workdir, "template_cache"),
+    })
+
+
+def load_app():
+    from app import app
+
+    # The benchmark posts forms without first fetching a session
+    app.config["WTF_CSRF_ENABLED"] = False
+    return app
+
+
+def wsgi_app():
+    """Gunicorn entry point (``bench:wsgi_app()``), configured like the test client run"""
+    return load_app()
+
+
+# ==========================================================================
+# Targets
+# ==========================================================================
+def encode_form(fields, files):
+    """Request body and headers for a urlencoded or multipart form"""
+    if not files:
+        return urlencode(fields).encode("utf-8"), {"Content-Type": "application/x-www-form-urlencoded"}
+    boundary = uuid.uuid4().hex
+    parts = []
+    for name, value in fields.items():
+        parts.append(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode("utf-8"))
+    for name, (filename, data, mimetype) in files.items():
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+            f"Content-Type: {mimetype}\r\n\r\n".encode("utf-8")
+        )
+        parts.append(data + b"\r\n")
+    parts.append(f"--{boundary}--\r\n".encode("utf-8"))
+    return b"".join(parts), {"Content-Type": f"multipart/form-data; boundary={boundary}"}
+
+
+def route_targets(app, only=None):
+    """Every request the benchmark makes, one per route and slug"""
+    from flask import url_for
+    from app import content_store, SITEMAP_SLUG_SOURCES, SUBMISSION_EXPORT_FORMATS, sitemap_chunks
+
+    targets, skipped = [], []
+
+    def add(endpoint, method, path, body=None, headers=None):
+        if only and only not in path:
+            return
+        targets.append({
+            "name": f"{method} {path}",
+            "endpoint": endpoint,
+            "method": method,
+            "path": path,
+            "body": body,
+            "headers": {**REQUEST_HEADERS, **(headers or {})},
+        })
+
+    with app.test_request_context():
+        for rule in sorted(app.url_map.iter_rules(), key=lambda r: r.rule):
+            endpoint = rule.endpoint
+            if endpoint in SKIP_ENDPOINTS:
+                continue
+            if "POST" in rule.methods and endpoint in POST_FORMS:
+                body, headers = encode_form(*POST_FORMS[endpoint])
+                add(endpoint, "POST", url_for(endpoint), body, headers)
+            if "GET" not in rule.methods:
+                continue
+            headers = ADMIN_HEADERS if endpoint in ADMIN_ENDPOINTS else None
+            if not rule.arguments:
+                path = url_for(endpoint)
+                for query in QUERY_STRINGS.get(endpoint, [None]):
+                    add(endpoint, "GET", f"{path}?{query}" if query else path, headers=headers)
+            elif endpoint == "admin_submissions_export":
+                for fmt in SUBMISSION_EXPORT_FORMATS:
+                    add(endpoint, "GET", url_for(endpoint, fmt=fmt), headers=headers)
+            elif endpoint in SITEMAP_SLUG_SOURCES:
+                name, arg = SITEMAP_SLUG_SOURCES[endpoint]
+                for key in content_store.get(name, {}):
+                    add(endpoint, "GET", url_for(endpoint, **{arg: key}))
+            elif endpoint == "sitemap_part":
+                # A single chunk is served as /sitemap.xml itself, and the parts 404
+                chunks = sitemap_chunks()
+                for number in range(1, len(chunks) + 1 if len(chunks) > 1 else 1):
+                    add(endpoint, "GET", url_for(endpoint, number=number))
+            else:
+                skipped.append(rule.rule)
+    return targets, skipped
+
+
+# ==========================================================================
+# Measurement
+# ==========================================================================
+def rss_bytes(pid):
+    """Resident memory of a process and all of its descendants (Linux only)"""
+    try:
+        page = os.sysconf("SC_PAGE_SIZE")
+        parents = {}
+        for entry in os.listdir("/proc"):
+            if entry.isdigit():
+                try:
+                    with open(f"/proc/{entry}/stat", "rb") as f:
+                        # The command name may contain spaces, so split after its closing paren
+                        parents[int(entry)] = int(f.read().rsplit(b")", 1)[1].split()[1])
+                except (OSError, IndexError, ValueError):
+                    continue
+    except (OSError, ValueError, AttributeError):
+        return None
+    tree, frontier = {pid}, [pid]
+    while frontier:
+        parent = frontier.pop()
+        children = [child for child, ppid in parents.items() if ppid == parent and child not in tree]
+        tree.update(children)
+        frontier += children
+    total = 0
+    for member in tree:
+        try:
+            with open(f"/proc/{member}/statm") as f:
+                total += int(f.read().split()[1]) * page
+        except (OSError, IndexError, ValueError):
+            continue
+    return total
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not values:
+        return None
+    return values[max(0, min(len(values) - 1, math.ceil(pct / 100 * len(values)) - 1))]
+
+
+def summarize(samples, wall, rss):
+    timings = sorted(seconds for seconds, _ in samples)
+    statuses = Counter(status for _, status in samples)
+    ms = lambda value: round(value * 1000, 3) if value is not None else None
+    return {
+        "requests": len(samples),
+        "statuses": {str(status): count for status, count in sorted(statuses.items())},
+        "errors": sum(count for status, count in statuses.items() if status == 0 or status >= 400),
+        "p50_ms": ms(percentile(timings, 50)),
+        "p95_ms": ms(percentile(timings, 95)),
+        "p99_ms": ms(percentile(timings, 99)),
+        "mean_ms": ms(sum(timings) / len(timings)) if timings else None,
+        "rps": round(len(samples) / wall, 1) if wall else None,
+        "rss_mb": round(rss / 1024 / 1024, 1) if rss is not None else None,
+    }
+
+
+# ==========================================================================
+# Drivers
+# ==========================================================================
+def run_client(app, targets, requests, warmup, **_):
+    """Time each target sequentially through the Flask test client"""
+    # No cookies, so flashed messages from the POSTs don't leak into later page renders
+    client = app.test_client(use_cookies=False)
+
+    def send(target):
+        response = client.open(target["path"], method=target["method"], data=target["body"], headers=target["headers"])
+        response.close()
+        return response.status_code
+
+    results = {}
+    for target in targets:
+        for _ in range(warmup):
+            send(target)
+        samples = []
+        started = time.perf_counter()
+        for _ in range(requests):
+            t0 = time.perf_counter()
+            status = send(target)
+            samples.append((time.perf_counter() - t0, status))
+        results[target["name"]] = summarize(samples, time.perf_counter() - started, rss_bytes(os.getpid()))
+        report_line(target["name"], results[target["name"]])
+
+    # Let the mail queue hand everything to the sink before counting
+    from app import mail_queue
+
+    deadline = time.monotonic() + 10
+    while mail_queue.depth() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    return results
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_for_port(port, process, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"gunicorn exited with status {process.returncode}")
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"gunicorn did not start listening on port {port}")
+
+
+def http_send(connection, target):
+    try:
+        connection.request(target["method"], target["path"], body=target["body"], headers=target["headers"])
+        response = connection.getresponse()
+        response.read()
+        if response.will_close:
+            connection.close()
+        return response.status
+    except (OSError, ValueError):
+        connection.close()
+        return 0
+
+
+def run_gunicorn(targets, requests, warmup, concurrency, workers, threads, **_):
+    """Time each target through a local gunicorn, ``concurrency`` requests at a time"""
+    port = free_port()
+    command = [
+        sys.executable, "-m", "gunicorn",
+        "--bind", f"127.0.0.1:{port}",
+        "--workers", str(workers),
+        "--threads", str(threads),
+        "--chdir", BASE_DIR,
+        "--pythonpath", BENCH_DIR,
+        "--log-level", "warning",
+        "bench:wsgi_app()",
+    ]
+    print(f"🚀 Starting gunicorn ({workers} workers × {threads} threads) on port {port}...")
+    server = subprocess.Popen(command, env=os.environ.copy())
+    results = {}
+    try:
+        wait_for_port(port, server)
+        for target in targets:
+            warm = HTTPConnection("127.0.0.1", port, timeout=30)
+            for _ in range(warmup):
+                http_send(warm, target)
+            warm.close()
+
+            issued = itertools.count()
+
+            def load():
+                connection = HTTPConnection("127.0.0.1", port, timeout=30)
+                samples = []
+                while next(issued) < requests:
+                    t0 = time.perf_counter()
+                    status = http_send(connection, target)
+                    samples.append((time.perf_counter() - t0, status))
+                connection.close()
+                return samples
+
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                futures = [pool.submit(load) for _ in range(concurrency)]
+                samples = [sample for future in futures for sample in future.result()]
+            results[target["name"]] = summarize(samples, time.perf_counter() - started, rss_bytes(server.pid))
+            report_line(target["name"], results[target["name"]])
+    finally:
+        # SIGTERM is a graceful stop, so each worker drains its mail queue on the way out
+        server.terminate()
+        try:
+            server.wait(timeout=60)
+        except subprocess.TimeoutExpired:
+            server.kill()
+    return results
+
+
+DRIVERS = {"client": run_client, "gunicorn": run_gunicorn}
+
+
+# ==========================================================================
+# Reporting and baselines
+# ==========================================================================
+def fmt(value, spec):
+    return format(value, spec) if value is not None else "-".rjust(int(spec.split(".")[0]))
+
+
+def report_header():
+    print(f"   {'route':<56} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'RSS MB':>7} {'errors':>6}")
+
+
+def report_line(name, result):
+    print(
+        f"   {name[:56]:<56} {fmt(result['rps'], '8.1f')} {fmt(result['p50_ms'], '8.2f')} "
+        f"{fmt(result['p95_ms'], '8.2f')} {fmt(result['p99_ms'], '8.2f')} {fmt(result['rss_mb'], '7.1f')} "
+        f"{result['errors']:>6}"
+    )
+
+
+def load_baseline(path):
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {"results": {}}
+
+
+def save_baseline(path, driver, meta, results):
+    baseline = load_baseline(path)
+    baseline.setdefault("results", {})[driver] = {"meta": meta, "routes": results}
+    with open(path + ".tmp", "w") as f:
+        json.dump(baseline, f, indent=1, sort_keys=True)
+    os.replace(path + ".tmp", path)
+
+
+def regressions(baseline, results, threshold, noise_ms):
+    """Routes whose p95 or throughput got worse than the baseline by more than ``threshold``"""
+    found = []
+    for name, result in sorted(results.items()):
+        base = baseline.get(name)
+        if not base:
+            continue
+        if (
+            result["p95_ms"] is not None and base.get("p95_ms")
+            and result["p95_ms"] > base["p95_ms"] * (1 + threshold)
+            and result["p95_ms"] - base["p95_ms"] > noise_ms
+        ):
+            found.append(f"{name}: p95 {base['p95_ms']:.2f} → {result['p95_ms']:.2f} ms")
+        if result["rps"] and base.get("rps") and result["rps"] < base["rps"] * (1 - threshold):
+            found.append(f"{name}: throughput {base['rps']:.1f} → {result['rps']:.1f} req/s")
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark every route of the site")
+    parser.add_argument("--driver", choices=sorted(DRIVERS), default="client", help="How requests are made (default: client)")
+    parser.add_argument("--requests", type=int, default=100, help="Timed requests per route (default: 100)")
+    parser.add_argument("--warmup", type=int, default=5, help="Untimed requests per route first (default: 5)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Client threads for the gunicorn driver (default: 8)")
+    parser.add_argument("--workers", type=int, default=2, help="gunicorn worker processes (default: 2)")
+    parser.add_argument("--threads", type=int, default=4, help="Threads per gunicorn worker (default: 4)")
+    parser.add_argument("--only", help="Only routes whose path contains this text")
+    parser.add_argument("--save", metavar="PATH", help="Write the results into a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="Fail when results regress against this baseline")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Allowed regression as a fraction (default: 0.15)")
+    parser.add_argument("--noise-ms", type=float, default=0.5, help="Ignore p95 increases smaller than this (default: 0.5)")
+    args = parser.parse_args()
+
+    sink = SmtpSink().start()
+    workdir = tempfile.mkdtemp(prefix="ardur-bench-")
+    # Registered before the app is imported, so it runs after the app's own exit hooks
+    atexit.register(shutil.rmtree, workdir, ignore_errors=True)
+    isolate_environment(workdir, sink.port)
+    app = load_app()
+
+    targets, skipped = route_targets(app, args.only)
+    if not targets:
+        print("❌ No routes matched")
+        return 1
+    for rule in skipped:
+        print(f"⚠️ Skipping {rule}: no known values for its arguments")
+
+    print(f"⏱  Benchmarking {len(targets)} routes with the {args.driver} driver ({args.requests} requests each)...")
+    report_header()
+    results = DRIVERS[args.driver](
+        app=app,
+        targets=targets,
+        requests=args.requests,
+        warmup=args.warmup,
+        concurrency=args.concurrency,
+        workers=args.workers,
+        threads=args.threads,
+    )
+    print(f"📬 SMTP sink received {sink.messages} messages")
+
+    status = 0
+    failing = [name for name, result in results.items() if result["errors"]]
+    if failing:
+        print(f"❌ {len(failing)} routes returned errors: {', '.join(failing)}")
+        status = 1
+
+    meta = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "requests": args.requests,
+        "concurrency": args.concurrency if args.driver == "gunicorn" else 1,
+        "workers": args.workers if args.driver == "gunicorn" else None,
+        "threads": args.threads if args.driver == "gunicorn" else None,
+    }
+    if args.compare:
+        baseline = load_baseline(args.compare)["results"].get(args.driver)
+        if not baseline:
+            print(f"⚠️ {args.compare} has no {args.driver} results to compare against")
+        else:
+            found = regressions(baseline["routes"], results, args.threshold, args.noise_ms)
+            for line in found:
+                print(f"   • {line}")
+            if found:
+                print(f"❌ {len(found)} regressions beyond {args.threshold:.0%}")
+                status = 1
+            else:
+                print(f"✅ No regressions beyond {args.threshold:.0%}")
+    if args.save:
+        save_baseline(args.save, args.driver, meta, results)
+        print(f"💾 Saved {args.driver} baseline to {args.save}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
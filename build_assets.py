@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Ardur Technology LLC - Static Asset Build
+
+Minifies, fingerprints and precompresses everything under app/static into
+app/static/dist and writes app/static/dist/manifest.json. When the manifest
+exists, url_for('static', ...) in the app points at the fingerprinted copies,
+which are served with a one-year immutable Cache-Control header.
+
+CSS rules whose selectors reference classes or ids that never appear in
+app/templates, the JavaScript sources or app/data are dropped.
+
+Usage:
+    python build_assets.py              # Build into app/static/dist
+    python build_assets.py --no-purge   # Keep every CSS rule
+    python build_assets.py --help       # Show help information
+"""
+
+import os
+import re
+import sys
+import json
+import gzip
+import shutil
+import hashlib
+import argparse
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import rcssmin
+except ImportError:
+    rcssmin = None
+
+try:
+    import rjsmin
+except ImportError:
+    rjsmin = None
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(BASE_DIR, "app", "static")
+TEMPLATES_DIR = os.path.join(BASE_DIR, "app", "templates")
+DATA_DIR = os.path.join(BASE_DIR, "app", "data")
+DIST_NAME = "dist"
+
+# Files that are worth storing .gz / .br siblings for
+COMPRESSIBLE = {".css", ".js", ".svg", ".json", ".txt", ".ico", ".xml", ".html"}
+# Only emit a compressed sibling when it saves at least this fraction
+MIN_SAVING = 0.05
+
+STRING_RE = re.compile(r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')""")
+CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+CSS_URL_RE = re.compile(r"""url\(\s*(['"]?)(?!data:|https?:|//|/)([^'")]+)\1\s*\)""")
+TOKEN_RE = re.compile(r"[A-Za-z_][\w-]*")
+
+
+# ==========================================================================
+# Minification
+# ==========================================================================
+def minify_css(css):
+    """Strip comments and redundant whitespace, leaving string literals untouched"""
+    if rcssmin is not None:
+        return rcssmin.cssmin(css)
+
+    css = CSS_COMMENT_RE.sub("", css)
+    parts = STRING_RE.split(css)
+    for i in range(0, len(parts), 2):
+        chunk = re.sub(r"\s+", " ", parts[i])
+        chunk = re.sub(r"\s*([{};,>])\s*", r"\1", chunk)
+        chunk = re.sub(r":\s+", ":", chunk)
+        parts[i] = chunk.replace(";}", "}")
+    return "".join(parts).strip()
+
+
+def minify_js(js):
+    """Conservative JS minifier: drops comments and indentation but keeps line breaks for ASI"""
+    if rjsmin is not None:
+        return rjsmin.jsmin(js)
+
+    out = []
+    i = 0
+    n = len(js)
+    while i < n:
+        ch = js[i]
+        if ch in "\"'`":
+            # Copy string and template literals verbatim
+            j = i + 1
+            while j < n and js[j] != ch:
+                j += 2 if js[j] == "\\" else 1
+            out.append(js[i:j + 1])
+            i = j + 1
+        elif js.startswith("/*", i):
+            end = js.find("*/", i + 2)
+            i = n if end == -1 else end + 2
+        elif js.startswith("//", i) and (i == 0 or js[i - 1] in " \t\n;{}(),"):
+            end = js.find("\n", i)
+            i = n if end == -1 else end
+        else:
+            out.append(ch)
+            i += 1
+
+    lines = (line.strip() for line in "".join(out).splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+# ==========================================================================
+# Unused CSS removal
+# ==========================================================================
+def collect_used_tokens():
+    """Every identifier-like token in the templates, scripts and content data"""
+    tokens = set()
+    sources = []
+    for root, _, files in os.walk(TEMPLATES_DIR):
+        sources += [os.path.join(root, f) for f in files if f.endswith(".html")]
+    for root, _, files in os.walk(STATIC_DIR):
+        if DIST_NAME in os.path.relpath(root, STATIC_DIR).split(os.sep):
+            continue
+        sources += [os.path.join(root, f) for f in files if f.endswith(".js")]
+    for root, _, files in os.walk(DATA_DIR):
+        sources += [os.path.join(root, f) for f in files if f.endswith(".json")]
+
+    for path in sources:
+        with open(path, "r", encoding="utf-8", errors="ignore") as f:
+            tokens.update(TOKEN_RE.findall(f.read()))
+    return tokens
+
+
+def _split_top_level(text, sep=","):
+    parts, depth, start = [], 0, 0
+    for i, ch in enumerate(text):
+        if ch in "([":
+            depth += 1
+        elif ch in ")]":
+            depth -= 1
+        elif ch == sep and depth == 0:
+            parts.append(text[start:i])
+            start = i + 1
+    parts.append(text[start:])
+    return parts
+
+
+def _selector_used(selector, tokens, prefixes):
+    # Attribute values and negations can't make a selector unreachable
+    selector = re.sub(r"\[[^\]]*\]", "", selector)
+    selector = re.sub(r":not\([^)]*\)", "", selector)
+    names = re.findall(r"[.#]((?:[\w-]|\\.)+)", selector)
+    for name in names:
+        name = name.replace("\\", "")
+        if name in tokens:
+            continue
+        # Templates build some classes dynamically, e.g. class="text-{{ service.color }}"
+        if any(name.startswith(prefix) for prefix in prefixes):
+            continue
+        return False
+    return True
+
+
+def _match_brace(css, open_index):
+    depth = 0
+    for i in range(open_index, len(css)):
+        if css[i] == "{":
+            depth += 1
+        elif css[i] == "}":
+            depth -= 1
+            if depth == 0:
+                return i
+    return len(css) - 1
+
+
+def purge_css(css, tokens):
+    """Drop style rules whose selectors reference classes or ids that are never used"""
+    prefixes = {token for token in tokens if token.endswith("-")}
+    css = CSS_COMMENT_RE.sub("", css)
+    out = []
+    i = 0
+    while i < len(css):
+        brace = css.find("{", i)
+        semi = css.find(";", i)
+        if brace == -1:
+            out.append(css[i:])
+            break
+        if semi != -1 and semi < brace:
+            # Block-less at-rule such as @import or @charset
+            out.append(css[i:semi + 1])
+            i = semi + 1
+            continue
+
+        prelude = css[i:brace].strip()
+        close = _match_brace(css, brace)
+        body = css[brace + 1:close]
+        i = close + 1
+
+        if prelude.startswith(("@media", "@supports", "@layer")):
+            inner = purge_css(body, tokens)
+            if inner.strip():
+                out.append(f"{prelude}{{{inner}}}")
+        elif prelude.startswith("@"):
+            out.append(f"{prelude}{{{body}}}")
+        else:
+            kept = [s.strip() for s in _split_top_level(prelude) if _selector_used(s, tokens, prefixes)]
+            if kept:
+                out.append(f"{','.join(kept)}{{{body}}}")
+    return "\n".join(out)
+
+
+def absolutize_css_urls(css, rel_path):
+    """Rewrite relative url(...) references so the CSS still resolves from dist/"""
+    base = os.path.dirname(rel_path)
+
+    def replace(match):
+        target = os.path.normpath(os.path.join(base, match.group(2))).replace(os.sep, "/")
+        return f"url('/static/{target}')"
+
+    return CSS_URL_RE.sub(replace, css)
+
+
+# ==========================================================================
+# Build
+# ==========================================================================
+def write_if_changed(path, data):
+    """Write a file only when its bytes differ, so unchanged assets keep their mtime"""
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return True
+
+
+def write_precompressed(path, data):
+    """Write .gz and .br siblings when they are meaningfully smaller"""
+    written = []
+    gz = gzip.compress(data, compresslevel=9, mtime=0)
+    if len(gz) < len(data) * (1 - MIN_SAVING):
+        write_if_changed(path + ".gz", gz)
+        written.append("gzip")
+    if brotli is not None:
+        br = brotli.compress(data, quality=11)
+        if len(br) < len(data) * (1 - MIN_SAVING):
+            write_if_changed(path + ".br", br)
+            written.append("br")
+    return written
+
+
+def iter_static_files():
+    for root, dirs, files in os.walk(STATIC_DIR):
+        rel_root = os.path.relpath(root, STATIC_DIR)
+        if rel_root.split(os.sep)[0] == DIST_NAME:
+            dirs[:] = []
+            continue
+        for name in sorted(files):
+            if name.startswith("."):
+                continue
+            yield os.path.normpath(os.path.join(rel_root, name)).replace(os.sep, "/")
+
+
+def build(purge=True):
+    dist_dir = os.path.join(STATIC_DIR, DIST_NAME)
+    tokens = collect_used_tokens() if purge else None
+    manifest = {}
+    produced = set()
+
+    for rel_path in iter_static_files():
+        with open(os.path.join(STATIC_DIR, rel_path), "rb") as f:
+            source = f.read()
+        stem, ext = os.path.splitext(rel_path)
+        data = source
+
+        if ext == ".css":
+            css = absolutize_css_urls(source.decode("utf-8"), rel_path)
+            if purge:
+                css = purge_css(css, tokens)
+            data = minify_css(css).encode("utf-8")
+        elif ext == ".js":
+            data = minify_js(source.decode("utf-8")).encode("utf-8")
+
+        digest = hashlib.sha256(data).hexdigest()
+        built_rel = f"{DIST_NAME}/{stem}.{digest[:12]}{ext}"
+        built_path = os.path.join(STATIC_DIR, built_rel)
+        write_if_changed(built_path, data)
+        produced.add(built_path)
+
+        encodings = []
+        if ext in COMPRESSIBLE:
+            encodings = write_precompressed(built_path, data)
+            produced.update(built_path + (".br" if e == "br" else ".gz") for e in encodings)
+
+        manifest[rel_path] = {
+            "path": built_rel,
+            "sha256": digest,
+            "bytes": len(data),
+            "source_bytes": len(source),
+            "encodings": encodings,
+        }
+        print(f"   • {rel_path:<32} {len(source):>8} → {len(data):>8} bytes  {' '.join(encodings)}")
+
+    # Remove fingerprinted files from earlier builds
+    manifest_path = os.path.join(dist_dir, "manifest.json")
+    for root, _, files in os.walk(dist_dir):
+        for name in files:
+            path = os.path.join(root, name)
+            if path not in produced and path != manifest_path:
+                os.remove(path)
+
+    write_if_changed(manifest_path, json.dumps(manifest, indent=2, sort_keys=True).encode("utf-8"))
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build fingerprinted static assets")
+    parser.add_argument("--no-purge", action="store_true", help="Keep CSS rules even if their selectors look unused")
+    parser.add_argument("--clean", action="store_true", help="Delete app/static/dist and exit")
+    args = parser.parse_args()
+
+    if args.clean:
+        shutil.rmtree(os.path.join(STATIC_DIR, DIST_NAME), ignore_errors=True)
+        print("✅ Removed app/static/dist")
+        return
+
+    if brotli is None:
+        print("⚠ brotli not installed - only .gz variants will be written")
+
+    print("📦 Building static assets...")
+    manifest = build(purge=not args.no_purge)
+    before = sum(entry["source_bytes"] for entry in manifest.values())
+    after = sum(entry["bytes"] for entry in manifest.values())
+    print(f"✅ Built {len(manifest)} assets ({before} → {after} bytes)")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
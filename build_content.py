@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Ardur Technology LLC - Content Build
+
+Builds the data files in app/data from per-record source files, one JSON
+file per record, under app/content. Each collection in COLLECTIONS maps a
+source directory to the data file it produces; a source file's name is its
+slug (app/content/services/title-insurance.json is /service/title-insurance).
+
+Builds are incremental: app/content/.build-manifest.json records the
+SHA-256 of every source file and of each artefact, and only sources whose
+hash changed are parsed and validated against the app's content model; the
+rest are taken from the previous artefact. Two sources claiming the same
+slug fail the build. Artefacts are written as minified JSON, and only when
+their bytes change, so the app's content store (and every ETag and sitemap
+date derived from it) only sees a new version when the content really
+changed.
+
+Usage:
+    python build_content.py           # Rebuild changed sources into app/data
+    python build_content.py --full    # Re-validate every source
+    python build_content.py --check   # Exit 1 if an artefact is out of date (for CI)
+"""
+
+import os
+import sys
+import json
+import hashlib
+import argparse
+
+from app import ContentError, parse_service_page
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CONTENT_DIR = os.path.join(BASE_DIR, "app", "content")
+DATA_DIR = os.path.join(BASE_DIR, "app", "data")
+MANIFEST_PATH = os.path.join(CONTENT_DIR, ".build-manifest.json")
+
+# Data file -> (source directory under app/content, parser validating one record)
+COLLECTIONS = {
+    "services_detail": ("services", parse_service_page),
+}
+
+
+class BuildError(Exception):
+    pass
+
+
+def sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def load_manifest():
+    try:
+        with open(MANIFEST_PATH, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def read_artefact(path):
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def encode_artefact(records):
+    return json.dumps(records, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def build_collection(name, source_name, parse, previous, full=False):
+    """Merge one collection's sources; returns (artefact bytes, manifest entry, changed source names)"""
+    source_dir = os.path.join(CONTENT_DIR, source_name)
+    artefact = read_artefact(os.path.join(DATA_DIR, f"{name}.json"))
+
+    # Unchanged sources are reused from the artefact, but only if it is the one the manifest describes
+    reusable = {}
+    if not full and artefact is not None and previous.get("artefact") == sha256(artefact):
+        reusable = json.loads(artefact)
+    known = previous.get("sources", {}) if reusable else {}
+
+    records, sources, changed, owners = {}, {}, [], {}
+    for filename in sorted(os.listdir(source_dir)):
+        if not filename.endswith(".json"):
+            continue
+        rel = f"{source_name}/{filename}"
+        with open(os.path.join(source_dir, filename), "rb") as f:
+            data = f.read()
+        digest = sha256(data)
+        entry = known.get(rel)
+
+        if entry and entry["sha256"] == digest and entry["slug"] in reusable:
+            slug, record = entry["slug"], reusable[entry["slug"]]
+        else:
+            try:
+                record = json.loads(data)
+            except ValueError as e:
+                raise BuildError(f"{rel}: invalid JSON ({e})")
+            slug = filename[:-len(".json")]
+            if not isinstance(record, dict):
+                raise BuildError(f"{rel}: expected an object, not {type(record).__name__}")
+            if record.setdefault("slug", slug) != slug:
+                raise BuildError(f"{rel}: slug '{record['slug']}' does not match the file name")
+            try:
+                parse(slug, record, rel)
+            except ContentError as e:
+                raise BuildError(str(e))
+            changed.append(rel)
+
+        # Slugs are compared case-insensitively, so a case-insensitive filesystem can't hide a clash
+        clash = owners.get(slug.lower())
+        if clash:
+            raise BuildError(f"{rel}: slug '{slug}' is already used by {clash}")
+        owners[slug.lower()] = rel
+        records[slug] = record
+        sources[rel] = {"sha256": digest, "slug": slug}
+
+    removed = sorted(set(previous.get("sources", {})) - set(sources))
+    encoded = encode_artefact(records)
+    return encoded, {"artefact": sha256(encoded), "sources": sources}, changed + [f"{rel} (removed)" for rel in removed]
+
+
+def build(full=False, check=False):
+    manifest = load_manifest()
+    new_manifest = {}
+    stale = []
+    for name, (source_name, parse) in COLLECTIONS.items():
+        encoded, entry, changed = build_collection(name, source_name, parse, manifest.get(name, {}), full=full)
+        new_manifest[name] = entry
+        path = os.path.join(DATA_DIR, f"{name}.json")
+        up_to_date = read_artefact(path) == encoded
+        label = f"app/data/{name}.json"
+        if check:
+            if not up_to_date:
+                stale.append(label)
+            continue
+
+        for rel in changed:
+            print(f"   • {rel}")
+        if up_to_date:
+            print(f"   • {label} unchanged ({len(entry['sources'])} records)")
+        else:
+            tmp = f"{path}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(encoded)
+            os.replace(tmp, path)
+            print(f"   • {label} written ({len(entry['sources'])} records, {len(encoded)} bytes)")
+
+    if check:
+        if stale:
+            print(f"❌ Out of date: {', '.join(stale)} (run python build_content.py)")
+            return 1
+        print("✅ Content artefacts are up to date")
+        return 0
+
+    with open(MANIFEST_PATH, "w") as f:
+        json.dump(new_manifest, f, indent=1, sort_keys=True)
+        f.write("\n")
+    print("✅ Content built")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build app/data files from per-record content sources")
+    parser.add_argument("--full", action="store_true", help="Re-validate every source, not just the changed ones")
+    parser.add_argument("--check", action="store_true", help="Only report whether the artefacts are up to date")
+    args = parser.parse_args()
+
+    print("🧱 Building content...")
+    try:
+        return build(full=args.full or args.check, check=args.check)
+    except BuildError as e:
+        print(f"❌ {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
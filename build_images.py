@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Ardur Technology LLC - Responsive Image Build
+
+Generates resized WebP (and AVIF, where Pillow supports it) derivatives of
+every JPEG/PNG in app/static/images into app/static/images/derived, plus an
+images.json manifest. The ``responsive_image()`` template helper turns that
+manifest into <picture> markup with srcset/sizes. Also writes a real 16/32px
+favicon.ico from faviconlogo.png.
+
+The output is committed, since the deployment has no image build step:
+rerun this after adding or replacing an image and commit the result.
+
+Requires Pillow (pip install Pillow).
+
+Usage:
+    python build_images.py              # Build all derivatives
+    python build_images.py --force      # Rebuild even if outputs are up to date
+    python build_images.py --help       # Show help information
+"""
+
+import os
+import sys
+import json
+import argparse
+
+try:
+    from PIL import Image, ImageOps, features
+except ImportError:
+    print("❌ Pillow is required: pip install Pillow")
+    sys.exit(1)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(BASE_DIR, "app", "static")
+IMAGES_DIR = os.path.join(STATIC_DIR, "images")
+DERIVED_NAME = "derived"
+DERIVED_DIR = os.path.join(IMAGES_DIR, DERIVED_NAME)
+
+WIDTHS = (320, 480, 640, 960, 1280, 1920)
+SAVE_OPTIONS = {
+    "webp": {"quality": 80, "method": 6},
+    "avif": {"quality": 55},
+}
+SOURCE_EXTENSIONS = (".jpg", ".jpeg", ".png")
+FAVICON_SOURCE = "faviconlogo.png"
+FAVICON_SIZES = [(16, 16), (32, 32)]
+ICO_MAGIC = b"\x00\x00\x01\x00"
+
+
+def available_formats():
+    formats = ["webp"] if features.check("webp") else []
+    try:
+        if features.check("avif"):
+            formats.insert(0, "avif")
+    except ValueError:
+        # Older Pillow releases don't know about the avif feature at all
+        pass
+    return formats
+
+
+def is_stale(output, source, force):
+    return force or not os.path.exists(output) or os.path.getmtime(output) < os.path.getmtime(source)
+
+
+def build_image(rel_path, formats, force):
+    source = os.path.join(STATIC_DIR, rel_path)
+    with Image.open(source) as original:
+        image = ImageOps.exif_transpose(original)
+        width, height = image.size
+        has_alpha = image.mode in ("RGBA", "LA") or "transparency" in image.info
+        image = image.convert("RGBA" if has_alpha else "RGB")
+
+        stem = os.path.splitext(os.path.relpath(source, IMAGES_DIR))[0].replace(os.sep, "-")
+        targets = sorted({w for w in WIDTHS if w < width} | {width})
+        variants = {fmt: [] for fmt in formats}
+        for target in targets:
+            resized = image if target == width else image.resize((target, round(height * target / width)), Image.LANCZOS)
+            for fmt in formats:
+                rel_out = f"images/{DERIVED_NAME}/{stem}-{target}.{fmt}"
+                out = os.path.join(STATIC_DIR, rel_out)
+                if is_stale(out, source, force):
+                    resized.save(out, fmt.upper(), **SAVE_OPTIONS[fmt])
+                variants[fmt].append({"path": rel_out, "width": target, "bytes": os.path.getsize(out)})
+
+    return {"width": width, "height": height, "bytes": os.path.getsize(source), "variants": variants}
+
+
+def build_favicon(force):
+    source = os.path.join(IMAGES_DIR, FAVICON_SOURCE)
+    output = os.path.join(IMAGES_DIR, "favicon.ico")
+    if not os.path.exists(source):
+        return
+    if not is_stale(output, source, force):
+        # An older favicon.ico here was an HTML page saved under the wrong name
+        with open(output, "rb") as f:
+            if f.read(4) == ICO_MAGIC:
+                return
+    with Image.open(source) as image:
+        icon = ImageOps.contain(image.convert("RGBA"), (256, 256))
+        canvas = Image.new("RGBA", (max(icon.size),) * 2, (0, 0, 0, 0))
+        canvas.paste(icon, ((canvas.width - icon.width) // 2, (canvas.height - icon.height) // 2))
+        canvas.save(output, format="ICO", sizes=FAVICON_SIZES)
+    print(f"   • favicon.ico ({os.path.getsize(output)} bytes)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build responsive image derivatives")
+    parser.add_argument("--force", action="store_true", help="Rebuild every derivative")
+    args = parser.parse_args()
+
+    formats = available_formats()
+    if not formats:
+        print("❌ This Pillow build supports neither WebP nor AVIF")
+        return 1
+    os.makedirs(DERIVED_DIR, exist_ok=True)
+
+    print(f"🖼  Building image derivatives ({', '.join(formats)})...")
+    manifest = {}
+    for root, dirs, files in os.walk(IMAGES_DIR):
+        dirs[:] = [d for d in dirs if os.path.join(root, d) != DERIVED_DIR]
+        for name in sorted(files):
+            if not name.lower().endswith(SOURCE_EXTENSIONS):
+                continue
+            rel_path = os.path.relpath(os.path.join(root, name), STATIC_DIR).replace(os.sep, "/")
+            entry = build_image(rel_path, formats, args.force)
+            manifest[rel_path] = entry
+            smallest = min(v["bytes"] for fmt in formats for v in entry["variants"][fmt])
+            print(f"   • {rel_path:<28} {entry['width']}x{entry['height']}  {entry['bytes']:>7} → {smallest:>7} bytes (smallest)")
+
+    build_favicon(args.force)
+
+    manifest_path = os.path.join(DERIVED_DIR, "images.json")
+    with open(manifest_path + ".tmp", "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(manifest_path + ".tmp", manifest_path)
+    print(f"✅ Built derivatives for {len(manifest)} images")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
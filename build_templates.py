@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Ardur Technology LLC - Template Precompile
+
+Compiles every template in app/templates to Jinja bytecode in
+app/template_cache, so a cold start loads compiled templates instead of
+parsing and compiling each one on its first use. It also records which
+templates each one extends or includes, which the page cache would otherwise
+parse every template to find out. The output is committed, since the
+deployment has no build step: rerun this after editing a template, with
+the Python version in runtime.txt; entries compiled by another version
+are ignored (and recompiled) at runtime.
+
+Usage:
+    python build_templates.py           # Compile every template
+    python build_templates.py --check   # Exit 1 if app/template_cache is out of date (for CI)
+    python build_templates.py --clean   # Remove the compiled templates
+    python build_templates.py --help    # Show help information
+"""
+
+import os
+import sys
+import json
+import shutil
+import argparse
+
+from app import app, TemplateBytecodeCache, TEMPLATE_BYTECODE_DIR, TEMPLATE_REFERENCES_FILE, template_references
+
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def compile_templates():
+    """Every file app/template_cache should hold: ``{file name: (bytes, template name, source length)}``"""
+    env = app.jinja_env
+    cache = TemplateBytecodeCache(None)
+    files = {}
+    references = {}
+    for name in env.list_templates(extensions=["html"]):
+        source, filename, _ = env.loader.get_source(env, name)
+        bucket = cache.get_bucket(env, name, filename, source)
+        # A checkout-relative filename keeps the output identical whichever directory it is built in
+        bucket.code = env.compile(source, name, os.path.relpath(filename, BASE_DIR))
+        # Saves the page cache from parsing each template again to find its includes
+        references[name] = [bucket.checksum, template_references(name, source)]
+        files[os.path.basename(cache.cache_file(TEMPLATE_BYTECODE_DIR, bucket.key))] = (bucket.bytecode_to_string(), name, len(source))
+    encoded = json.dumps(references, indent=1, sort_keys=True).encode("utf-8")
+    files[TEMPLATE_REFERENCES_FILE] = (encoded, None, None)
+    return files
+
+
+def read_file(path):
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def build(check=False):
+    files = compile_templates()
+    existing = set(os.listdir(TEMPLATE_BYTECODE_DIR)) if os.path.isdir(TEMPLATE_BYTECODE_DIR) else set()
+    stale = sorted(
+        name for name, (data, _, _) in files.items() if read_file(os.path.join(TEMPLATE_BYTECODE_DIR, name)) != data
+    )
+    unwanted = sorted(existing - set(files))
+
+    if check:
+        if stale or unwanted:
+            print(f"❌ Out of date: {', '.join(stale + unwanted)} (run python build_templates.py)")
+            return 1
+        print(f"✅ Compiled templates in {os.path.relpath(TEMPLATE_BYTECODE_DIR)} are up to date")
+        return 0
+
+    print("🧩 Compiling templates...")
+    os.makedirs(TEMPLATE_BYTECODE_DIR, exist_ok=True)
+    for name, (data, template, source_size) in sorted(files.items(), key=lambda item: item[1][1] or ""):
+        if name in stale:
+            with open(os.path.join(TEMPLATE_BYTECODE_DIR, name), "wb") as f:
+                f.write(data)
+        if template:
+            print(f"   • {template:<28} {source_size:>7} → {len(data):>7} bytes")
+    for name in unwanted:
+        os.remove(os.path.join(TEMPLATE_BYTECODE_DIR, name))
+    print(f"✅ Compiled {len(files) - 1} templates into {os.path.relpath(TEMPLATE_BYTECODE_DIR)}")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompile Jinja templates to bytecode")
+    parser.add_argument("--check", action="store_true", help="Only report whether the compiled templates are up to date")
+    parser.add_argument("--clean", action="store_true", help="Remove the compiled templates")
+    args = parser.parse_args()
+
+    if args.clean:
+        shutil.rmtree(TEMPLATE_BYTECODE_DIR, ignore_errors=True)
+        print(f"🧹 Removed {os.path.relpath(TEMPLATE_BYTECODE_DIR)}")
+        return 0
+    return build(check=args.check)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Ardur Technology LLC - Static Site Export
+
+Pre-renders every GET page (each route in the URL map, expanded with every
+slug in app/data) into a directory of HTML files with .gz/.br siblings,
+copies the fingerprinted static build alongside, and writes a vercel.json
+that serves those files directly. Only the form POSTs (/contact and
+/careers/apply) and search, which depends on the query string, are routed
+to the Python runtime.
+
+Exports are incremental: each page records the templates and data files it
+read while rendering, and is only rendered again when one of those inputs,
+app.py or the asset manifests change.
+
+Usage:
+    python run.py --export public              # Export into ./public
+    python export_site.py public --workers 4   # Same, with an explicit pool size
+    python export_site.py public --full        # Ignore the previous export and render everything
+"""
+
+import os
+import re
+import sys
+import json
+import shutil
+import hashlib
+import argparse
+import mimetypes
+from datetime import date
+from concurrent.futures import ProcessPoolExecutor
+
+from flask import template_rendered, url_for
+
+import build_assets
+from app import app, content_store, template_files, SITEMAP_SLUG_SOURCES, sitemap_chunks
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+MANIFEST_NAME = ".export-manifest.json"
+# Endpoints that must stay on the Python runtime
+DYNAMIC_ENDPOINTS = {
+    "contact_form", "apply_job", "search", "api_search", "metrics_endpoint",
+    "admin_submissions", "api_admin_submissions", "admin_submissions_export",
+}
+SKIP_ENDPOINTS = {"static", "handle_well_known"}
+DYNAMIC_ROUTES = [
+    {"src": "/contact", "methods": ["POST"], "dest": "app.py"},
+    {"src": "/careers/apply", "methods": ["POST"], "dest": "app.py"},
+    {"src": "/search", "dest": "app.py"},
+    {"src": "/api/search", "dest": "app.py"},
+    {"src": "/metrics", "dest": "app.py"},
+    {"src": "/admin/.*", "dest": "app.py"},
+    {"src": "/api/admin/.*", "dest": "app.py"},
+]
+NOT_FOUND_PATH = "/__export_not_found__"
+
+
+def page_paths():
+    """URL path of every page that can be pre-rendered"""
+    paths = []
+    with app.test_request_context():
+        for rule in app.url_map.iter_rules():
+            endpoint = rule.endpoint
+            if endpoint in DYNAMIC_ENDPOINTS or endpoint in SKIP_ENDPOINTS or "GET" not in rule.methods:
+                continue
+            if not rule.arguments:
+                paths.append(url_for(endpoint))
+            elif endpoint in SITEMAP_SLUG_SOURCES:
+                name, arg = SITEMAP_SLUG_SOURCES[endpoint]
+                paths += [url_for(endpoint, **{arg: key}) for key in content_store.get(name, {})]
+            elif endpoint == "sitemap_part":
+                chunks = sitemap_chunks()
+                if len(chunks) > 1:
+                    paths += [url_for(endpoint, number=n) for n in range(1, len(chunks) + 1)]
+    return list(dict.fromkeys(paths))
+
+
+def output_file(path, mimetype):
+    """Relative file an exported URL is written to"""
+    if path == "/":
+        return "index.html"
+    rel = path.strip("/")
+    if mimetype == "text/html":
+        return f"{rel}.html"
+    if os.path.splitext(rel)[1]:
+        return rel
+    return rel + (mimetypes.guess_extension(mimetype) or "")
+
+
+# ==========================================================================
+# Rendering (runs in the worker processes)
+# ==========================================================================
+def init_worker():
+    # Renders must run the views, and workers have no business sending mail
+    app.config["PAGE_CACHE_ENABLED"] = False
+    app.config["START_BACKGROUND_WORKERS"] = False
+
+
+def render_page(path):
+    """Render one path, returning its body and the templates and data files it read"""
+    templates = []
+
+    def record(sender, template, context, **extra):
+        templates.append(template.name)
+
+    client = app.test_client()
+    with template_rendered.connected_to(record, app), content_store.recording() as data_names:
+        response = client.get(path)
+    return {
+        "path": path,
+        "status": response.status_code,
+        "mimetype": response.mimetype,
+        "body": response.get_data(),
+        "templates": sorted(set(templates)),
+        "data": sorted(data_names),
+    }
+
+
+# ==========================================================================
+# Incremental bookkeeping
+# ==========================================================================
+class InputDigests:
+    """Content hashes of the files pages depend on, computed once per export"""
+
+    def __init__(self):
+        self._files = {}
+        self._chains = {}
+
+    def file(self, path):
+        if path not in self._files:
+            try:
+                with open(path, "rb") as f:
+                    self._files[path] = hashlib.sha256(f.read()).hexdigest()
+            except OSError:
+                self._files[path] = None
+        return self._files[path]
+
+    def template_chain(self, name):
+        if name not in self._chains:
+            self._chains[name] = template_files(name)
+        return self._chains[name]
+
+    def global_inputs(self):
+        """Inputs every page shares: the view code, asset manifests and site settings"""
+        static = app.static_folder
+        return [
+            self.file(os.path.join(BASE_DIR, "app.py")),
+            self.file(os.path.join(static, "dist", "manifest.json")),
+            self.file(os.path.join(static, "vendor", "vendor.json")),
+            self.file(os.path.join(static, "images", "derived", "images.json")),
+            app.config["SITE_URL"],
+            # The footer prints the current year
+            str(date.today().year),
+        ]
+
+    def fingerprint(self, page):
+        parts = self.global_inputs() + [page["path"]]
+        for name in page["templates"]:
+            parts += [f"{path}:{self.file(path)}" for path in self.template_chain(name)]
+        parts += [f"{name}:{self.file(content_store.path(name))}" for name in page["data"]]
+        return hashlib.sha256(json.dumps(parts).encode("utf-8")).hexdigest()
+
+
+def load_manifest(out_dir):
+    try:
+        with open(os.path.join(out_dir, MANIFEST_NAME), "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_if_changed(path, data):
+    """Write a file only when its bytes differ, so unchanged pages keep their mtime"""
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+    return True
+
+
+def remove_output(out_dir, rel):
+    for suffix in ("", ".gz", ".br"):
+        try:
+            os.remove(os.path.join(out_dir, rel + suffix))
+        except FileNotFoundError:
+            pass
+
+
+def sync_static(out_dir):
+    """Mirror app/static (including the fingerprinted dist/ build) into <out>/static"""
+    source_root = app.static_folder
+    target_root = os.path.join(out_dir, "static")
+    wanted = set()
+    copied = 0
+    for root, _, files in os.walk(source_root):
+        for name in files:
+            source = os.path.join(root, name)
+            rel = os.path.relpath(source, source_root)
+            target = os.path.join(target_root, rel)
+            wanted.add(target)
+            st = os.stat(source)
+            try:
+                tt = os.stat(target)
+                if tt.st_size == st.st_size and int(tt.st_mtime) == int(st.st_mtime):
+                    continue
+            except FileNotFoundError:
+                pass
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            shutil.copy2(source, target)
+            copied += 1
+    for root, _, files in os.walk(target_root):
+        for name in files:
+            path = os.path.join(root, name)
+            if path not in wanted:
+                os.remove(path)
+    return copied
+
+
+def write_routes(out_dir, pages):
+    """vercel.json that serves the export statically and sends only the dynamic endpoints to app.py"""
+    prefix = os.path.relpath(out_dir, BASE_DIR).replace(os.sep, "/")
+    if prefix.startswith(".."):
+        prefix = os.path.basename(out_dir)
+    routes = list(DYNAMIC_ROUTES)
+    routes.append({
+        "src": "/static/dist/(.*)",
+        "headers": {"Cache-Control": f"public, max-age={365 * 24 * 3600}, immutable"},
+        "dest": f"/{prefix}/static/dist/$1",
+    })
+    routes.append({"src": "/static/(.*)", "dest": f"/{prefix}/static/$1"})
+    for path, entry in sorted(pages.items()):
+        routes.append({"src": f"^{re.escape(path)}$", "dest": f"/{prefix}/{entry['file']}"})
+    routes.append({"src": "/(.*)", "status": 404, "dest": f"/{prefix}/404.html"})
+
+    config = {
+        "version": 2,
+        "builds": [
+            {"src": "app.py", "use": "@vercel/python"},
+            {"src": f"{prefix}/**", "use": "@vercel/static"},
+        ],
+        "routes": routes,
+        "env": {"FLASK_ENV": "production"},
+    }
+    write_if_changed(os.path.join(out_dir, "vercel.json"), (json.dumps(config, indent=2) + "\n").encode("utf-8"))
+
+
+# ==========================================================================
+# Export
+# ==========================================================================
+def export(out_dir, workers=None, full=False):
+    out_dir = os.path.abspath(out_dir)
+    os.makedirs(out_dir, exist_ok=True)
+
+    print("📦 Building static assets...")
+    build_assets.build()
+    copied = sync_static(out_dir)
+    print(f"   • {copied} static files updated")
+
+    previous = {} if full else load_manifest(out_dir)
+    digests = InputDigests()
+    paths = page_paths() + [NOT_FOUND_PATH]
+
+    # A page whose recorded inputs are unchanged (and whose file still exists) is reused as-is
+    pages, pending = {}, []
+    for path in paths:
+        entry = previous.get(path)
+        if (
+            entry
+            and entry["fingerprint"] == digests.fingerprint({"path": path, **entry})
+            and os.path.exists(os.path.join(out_dir, entry["file"]))
+        ):
+            pages[path] = entry
+        else:
+            pending.append(path)
+
+    print(f"🖨  Rendering {len(pending)} of {len(paths)} pages...")
+    failed = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as pool:
+        for result in pool.map(render_page, pending, chunksize=4):
+            path = result["path"]
+            expected = 404 if path == NOT_FOUND_PATH else 200
+            if result["status"] != expected:
+                failed.append(f"{path} ({result['status']})")
+                continue
+            rel = "404.html" if path == NOT_FOUND_PATH else output_file(path, result["mimetype"])
+            target = os.path.join(out_dir, rel)
+            if write_if_changed(target, result["body"]):
+                for suffix in (".gz", ".br"):
+                    if os.path.exists(target + suffix):
+                        os.remove(target + suffix)
+                build_assets.write_precompressed(target, result["body"])
+            entry = {"file": rel, "templates": result["templates"], "data": result["data"]}
+            entry["fingerprint"] = digests.fingerprint({"path": path, **entry})
+            pages[path] = entry
+            print(f"   • {path:<48} → {rel}")
+
+    for path, entry in previous.items():
+        if path not in pages and path not in pending:
+            remove_output(out_dir, entry["file"])
+            print(f"   • removed {entry['file']}")
+
+    routed = {path: entry for path, entry in pages.items() if path != NOT_FOUND_PATH}
+    write_routes(out_dir, routed)
+    with open(os.path.join(out_dir, MANIFEST_NAME), "w") as f:
+        json.dump(pages, f, indent=1, sort_keys=True)
+
+    if failed:
+        print(f"❌ {len(failed)} pages failed to render: {', '.join(failed)}")
+        return 1
+    print(f"✅ Exported {len(routed)} pages to {out_dir}")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-render the site into a static directory")
+    parser.add_argument("out_dir", help="Directory to write the export into")
+    parser.add_argument("--workers", type=int, default=None, help="Render processes (default: CPU count)")
+    parser.add_argument("--full", action="store_true", help="Render every page even if its inputs are unchanged")
+    args = parser.parse_args()
+    return export(args.out_dir, workers=args.workers, full=args.full)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+"""
+Ardur Technology LLC - Gunicorn Configuration
+
+Loaded automatically by ``gunicorn app:app`` from the project directory, and
+used by ``python run.py --prod``. Every setting can be overridden on the
+gunicorn command line or through the environment variables below.
+
+Requests are served by threaded workers: mail is already handed to the
+background MailQueue and resumes stream to disk as they arrive, so the only
+thing a request waits on is its own client, and a slow upload or download
+holds one thread rather than a whole worker process.
+
+On SIGTERM each worker stops accepting connections, finishes its in-flight
+requests, then gives its mail queue up to MAIL_DRAIN_SECONDS to deliver what
+is due before exiting. Anything still undelivered stays spooled and is sent
+by the next worker that starts.
+"""
+
+import os
+import multiprocessing
+
+bind = os.environ.get("GUNICORN_BIND", f"0.0.0.0:{os.environ.get('PORT', '8000')}")
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", "8"))
+
+# Connections
+backlog = 2048
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", "5"))
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", "60"))
+graceful_timeout = int(os.environ.get("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+
+# Recycle workers now and then so a slow leak can't grow without bound
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", "2000"))
+max_requests_jitter = max_requests // 10
+
+# Worker heartbeats go to tmpfs rather than a possibly slow disk
+if os.path.isdir("/dev/shm"):
+    worker_tmp_dir = "/dev/shm"
+
+# The app logs structured JSON itself (and counts requests at /metrics)
+accesslog = None
+errorlog = "-"
+loglevel = os.environ.get("GUNICORN_LOG_LEVEL", "info")
+
+# Must leave the worker enough of graceful_timeout to finish, or the arbiter kills it mid-send
+mail_drain_seconds = float(os.environ.get("MAIL_DRAIN_SECONDS", graceful_timeout * 2 / 3))
+
+
+def worker_exit(server, worker):
+    """Deliver due mail and stop the scheduler before the worker process exits"""
+    import sys
+
+    app_module = sys.modules.get("app")
+    if app_module is None:
+        return
+    pending = app_module.mail_queue.depth()
+    app_module.mail_queue.shutdown(timeout=mail_drain_seconds)
+    app_module.scheduler.shutdown()
+    left = app_module.mail_queue.depth()
+    server.log.info(
+        "Worker %s drained mail queue (%d pending, %d left spooled)", worker.pid, pending, left
+    )
@@ -7,13 +7,17 @@ proper configuration and error handling.
 
 Usage:
     python run.py              # Run in development mode
-    python run.py --prod       # Run in production mode
+    python run.py --prod       # Run under gunicorn (see gunicorn.conf.py)
+    python run.py --export public   # Pre-render the site into ./public
+    python run.py --profile-startup # Report import time and time to first response
     python run.py --help       # Show help information
 """
 
 import os
 import sys
+import json
 import argparse
+import subprocess
 from datetime import datetime
 
 # Add the current directory to the Python path
@@ -51,6 +55,120 @@ def setup_environment():
         print(f"✓ Created uploads directory: {uploads_dir}")
 
 
+# Runs in a fresh interpreter under -X importtime; the marker keeps its result apart from app log lines
+STARTUP_PROBE = """
+import sys, json, time
+started = time.perf_counter()
+from app import app
+imported = time.perf_counter()
+response = app.test_client().get(sys.argv[1])
+responded = time.perf_counter()
+print("STARTUP_PROFILE " + json.dumps({
+    "status": response.status_code,
+    "import_ms": (imported - started) * 1000,
+    "first_response_ms": (responded - imported) * 1000,
+    "modules": sorted(sys.modules),
+}), flush=True)
+"""
+# Dependencies that only the form POSTs need, and so should not be loaded by a plain GET
+LAZY_MODULES = ["flask_mail", "flask_wtf", "wtforms", "email_validator"]
+
+
+def parse_importtime(output):
+    """Rows of ``-X importtime`` output as (self_us, cumulative_us, depth, module)"""
+    rows = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        name = fields[2].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((int(fields[0]), int(fields[1]), depth, name.strip()))
+    return rows
+
+
+def profile_startup(path, top=15):
+    """Import the app in a fresh interpreter and report where the time to its first response goes"""
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", STARTUP_PROBE, path],
+        cwd=base_dir,
+        capture_output=True,
+        text=True,
+    )
+    probe = next((line for line in result.stdout.splitlines() if line.startswith("STARTUP_PROFILE ")), None)
+    if result.returncode != 0 or probe is None:
+        print("❌ Startup probe failed:")
+        print(result.stderr[-4000:])
+        return 1
+    timings = json.loads(probe.split(" ", 1)[1])
+    rows = parse_importtime(result.stderr)
+
+    print("\n" + "=" * 60)
+    print("⏱  STARTUP PROFILE")
+    print("=" * 60)
+    print(f"   {'Import app.py':<28}{timings['import_ms']:8.1f} ms")
+    print(f"   {'First GET ' + path:<28}{timings['first_response_ms']:8.1f} ms  (status {timings['status']})")
+    print(f"   {'Import to first response':<28}{timings['import_ms'] + timings['first_response_ms']:8.1f} ms")
+
+    # importtime lists a module's imports just before the module itself
+    direct, children = [], []
+    for row in rows:
+        if row[2] == 1:
+            children.append(row)
+        elif row[2] == 0:
+            if row[3] == "app":
+                direct = children
+            children = []
+    print("\n📦 Slowest imports made by app.py (cumulative):")
+    for self_us, cumulative_us, depth, name in sorted(direct, key=lambda r: -r[1])[:top]:
+        print(f"   {cumulative_us / 1000:8.1f} ms  {name}")
+
+    print("\n🔍 Slowest modules (own time):")
+    for self_us, cumulative_us, depth, name in sorted(rows, key=lambda r: -r[0])[:top]:
+        print(f"   {self_us / 1000:8.1f} ms  {name}")
+
+    loaded = [name for name in LAZY_MODULES if name in timings["modules"]]
+    if loaded:
+        print(f"\n⚠ Loaded before they were needed: {', '.join(loaded)}")
+    else:
+        print(f"\n✓ Not loaded for this request: {', '.join(LAZY_MODULES)}")
+    print("=" * 60 + "\n")
+    return 0
+
+
+def run_production(host, port, workers=None, threads=None):
+    """Replace this process with gunicorn, configured by gunicorn.conf.py
+
+    Returns only if gunicorn is not installed.
+    """
+    try:
+        import gunicorn  # noqa: F401
+    except ImportError:
+        print("⚠ gunicorn is not installed (pip install gunicorn); using the development server instead.")
+        return
+
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    command = [
+        sys.executable, "-m", "gunicorn",
+        "--config", os.path.join(base_dir, "gunicorn.conf.py"),
+        "--chdir", base_dir,
+        "--bind", f"{host}:{port}",
+    ]
+    if workers:
+        command += ["--workers", str(workers)]
+    if threads:
+        command += ["--threads", str(threads)]
+    command.append("app:app")
+
+    print(f"🚀 Starting gunicorn at http://{host}:{port}")
+    sys.stdout.flush()
+    # exec, so SIGTERM from a process manager reaches gunicorn's arbiter directly
+    os.execv(sys.executable, command)
+
+
 def print_startup_info(host, port, debug_mode):
     """Print startup information"""
     print("\n" + "=" * 60)
@@ -91,12 +209,39 @@ def main():
     parser.add_argument(
         "--debug", action="store_true", help="Force debug mode (overrides --prod)"
     )
+    parser.add_argument(
+        "--export", metavar="DIR", help="Pre-render every page into DIR as a static site and exit"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Render processes for --export, or gunicorn workers for --prod (default: from gunicorn.conf.py)",
+    )
+    parser.add_argument(
+        "--threads", type=int, default=None, help="Threads per gunicorn worker for --prod"
+    )
+    parser.add_argument(
+        "--profile-startup",
+        metavar="PATH",
+        nargs="?",
+        const="/robots.txt",
+        help="Profile importing the app and its first response to PATH (default: /robots.txt), then exit",
+    )
 
     args = parser.parse_args()
 
     # Setup environment
     setup_environment()
 
+    if args.profile_startup:
+        sys.exit(profile_startup(args.profile_startup))
+
+    if args.export:
+        from export_site import export
+
+        sys.exit(export(args.export, workers=args.workers))
+
     # Determine debug mode
     if args.debug:
         debug_mode = True
@@ -121,6 +266,9 @@ def main():
     else:
         app.config["DEBUG"] = True
 
+    if args.prod and not args.debug:
+        run_production(args.host, args.port, workers=args.workers, threads=args.threads)
+
     # Print startup information
     print_startup_info(args.host, args.port, debug_mode)
 
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Ardur Technology LLC - Third-Party Asset Vendoring
+
+Pulls pinned versions of the front-end libraries used by base.html into
+app/static/vendor and writes app/static/vendor/vendor.json. While that file
+exists, base.html loads every vendored asset from our own origin through the
+``vendor_url()`` template helper. Without it, the pinned CDN URLs are used.
+
+The deployment runs this script as its build command (vercel.json), so the
+vendored files are produced at build time rather than committed.
+
+Downloads go through a local cache (~/.cache/ardur-vendor by default), so
+repeated runs and --offline builds don't touch the network. The script
+subsets the assets to what the templates actually use:
+
+  * Lucide   - only the icons referenced by data-lucide="..." are bundled
+  * Font Awesome - only the .fa-* icon rules in use are kept, and with
+    fontTools installed the webfonts are cut down to those glyphs
+  * Inter / IBM Plex Sans - with fontTools installed, the webfonts are cut
+    down to the characters that appear in the templates and app/data
+
+Usage:
+    python vendor_assets.py              # Fetch (via cache) and vendor everything
+    python vendor_assets.py --offline    # Only use the local cache
+    python vendor_assets.py --help       # Show help information
+"""
+
+import os
+import re
+import sys
+import json
+import string
+import hashlib
+import argparse
+import urllib.request
+
+try:
+    from fontTools import subset as font_subset
+except ImportError:
+    font_subset = None
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+TEMPLATES_DIR = os.path.join(BASE_DIR, "app", "templates")
+DATA_DIR = os.path.join(BASE_DIR, "app", "data")
+STATIC_DIR = os.path.join(BASE_DIR, "app", "static")
+VENDOR_DIR = os.path.join(STATIC_DIR, "vendor")
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "ardur-vendor")
+
+# Pinned versions - bump deliberately and re-run this script
+ALPINE_VERSION = "3.13.3"
+AOS_VERSION = "3.0.0-beta.6"
+LUCIDE_VERSION = "0.294.0"
+FONT_AWESOME_VERSION = "6.5.1"
+INTER_VERSION = "5.0.16"
+IBM_PLEX_SANS_VERSION = "5.0.18"
+FONT_WEIGHTS = (300, 400, 500, 600, 700)
+
+JSDELIVR = "https://cdn.jsdelivr.net/npm"
+CDNJS = "https://cdnjs.cloudflare.com/ajax/libs"
+
+# Older icon names used in the templates that Lucide has since renamed
+LUCIDE_ALIASES = {
+    "home": "house",
+    "grid": "grid-3x3",
+    "check-circle": "circle-check-big",
+    "alert-circle": "circle-alert",
+    "help-circle": "circle-help",
+}
+
+FA_WEBFONTS = ("fa-solid-900", "fa-regular-400", "fa-brands-400", "fa-v4compatibility")
+
+
+# ==========================================================================
+# Fetching
+# ==========================================================================
+class Fetcher:
+    """Downloads URLs into a content cache keyed by URL"""
+
+    def __init__(self, cache_dir, offline=False):
+        self.cache_dir = cache_dir
+        self.offline = offline
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def get(self, url):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        path = os.path.join(self.cache_dir, key)
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                return f.read()
+        if self.offline:
+            raise FileNotFoundError(f"{url} is not in the local cache ({self.cache_dir})")
+
+        request = urllib.request.Request(url, headers={"User-Agent": "ardur-vendor/1.0"})
+        with urllib.request.urlopen(request, timeout=30) as response:
+            data = response.read()
+        with open(path + ".tmp", "wb") as f:
+            f.write(data)
+        os.replace(path + ".tmp", path)
+        return data
+
+
+def write_file(rel_path, data):
+    path = os.path.join(VENDOR_DIR, rel_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data if isinstance(data, bytes) else data.encode("utf-8"))
+    return f"vendor/{rel_path}"
+
+
+# ==========================================================================
+# Usage scanning
+# ==========================================================================
+def read_sources(extensions, *directories):
+    for directory in directories:
+        for root, _, files in os.walk(directory):
+            for name in files:
+                if name.endswith(extensions):
+                    with open(os.path.join(root, name), "r", encoding="utf-8", errors="ignore") as f:
+                        yield f.read()
+
+
+def used_lucide_icons():
+    """Icon names from data-lucide attributes, including quoted names inside Jinja expressions"""
+    icons = set()
+    for text in read_sources((".html", ".js", ".json"), TEMPLATES_DIR, DATA_DIR, os.path.join(STATIC_DIR, "js")):
+        for value in re.findall(r'data-lucide\s*=\s*"([^"]*)"', text):
+            if "{{" in value:
+                icons.update(re.findall(r"'([a-z0-9-]+)'", value))
+            else:
+                icons.add(value.strip())
+    return sorted(icon for icon in icons if icon)
+
+
+def used_font_awesome_icons():
+    icons = set()
+    for text in read_sources((".html", ".js", ".json"), TEMPLATES_DIR, DATA_DIR, os.path.join(STATIC_DIR, "js")):
+        icons.update(re.findall(r"\bfa-([a-z0-9-]+)", text))
+    return icons
+
+
+def used_characters():
+    chars = set(string.printable)
+    for text in read_sources((".html", ".json"), TEMPLATES_DIR, DATA_DIR):
+        chars.update(text)
+    return {ord(ch) for ch in chars if not ch.isspace() or ch == " "}
+
+
+def subset_font(data, unicodes):
+    """Cut a font down to the given code points (requires fontTools and brotli for WOFF2)"""
+    if font_subset is None:
+        return data
+    import io
+
+    options = font_subset.Options()
+    options.flavor = "woff2"
+    options.layout_features = ["*"]
+    font = font_subset.load_font(io.BytesIO(data), options)
+    subsetter = font_subset.Subsetter(options)
+    subsetter.populate(unicodes=unicodes)
+    subsetter.subset(font)
+    out = io.BytesIO()
+    font_subset.save_font(font, out, options)
+    return out.getvalue()
+
+
+# ==========================================================================
+# Packages
+# ==========================================================================
+def vendor_plain(fetcher):
+    entries = {}
+    for name, url, rel_path, version in (
+        ("alpine", f"{JSDELIVR}/alpinejs@{ALPINE_VERSION}/dist/cdn.min.js", "alpine/cdn.min.js", ALPINE_VERSION),
+        ("aos_css", f"{JSDELIVR}/aos@{AOS_VERSION}/dist/aos.css", "aos/aos.css", AOS_VERSION),
+        ("aos_js", f"{JSDELIVR}/aos@{AOS_VERSION}/dist/aos.js", "aos/aos.js", AOS_VERSION),
+    ):
+        data = fetcher.get(url)
+        entries[name] = {"path": write_file(rel_path, data), "version": version, "source": url}
+    return entries
+
+
+def vendor_lucide(fetcher):
+    icons = {}
+    for name in used_lucide_icons():
+        svg = None
+        for candidate in (name, LUCIDE_ALIASES.get(name)):
+            if not candidate:
+                continue
+            try:
+                svg = fetcher.get(f"{JSDELIVR}/lucide-static@{LUCIDE_VERSION}/icons/{candidate}.svg").decode("utf-8")
+                break
+            except Exception:
+                continue
+        if svg is None:
+            print(f"   ⚠ Lucide icon not found: {name}")
+            continue
+        body = re.sub(r"^.*?<svg[^>]*>|</svg>\s*$", "", svg.strip(), flags=re.S)
+        icons[name] = re.sub(r"\s+", " ", body).strip()
+
+    # Drop-in replacement for the parts of the lucide UMD API that base.html uses
+    script = (
+        "(function(){var icons=" + json.dumps(icons, separators=(",", ":")) + ";"
+        "var NS='http://www.w3.org/2000/svg';"
+        "var DEFAULTS={xmlns:NS,width:'24',height:'24',viewBox:'0 0 24 24',fill:'none',stroke:'currentColor',"
+        "'stroke-width':'2','stroke-linecap':'round','stroke-linejoin':'round'};"
+        "function createIcons(){document.querySelectorAll('[data-lucide]').forEach(function(el){"
+        "var name=el.getAttribute('data-lucide');var body=icons[name];if(!body)return;"
+        "var svg=document.createElementNS(NS,'svg');Object.keys(DEFAULTS).forEach(function(k){svg.setAttribute(k,DEFAULTS[k]);});"
+        "Array.prototype.forEach.call(el.attributes,function(a){if(a.name!=='data-lucide'&&a.name!=='class')svg.setAttribute(a.name,a.value);});"
+        "svg.setAttribute('class',('lucide lucide-'+name+' '+(el.getAttribute('class')||'')).trim());"
+        "svg.innerHTML=body;el.parentNode.replaceChild(svg,el);});}"
+        "window.lucide={createIcons:createIcons,icons:icons};})();\n"
+    )
+    print(f"   • lucide: {len(icons)} icons")
+    return {"lucide": {"path": write_file("lucide/lucide.min.js", script), "version": LUCIDE_VERSION, "icons": sorted(icons)}}
+
+
+def vendor_font_awesome(fetcher):
+    base = f"{CDNJS}/font-awesome/{FONT_AWESOME_VERSION}"
+    css = fetcher.get(f"{base}/css/all.min.css").decode("utf-8")
+    used = used_font_awesome_icons()
+
+    kept_codepoints = set()
+
+    def filter_rule(match):
+        selectors, body = match.group(1), match.group(2)
+        names = re.findall(r"\.fa-([a-z0-9-]+)::?before", selectors)
+        if not names or len(names) != len(selectors.split(",")):
+            return match.group(0)
+        kept = [s for s, n in zip(selectors.split(","), names) if n in used]
+        if not kept:
+            return ""
+        for codepoint in re.findall(r'content:\s*"\\([0-9a-f]+)"', body):
+            kept_codepoints.add(int(codepoint, 16))
+        return f"{','.join(kept)}{{{body}}}"
+
+    icon_css = re.sub(r"([^{}]+)\{([^{}]*)\}", filter_rule, css)
+    # Every supported browser takes WOFF2, so drop the TrueType fallbacks
+    icon_css = re.sub(r',url\(\.\./webfonts/[^)]+\.ttf\) format\("truetype"\)', "", icon_css)
+
+    for font in FA_WEBFONTS:
+        data = fetcher.get(f"{base}/webfonts/{font}.woff2")
+        write_file(f"fontawesome/webfonts/{font}.woff2", subset_font(data, kept_codepoints) if kept_codepoints else data)
+
+    print(f"   • font-awesome: {len(css)} → {len(icon_css)} bytes of CSS, {len(kept_codepoints)} glyphs")
+    return {
+        "fontawesome": {
+            "path": write_file("fontawesome/css/all.min.css", icon_css),
+            "version": FONT_AWESOME_VERSION,
+            "icons": sorted(used),
+        }
+    }
+
+
+def vendor_fonts(fetcher):
+    unicodes = used_characters()
+    faces = []
+    for family, package, version in (
+        ("IBM Plex Sans", "ibm-plex-sans", IBM_PLEX_SANS_VERSION),
+        ("Inter", "inter", INTER_VERSION),
+    ):
+        for weight in FONT_WEIGHTS:
+            filename = f"{package}-latin-{weight}-normal.woff2"
+            data = fetcher.get(f"{JSDELIVR}/@fontsource/{package}@{version}/files/{filename}")
+            write_file(f"fonts/{filename}", subset_font(data, unicodes))
+            faces.append(
+                "@font-face{"
+                f"font-family:'{family}';font-style:normal;font-weight:{weight};font-display:swap;"
+                f"src:url(./{filename}) format('woff2')"
+                "}"
+            )
+    print(f"   • fonts: {len(faces)} faces" + ("" if font_subset else " (fontTools not installed, not subset)"))
+    return {"fonts": {"path": write_file("fonts/fonts.css", "\n".join(faces) + "\n"), "version": f"inter@{INTER_VERSION}, ibm-plex-sans@{IBM_PLEX_SANS_VERSION}"}}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vendor pinned third-party front-end assets into app/static/vendor")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help=f"Download cache (default: {DEFAULT_CACHE_DIR})")
+    parser.add_argument("--offline", action="store_true", help="Fail instead of downloading anything missing from the cache")
+    args = parser.parse_args()
+
+    fetcher = Fetcher(args.cache_dir, offline=args.offline)
+    if font_subset is None:
+        print("⚠ fontTools not installed - fonts will be vendored without subsetting")
+
+    print("📦 Vendoring front-end dependencies...")
+    try:
+        manifest = {}
+        manifest.update(vendor_plain(fetcher))
+        manifest.update(vendor_lucide(fetcher))
+        manifest.update(vendor_font_awesome(fetcher))
+        manifest.update(vendor_fonts(fetcher))
+    except Exception as e:
+        print(f"❌ Vendoring failed: {e}")
+        return 1
+
+    for entry in manifest.values():
+        with open(os.path.join(STATIC_DIR, entry["path"]), "rb") as f:
+            entry["sha256"] = hashlib.sha256(f.read()).hexdigest()
+
+    manifest_path = os.path.join(VENDOR_DIR, "vendor.json")
+    with open(manifest_path + ".tmp", "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(manifest_path + ".tmp", manifest_path)
+    print(f"✅ Vendored {len(manifest)} assets into app/static/vendor")
+    print("   Run `python build_assets.py` to fingerprint and precompress them")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())